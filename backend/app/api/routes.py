@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request
 from fastapi.responses import JSONResponse
+from sqlalchemy import select, func, text
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import logging
@@ -8,19 +10,23 @@ import psutil
 import asyncio
 
 from ..database import get_db, SessionLocal
+from ..database_async import get_async_db
 from ..models import Article, Bucket, Label, TrackedToken, UserWallet, ManagedWallet, UserDeposit, UserBalance
-from ..services.mcp_client import MCPClient
-from ..services.feature_extractor import FeatureExtractor
-from ..services.ml_engine import MLEngine
-from ..services.thesis_composer import ThesisComposer
-from ..services.aggregator import NarrativeAggregator
-from ..services.gecko_client import GeckoTerminalClient
 from ..services.deposit_service import DepositService
 from ..services.portfolio_service import PortfolioService
 from ..services.scheduler_service import get_trading_scheduler
+from ..services import (
+    get_mcp_client,
+    get_feature_extractor,
+    get_ml_engine,
+    get_thesis_composer,
+    get_aggregator,
+    get_gecko_client
+)
 from ..services.waitlist_service import WaitlistService
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from ..utils.resilience import _circuit_breakers, health_checker, fallback_cache
+from ..utils.tasks import on_bg_task_done
 
 logger = logging.getLogger(__name__)
 
@@ -121,9 +127,15 @@ class ThesisResponse(BaseModel):
     evidence: List[dict]
 
 # Deposit System Models
+def _lower_hex(value: Any) -> Any:
+    """Canonical lowercase form for addresses and tx hashes"""
+    return value.lower() if isinstance(value, str) else value
+
 class DepositAddressRequest(BaseModel):
     user_wallet_address: str
     chain_id: int
+    
+    _normalize = field_validator("user_wallet_address", mode="before")(_lower_hex)
 
 class DepositAddressResponse(BaseModel):
     user_wallet_address: str
@@ -139,10 +151,14 @@ class RecordDepositRequest(BaseModel):
     token_symbol: str
     amount: str
     tx_hash: str
+    
+    _normalize = field_validator("user_wallet_address", "tx_hash", mode="before")(_lower_hex)
 
 class DepositStatusUpdate(BaseModel):
     tx_hash: str
     status: str  # "pending", "confirmed", "failed"
+    
+    _normalize = field_validator("tx_hash", mode="before")(_lower_hex)
 
 class UserBalanceResponse(BaseModel):
     chain_id: int
@@ -162,25 +178,6 @@ class ManagedWalletResponse(BaseModel):
     smart_account: Optional[str] = None
     eoa_address: Optional[str] = None
 
-# Initialize services (these will be injected by FastAPI lifespan)
-async def get_mcp_client():
-    return MCPClient()
-
-async def get_feature_extractor():
-    return FeatureExtractor()
-
-async def get_ml_engine():
-    return MLEngine()
-
-async def get_thesis_composer():
-    return ThesisComposer()
-
-async def get_aggregator():
-    return NarrativeAggregator()
-
-async def get_gecko_client():
-    return GeckoTerminalClient()
-
 @router.get("/ingestion-status/{token}")
 async def get_ingestion_status(token: str):
     """Get the current ingestion status for a token"""
@@ -267,9 +264,9 @@ async def process_token_ingestion(token: str, hours_back: int, max_articles: int
         update_ingestion_status(token, "searching", "Searching for articles...", progress=10)
         
         # Initialize services
-        mcp_client = MCPClient()
-        feature_extractor = FeatureExtractor()
-        aggregator = NarrativeAggregator()
+        mcp_client = get_mcp_client()
+        feature_extractor = get_feature_extractor()
+        aggregator = get_aggregator()
         
         # 1. Get articles from MCP server
         logger.info(f"Fetching articles for {token}")
@@ -297,24 +294,28 @@ async def process_token_ingestion(token: str, hours_back: int, max_articles: int
         db = SessionLocal()
         
         try:
-            for i, scraped_article in enumerate(scraped_articles, 1):
+            # Skip articles already stored (one query for the whole feed)
+            urls = [scraped_article.url for scraped_article in scraped_articles]
+            existing_urls = {
+                url for (url,) in db.query(Article.url).filter(Article.url.in_(urls)).all()
+            }
+            new_articles = []
+            for scraped_article in scraped_articles:
+                if scraped_article.url in existing_urls:
+                    logger.debug(f"Article already exists: {scraped_article.url}")
+                else:
+                    existing_urls.add(scraped_article.url)
+                    new_articles.append(scraped_article)
+            
+            # Extract features for all new articles concurrently
+            logger.debug(f"Extracting features for {len(new_articles)} articles")
+            features_list = await feature_extractor.extract_features_batch(
+                [scraped_article.__dict__ for scraped_article in new_articles], token
+            )
+            
+            for i, (scraped_article, features) in enumerate(zip(new_articles, features_list), 1):
                 try:
-                    logger.debug(f"Processing article {i}/{len(scraped_articles)}: {scraped_article.url}")
-                    
-                    # Check if article already exists
-                    existing_article = db.query(Article).filter(
-                        Article.url == scraped_article.url
-                    ).first()
-                    
-                    if existing_article:
-                        logger.debug(f"Article already exists: {scraped_article.url}")
-                        continue
-                    
-                    # Extract features
-                    logger.debug(f"Extracting features for article: {scraped_article.title[:50]}...")
-                    features = await feature_extractor.extract_features(
-                        scraped_article.__dict__, token
-                    )
+                    logger.debug(f"Processing article {i}/{len(new_articles)}: {scraped_article.url}")
                     logger.debug(f"Features extracted: sentiment={features.sentiment_score:.3f}, final_weight={features.final_weight:.3f}")
                     
                     # Parse published date
@@ -416,7 +417,7 @@ async def get_token_features(
 ):
     """Get aggregated features for a token"""
     try:
-        aggregator = NarrativeAggregator()
+        aggregator = get_aggregator()
         
         if bucket_ts:
             # Get specific bucket
@@ -465,7 +466,7 @@ async def predict_token_movement(
             raise HTTPException(status_code=404, detail="No data found for token")
         
         # Initialize ML engine and make prediction
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         bucket_data = latest_bucket.to_dict()
         prediction = await ml_engine.predict(bucket_data)
         
@@ -500,12 +501,12 @@ async def get_trading_thesis(
             raise HTTPException(status_code=404, detail="No data found for token")
         
         # Get ML prediction
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         bucket_data = latest_bucket.to_dict()
         prediction = await ml_engine.predict(bucket_data)
         
         # Compose thesis
-        thesis_composer = ThesisComposer()
+        thesis_composer = get_thesis_composer()
         thesis = await thesis_composer.compose_thesis(
             token, bucket_data, prediction, window_minutes
         )
@@ -619,11 +620,11 @@ async def get_dashboard_data(
         
         # Get latest prediction and thesis
         latest_bucket = buckets[-1]
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         bucket_data = latest_bucket.to_dict()
         prediction = await ml_engine.predict(bucket_data)
         
-        thesis_composer = ThesisComposer()
+        thesis_composer = get_thesis_composer()
         thesis = await thesis_composer.compose_thesis(
             token, bucket_data, prediction, 60
         )
@@ -680,7 +681,7 @@ async def train_model(
             }
         else:
             # Train synchronously (for testing)
-            ml_engine = MLEngine()
+            ml_engine = get_ml_engine()
             model_version = await ml_engine.train_model(model_type)
             
             if model_version:
@@ -699,7 +700,7 @@ async def train_model(
 async def train_model_background(model_type: str):
     """Background task for model training"""
     try:
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         model_version = await ml_engine.train_model(model_type)
         
         if model_version:
@@ -714,7 +715,7 @@ async def train_model_background(model_type: str):
 async def get_model_status():
     """Get comprehensive model status and training information"""
     try:
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         status = await ml_engine.get_model_status()
         
         return {
@@ -741,7 +742,7 @@ async def trigger_auto_training(
             }
         else:
             # Train synchronously (for testing)
-            ml_engine = MLEngine()
+            ml_engine = get_ml_engine()
             model_version = await ml_engine._auto_train_model()
             
             if model_version:
@@ -765,7 +766,7 @@ async def trigger_auto_training(
 async def check_and_retrain():
     """Check if model needs retraining and retrain if necessary"""
     try:
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         retrain_success = await ml_engine.check_and_retrain_model()
         
         return {
@@ -781,7 +782,7 @@ async def check_and_retrain():
 async def auto_train_model_background():
     """Background task for automatic model training"""
     try:
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         model_version = await ml_engine._auto_train_model()
         
         if model_version:
@@ -793,29 +794,30 @@ async def auto_train_model_background():
         logger.error(f"Error in background auto-training: {e}")
 
 @router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check(request: Request):
     """Detailed health check with service status"""
     try:
-        # Check database
-        db_status = "connected"
-        try:
-            db.execute("SELECT 1")
-        except Exception as e:
-            db_status = f"error: {e}"
+        async with request.app.state.async_session() as session:
+            # Check database
+            db_status = "connected"
+            try:
+                await session.execute(text("SELECT 1"))
+            except Exception as e:
+                db_status = f"error: {e}"
+            
+            # Get some basic stats
+            total_articles = await session.scalar(select(func.count()).select_from(Article))
+            total_buckets = await session.scalar(select(func.count()).select_from(Bucket))
+            total_labels = await session.scalar(select(func.count()).select_from(Label))
         
         # Check MCP client
-        mcp_client = MCPClient()
+        mcp_client = get_mcp_client()
         mcp_status = "ready" if await mcp_client.health_check() else "unavailable"
         
         # Check model status
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         model_status = "ready" if ml_engine.current_model else "no_model"
         
-        # Get some basic stats
-        total_articles = db.query(Article).count()
-        total_buckets = db.query(Bucket).count()
-        total_labels = db.query(Label).count()
-        
         return {
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
@@ -840,7 +842,7 @@ async def detailed_health_check(db: Session = Depends(get_db)):
 async def get_token_price(token: str):
     """Get current price and market data for a token"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         price_data = await gecko_client.get_token_price_data(token)
         
         if not price_data:
@@ -860,7 +862,7 @@ async def get_token_ohlcv(
 ):
     """Get OHLCV data for a token"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         
         # Get token pool info first
         price_data = await gecko_client.get_token_price_data(token)
@@ -910,7 +912,7 @@ async def auto_submit_feedback(
 async def process_auto_feedback(token: str, hours_back: int):
     """Background task to automatically calculate and submit feedback"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         db = SessionLocal()
         
         try:
@@ -969,7 +971,7 @@ async def process_auto_feedback(token: str, hours_back: int):
 async def get_networks():
     """Get available blockchain networks from GeckoTerminal"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         networks = await gecko_client.get_networks()
         
         return {
@@ -989,7 +991,7 @@ async def add_token_mapping(
 ):
     """Add new token pool mapping for price data"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         await gecko_client.add_token_mapping(token, network, pools)
         
         return {
@@ -1141,7 +1143,7 @@ async def get_service_health():
         services = {}
         
         # Check MCP server
-        mcp_client = MCPClient()
+        mcp_client = get_mcp_client()
         mcp_healthy = await mcp_client.health_check()
         
         services["mcp_server"] = {
@@ -1151,7 +1153,7 @@ async def get_service_health():
         }
         
         # Check GeckoTerminal
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         try:
             networks = await gecko_client.get_networks()
             gecko_healthy = len(networks) > 0
@@ -1188,9 +1190,9 @@ async def debug_ingest_sync(
         logger.info(f"Starting synchronous debug ingestion for {token}")
         
         # Initialize services
-        mcp_client = MCPClient()
-        feature_extractor = FeatureExtractor()
-        aggregator = NarrativeAggregator()
+        mcp_client = get_mcp_client()
+        feature_extractor = get_feature_extractor()
+        aggregator = get_aggregator()
         
         # 1. Test MCP connection
         logger.info("Testing MCP server connectivity...")
@@ -1284,7 +1286,7 @@ async def debug_ingest_sync(
 async def test_mcp_connection():
     """Test MCP server connection and response times"""
     try:
-        mcp_client = MCPClient()
+        mcp_client = get_mcp_client()
         
         # Test search
         start_time = datetime.utcnow()
@@ -1326,7 +1328,7 @@ async def test_mcp_connection():
 async def validate_token(token: str):
     """Validate if a token exists and can be analyzed"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         validation_result = await gecko_client.validate_token(token)
         
         return {
@@ -1342,7 +1344,7 @@ async def validate_token(token: str):
 async def discover_token(token: str):
     """Automatically discover token information across networks"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         discovery_result = await gecko_client.discover_token_automatically(token)
         
         if discovery_result:
@@ -1374,7 +1376,7 @@ async def search_tokens(
 ):
     """Search for tokens across multiple networks"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         
         # Parse networks parameter
         network_list = None
@@ -1399,7 +1401,7 @@ async def search_tokens(
 async def get_supported_networks():
     """Get list of all supported networks"""
     try:
-        gecko_client = GeckoTerminalClient()
+        gecko_client = get_gecko_client()
         networks = await gecko_client.get_supported_networks()
         
         return {
@@ -1427,7 +1429,7 @@ async def get_universal_dashboard_data(
         # First validate/discover the token if auto_discover is enabled
         validation = None
         if auto_discover:
-            gecko_client = GeckoTerminalClient()
+            gecko_client = get_gecko_client()
             validation = await gecko_client.validate_token(token)
             
             if not validation.get("valid", False):
@@ -1484,11 +1486,11 @@ async def get_universal_dashboard_data(
         
         # Continue with normal dashboard logic
         latest_bucket = buckets[-1]
-        ml_engine = MLEngine()
+        ml_engine = get_ml_engine()
         bucket_data = latest_bucket.to_dict()
         prediction = await ml_engine.predict(bucket_data)
         
-        thesis_composer = ThesisComposer()
+        thesis_composer = get_thesis_composer()
         thesis = await thesis_composer.compose_thesis(
             token_upper, bucket_data, prediction, 60
         )
@@ -1643,7 +1645,7 @@ async def comprehensive_health_check():
         
         # MCP Client health
         try:
-            mcp_client = MCPClient()
+            mcp_client = get_mcp_client()
             mcp_healthy = await mcp_client.health_check()
             health_status["checks"]["mcp_client"] = {
                 "status": "healthy" if mcp_healthy else "unhealthy",
@@ -1657,7 +1659,7 @@ async def comprehensive_health_check():
         
         # ML Engine health
         try:
-            ml_engine = MLEngine()
+            ml_engine = get_ml_engine()
             model_status = await ml_engine.get_model_status()
             health_status["checks"]["ml_engine"] = {
                 "status": "healthy" if model_status.get("has_active_model", False) else "warning",
@@ -2056,7 +2058,7 @@ async def get_managed_wallets():
         raise HTTPException(status_code=500, detail="Failed to fetch managed wallet addresses")
 
 @router.post("/deposit/address", response_model=DepositAddressResponse)
-async def get_deposit_address(request: DepositAddressRequest, db: Session = Depends(get_db)):
+async def get_deposit_address(request: DepositAddressRequest, db: AsyncSession = Depends(get_async_db)):
     """Get deposit address for a user on a specific chain"""
     try:
         # Validate chain is supported
@@ -2084,7 +2086,7 @@ async def get_deposit_address(request: DepositAddressRequest, db: Session = Depe
             )
         
         # Get deposit address
-        deposit_address = deposit_service.get_user_deposit_address(
+        deposit_address = await deposit_service.get_user_deposit_address(
             db, request.user_wallet_address, request.chain_id
         )
         
@@ -2113,7 +2115,7 @@ async def get_deposit_address(request: DepositAddressRequest, db: Session = Depe
         raise HTTPException(status_code=500, detail="Failed to get deposit address")
 
 @router.post("/deposit/record")
-async def record_deposit(request: RecordDepositRequest, db: Session = Depends(get_db)):
+async def record_deposit(request: RecordDepositRequest, db: AsyncSession = Depends(get_async_db)):
     """Record a user deposit transaction"""
     try:
         # Validate inputs
@@ -2124,7 +2126,7 @@ async def record_deposit(request: RecordDepositRequest, db: Session = Depends(ge
             raise HTTPException(status_code=400, detail="Amount must be positive")
         
         # Record the deposit
-        deposit = deposit_service.record_deposit(
+        deposit = await deposit_service.record_deposit(
             db,
             request.user_wallet_address,
             request.chain_id,
@@ -2148,7 +2150,7 @@ async def record_deposit(request: RecordDepositRequest, db: Session = Depends(ge
         raise HTTPException(status_code=500, detail="Failed to record deposit")
 
 @router.put("/deposit/status")
-async def update_deposit_status(request: DepositStatusUpdate, db: Session = Depends(get_db)):
+async def update_deposit_status(request: DepositStatusUpdate, db: AsyncSession = Depends(get_async_db)):
     """Update the status of a deposit transaction"""
     try:
         if request.status not in ["pending", "confirmed", "failed"]:
@@ -2156,7 +2158,7 @@ async def update_deposit_status(request: DepositStatusUpdate, db: Session = Depe
         
         confirmed_at = datetime.utcnow() if request.status == "confirmed" else None
         
-        deposit = deposit_service.update_deposit_status(
+        deposit = await deposit_service.update_deposit_status(
             db, request.tx_hash, request.status, confirmed_at
         )
         
@@ -2177,10 +2179,10 @@ async def update_deposit_status(request: DepositStatusUpdate, db: Session = Depe
         raise HTTPException(status_code=500, detail="Failed to update deposit status")
 
 @router.get("/deposit/balances/{user_wallet_address}", response_model=List[UserBalanceResponse])
-async def get_user_balances(user_wallet_address: str, db: Session = Depends(get_db)):
+async def get_user_balances(user_wallet_address: str, db: AsyncSession = Depends(get_async_db)):
     """Get all balances for a user across all chains"""
     try:
-        balances = deposit_service.get_user_balances(db, user_wallet_address)
+        balances = await deposit_service.get_user_balances(db, user_wallet_address.lower())
         
         return [
             UserBalanceResponse(
@@ -2198,7 +2200,7 @@ async def get_user_balances(user_wallet_address: str, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail="Failed to get user balances")
 
 @router.post("/deposit/initialize")
-async def initialize_managed_wallets(db: Session = Depends(get_db)):
+async def initialize_managed_wallets(db: AsyncSession = Depends(get_async_db)):
     """Initialize managed wallet records in database (admin endpoint)"""
     try:
         await deposit_service.initialize_managed_wallets_async(db)
@@ -2217,8 +2219,10 @@ async def deposit_system_health():
     """Check health of deposit system and microservice connectivity"""
     try:
         # Test microservice connectivity
-        chains = await deposit_service.get_supported_chains()
-        addresses = await deposit_service.get_managed_wallet_addresses()
+        chains, addresses = await asyncio.gather(
+            deposit_service.get_supported_chains(),
+            deposit_service.get_managed_wallet_addresses()
+        )
         
         # Count successful address fetches
         successful_chains = len([addr for addr in addresses if "error" not in addr])
@@ -2461,7 +2465,7 @@ async def get_scheduler_status():
         raise HTTPException(status_code=500, detail=f"Failed to get scheduler status: {str(e)}")
 
 @router.post("/scheduler/start")
-async def start_scheduler():
+async def start_scheduler(request: Request):
     """Start the automated trading scheduler"""
     try:
         scheduler = get_trading_scheduler()
@@ -2473,9 +2477,11 @@ async def start_scheduler():
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        # Start scheduler in background task
-        import asyncio
-        asyncio.create_task(scheduler.start_scheduler())
+        # Start scheduler in a background task tracked by the app lifespan
+        task = asyncio.create_task(scheduler.start_scheduler(), name="trading_scheduler")
+        bg_tasks = request.app.state.bg_tasks
+        bg_tasks.add(task)
+        task.add_done_callback(on_bg_task_done(bg_tasks))
         
         return {
             "status": "started",
@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 import logging
 from pathlib import Path
 
@@ -25,7 +25,10 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for models
-Base = declarative_base()
+class Base(AsyncAttrs, DeclarativeBase):
+    # Fetch server-generated defaults (created_at etc.) with the INSERT itself
+    # instead of a follow-up SELECT on first access
+    __mapper_args__ = {"eager_defaults": True}
 
 # Dependency to get DB session
 def get_db():
@@ -187,28 +190,30 @@ def get_engine():
     """Get database engine"""
     return engine
 
-def seed_managed_wallets():
+async def seed_managed_wallets():
     """Initialize managed wallet records from 0xgasless microservice"""
+    from sqlalchemy import select, func
+    from .database_async import async_session_maker
     from .services.deposit_service import DepositService
+    from .models import ManagedWallet
     
-    db = SessionLocal()
-    try:
-        # Check if managed wallets already exist
-        from .models import ManagedWallet
-        existing_count = db.query(ManagedWallet).count()
-        
-        if existing_count > 0:
-            logger.info(f"Managed wallets already initialized ({existing_count} wallets found)")
-            return
-        
-        # Initialize managed wallets from microservice
-        deposit_service = DepositService()
-        deposit_service.initialize_managed_wallets(db)
-        
-        logger.info("Successfully initialized managed wallets from microservice")
-        
-    except Exception as e:
-        logger.error(f"Error initializing managed wallets: {e}")
-        # Don't raise exception - this is optional during startup
-    finally:
-        db.close()
\ No newline at end of file
+    deposit_service = DepositService()
+    async with async_session_maker() as db:
+        try:
+            # Check if managed wallets already exist
+            existing_count = await db.scalar(select(func.count()).select_from(ManagedWallet))
+            
+            if existing_count > 0:
+                logger.info(f"Managed wallets already initialized ({existing_count} wallets found)")
+                return
+            
+            # Initialize managed wallets from microservice
+            await deposit_service.initialize_managed_wallets_async(db)
+            
+            logger.info("Successfully initialized managed wallets from microservice")
+            
+        except Exception as e:
+            logger.error(f"Error initializing managed wallets: {e}")
+            # Don't raise exception - this is optional during startup
+        finally:
+            await deposit_service.aclose()
\ No newline at end of file
@@ -0,0 +1,42 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import logging
+import os
+
+from .database import DATABASE_URL
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+# Async driver URL: ASYNC_DATABASE_URL (e.g. postgresql+asyncpg://...) or the
+# local SQLite file through aiosqlite
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+)
+
+if ASYNC_DATABASE_URL.startswith("sqlite"):
+    # SQLite uses a per-file connection pool; pool sizing does not apply
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
+else:
+    # pool_recycle stays below typical server idle timeouts, so the
+    # SELECT 1 issued by pool_pre_ping on every checkout is unnecessary
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=False,
+        pool_recycle=1800,
+        echo=False
+    )
+
+# Create async session factory
+async_session_maker = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+# Dependency to get async DB session
+async def get_async_db():
+    async with async_session_maker() as session:
+        yield session
@@ -1,22 +1,36 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import json
 import logging
 import os
 from datetime import datetime
 from dotenv import load_dotenv
+from pydantic import BaseModel
+from typing import Any, Dict
 
 from .database import engine
+from .database_async import async_engine, async_session_maker
 from .models import Base
 from .database import seed_default_tokens, seed_managed_wallets
-from .services.mcp_client import MCPClient
-from .services.feature_extractor import FeatureExtractor
-from .services.ml_engine import MLEngine
-from .services.thesis_composer import ThesisComposer
-from .services.gecko_client import GeckoTerminalClient
+from .services import (
+    get_mcp_client,
+    get_feature_extractor,
+    get_ml_engine,
+    get_thesis_composer,
+    get_gecko_client
+)
 from .services.scheduler_service import start_trading_scheduler, stop_trading_scheduler
-from .api.routes import router
-from .utils.monitoring import setup_monitoring, metrics_collector, performance_monitor
+from .api.routes import router, deposit_service
+from .utils.monitoring import setup_monitoring, metrics_collector, performance_monitor, alert_manager
+from .utils.resilience import health_checker
+from .utils.tasks import on_bg_task_done
+from .utils.timefmt import utc_now_iso
 
 # Load environment variables from .env file
 load_dotenv()
@@ -40,28 +54,29 @@ async def lifespan(app: FastAPI):
     
     # Initialize managed wallets (optional - fails gracefully if microservice unavailable)
     try:
-        seed_managed_wallets()
+        await seed_managed_wallets()
     except Exception as e:
         logger.warning(f"Could not initialize managed wallets: {e}")
         logger.info("Managed wallets can be initialized later via /api/v1/deposit/initialize")
     
+    # Async session factory for handlers that query without blocking the loop
+    app.state.async_session = async_session_maker
+    
     # Initialize services
-    app.state.mcp_client = MCPClient()
-    app.state.feature_extractor = FeatureExtractor()
-    app.state.ml_engine = MLEngine()
-    app.state.thesis_composer = ThesisComposer()
-    app.state.gecko_client = GeckoTerminalClient()
+    app.state.mcp_client = get_mcp_client()
+    app.state.feature_extractor = get_feature_extractor()
+    app.state.ml_engine = get_ml_engine()
+    app.state.thesis_composer = get_thesis_composer()
+    app.state.gecko_client = get_gecko_client()
+    
+    # Background tasks are held here so they are not garbage-collected mid-run
+    app.state.bg_tasks = set()
     
     # Start automated trading scheduler
-    import asyncio
     logger.info("Starting automated trading scheduler...")
-    try:
-        # Start scheduler as background task
-        asyncio.create_task(start_trading_scheduler())
-        logger.info("Automated trading scheduler started successfully")
-    except Exception as e:
-        logger.warning(f"Failed to start trading scheduler: {e}")
-        logger.info("Trading scheduler can be started manually via /api/v1/scheduler/start")
+    task = asyncio.create_task(start_trading_scheduler(), name="trading_scheduler")
+    app.state.bg_tasks.add(task)
+    task.add_done_callback(on_bg_task_done(app.state.bg_tasks))
     
     logger.info("NTM Engine initialized successfully")
     yield
@@ -70,9 +85,17 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down NTM Engine...")
     try:
         await stop_trading_scheduler()
-        logger.info("Trading scheduler stopped")
     except Exception as e:
         logger.warning(f"Error stopping trading scheduler: {e}")
+    
+    for task in app.state.bg_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.bg_tasks, return_exceptions=True)
+    
+    await deposit_service.aclose()
+    await get_gecko_client().aclose()
+    await get_mcp_client().aclose()
+    await async_engine.dispose()
 
 app = FastAPI(
     title="Narrative→Thesis Model (NTM) Trading Engine",
@@ -85,20 +108,26 @@ app = FastAPI(
 app = setup_monitoring(app)
 
 # Configure CORS with environment variable support
-allowed_origins = [
-    "http://localhost:3000", 
-    "http://localhost:5173",  # React dev servers
-    "https://agentchain.trade",  # Production frontend
-    "https://www.agentchain.trade",  # Production frontend with www
-    "https://app.agentchain.trade",  # Alternative subdomain
-]
-
-# Add custom origins from environment variable
-custom_origins = os.getenv('CORS_ORIGINS', '').split(',')
-for origin in custom_origins:
-    if origin.strip():
-        allowed_origins.append(origin.strip())
+@lru_cache(maxsize=1)
+def get_allowed_origins() -> tuple:
+    """Default origins plus any from CORS_ORIGINS, parsed once per process"""
+    allowed_origins = [
+        "http://localhost:3000", 
+        "http://localhost:5173",  # React dev servers
+        "https://agentchain.trade",  # Production frontend
+        "https://www.agentchain.trade",  # Production frontend with www
+        "https://app.agentchain.trade",  # Alternative subdomain
+    ]
+    
+    # Add custom origins from environment variable
+    custom_origins = os.getenv('CORS_ORIGINS', '').split(',')
+    for origin in custom_origins:
+        if origin.strip():
+            allowed_origins.append(origin.strip())
+    
+    return tuple(allowed_origins)
 
+allowed_origins = list(get_allowed_origins())
 logger.info(f"CORS allowed origins: {allowed_origins}")
 
 app.add_middleware(
@@ -112,29 +141,54 @@ app.add_middleware(
 # Include API routes
 app.include_router(router, prefix="/api/v1")
 
-@app.get("/")
-async def root():
-    return {
-        "message": "Narrative→Thesis Model (NTM) Trading Engine",
-        "version": "1.0.0",
-        "status": "running",
-        "timestamp": datetime.utcnow().isoformat()
-    }
-
-@app.get("/health")
+# Root payload is constant apart from the timestamp, so serialize it once
+ROOT_JSON_TEMPLATE = json.dumps({
+    "message": "Narrative→Thesis Model (NTM) Trading Engine",
+    "version": "1.0.0",
+    "status": "running",
+    "timestamp": "%s"
+}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+async def root(request: Request) -> Response:
+    return Response(ROOT_JSON_TEMPLATE % utc_now_iso().encode("ascii"), media_type="application/json")
+
+# Plain Starlette route: skips FastAPI dependency resolution and response validation
+app.router.routes.append(Route("/", root, methods=["GET"]))
+
+# Response models for the operational endpoints
+class HealthResponse(BaseModel):
+    status: str
+    timestamp: str
+    services: Dict[str, str]
+    stats: Dict[str, int]
+
+class MetricsResponse(BaseModel):
+    metrics: Dict[str, Any]
+    active_requests: Dict[str, Any]
+    timestamp: str
+
+class AlertsResponse(BaseModel):
+    active_alerts: Dict[str, Any]
+    timestamp: str
+
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
-    from .utils.resilience import health_checker
+    # Check external services concurrently
+    mcp_ok, gecko_ok = await asyncio.gather(
+        health_checker.check_http_service("mcp_server", "https://scraper.agentchain.trade//health", timeout=5),
+        health_checker.check_http_service("gecko", "https://api.geckoterminal.com/api/v2/networks", timeout=5)
+    )
     
-    # Check external services
+    # Database and ML engine are local and always reported ready, so overall
+    # health depends only on the external checks
+    overall_health = mcp_ok and gecko_ok
     services = {
         "database": "connected",
-        "mcp_client": "ready" if await health_checker.check_http_service("mcp_server", "https://scraper.agentchain.trade//health", timeout=5) else "unhealthy",
+        "mcp_client": "ready" if mcp_ok else "unhealthy",
         "ml_engine": "ready",
-        "gecko_terminal": "ready" if await health_checker.check_http_service("gecko", "https://api.geckoterminal.com/api/v2/networks", timeout=5) else "unhealthy"
+        "gecko_terminal": "ready" if gecko_ok else "unhealthy"
     }
     
-    overall_health = all(status == "ready" or status == "connected" for status in services.values())
-    
     return {
         "status": "healthy" if overall_health else "degraded",
         "timestamp": datetime.utcnow().isoformat(),
@@ -146,7 +200,7 @@ async def health_check():
         }
     }
 
-@app.get("/metrics")
+@app.get("/metrics", response_model=MetricsResponse, response_model_exclude_none=True)
 async def get_metrics():
     """Get application metrics summary"""
     return {
@@ -155,10 +209,9 @@ async def get_metrics():
         "timestamp": datetime.utcnow().isoformat()
     }
 
-@app.get("/alerts")
+@app.get("/alerts", response_model=AlertsResponse)
 async def get_alerts():
     """Get active alerts"""
-    from .utils.monitoring import alert_manager
     return {
         "active_alerts": alert_manager.get_active_alerts(),
         "timestamp": datetime.utcnow().isoformat()
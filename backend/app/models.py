@@ -1,33 +1,56 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, JSON, Boolean, UniqueConstraint, ForeignKey, DECIMAL
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import Integer, String, DateTime, Text, Float, JSON, Boolean, UniqueConstraint, ForeignKey, DECIMAL, Index, desc
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, backref
 from sqlalchemy.sql import func
 from .database import Base
 from datetime import datetime
-from typing import Dict, Any, Optional
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+
+class DecimalString(TypeDecorator):
+    """Exact token amount: stored as a decimal string, read back as Decimal
+    
+    SQLite keeps NUMERIC as a float, so text is the only exact storage on the
+    default database; it also matches the String(78) columns already deployed.
+    """
+    impl = String(78)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return format(Decimal(str(value)), "f")
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else Decimal(value)
 
 class Article(Base):
     __tablename__ = "articles"
     
-    id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(20), index=True, nullable=False)
-    url = Column(Text, unique=True, nullable=False)
-    site_name = Column(String(100), nullable=True)
-    title = Column(Text, nullable=True)
-    published_at = Column(DateTime, nullable=True)
-    clean_content = Column(Text, nullable=True)
-    word_count = Column(Integer, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    token: Mapped[str] = mapped_column(String(20), index=True, nullable=False)
+    url: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
+    site_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    title: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    clean_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    word_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # Feature extraction results
-    event_probs = Column(JSON, nullable=True)  # {"listing": 0.8, "partnership": 0.2, ...}
-    sentiment_score = Column(Float, nullable=True)  # [-1, 1]
-    source_trust = Column(Float, nullable=True)     # [0.5, 1.2]
-    recency_decay = Column(Float, nullable=True)    # exp(-Δt/τ)
-    novelty_score = Column(Float, nullable=True)    # [0, 1]
-    proof_bonus = Column(Float, nullable=True)      # 1.0 or 1.1
-    final_weight = Column(Float, nullable=True)     # computed weight
+    event_probs: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # {"listing": 0.8, "partnership": 0.2, ...}
+    sentiment_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # [-1, 1]
+    source_trust: Mapped[Optional[float]] = mapped_column(Float, nullable=True)     # [0.5, 1.2]
+    recency_decay: Mapped[Optional[float]] = mapped_column(Float, nullable=True)    # exp(-Δt/τ)
+    novelty_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)    # [0, 1]
+    proof_bonus: Mapped[Optional[float]] = mapped_column(Float, nullable=True)      # 1.0 or 1.1
+    final_weight: Mapped[Optional[float]] = mapped_column(Float, nullable=True)     # computed weight
+    
+    bucket_ts: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
-    bucket_ts = Column(DateTime, nullable=True, index=True)
-    created_at = Column(DateTime, default=func.now())
+    # Bucket aggregation reads articles by token and bucket
+    __table_args__ = (Index('ix_article_token_bucket', 'token', 'bucket_ts'),)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -53,36 +76,38 @@ class Article(Base):
 class Bucket(Base):
     __tablename__ = "buckets"
     
-    id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(20), index=True, nullable=False)
-    bucket_ts = Column(DateTime, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    token: Mapped[str] = mapped_column(String(20), index=True, nullable=False)
+    bucket_ts: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
     
     # Narrative metrics
-    narrative_heat = Column(Float, nullable=True)      # NHS_t = Σ contrib_i
-    positive_heat = Column(Float, nullable=True)       # contributions with sentiment > 0
-    negative_heat = Column(Float, nullable=True)       # contributions with sentiment < 0
-    consensus = Column(Float, nullable=True)           # fraction matching plurality event
-    hype_velocity = Column(Float, nullable=True)       # (NHS_t - NHS_{t-1}) / max(|NHS_{t-1}|, 1)
-    risk_polarity = Column(Float, nullable=True)       # negative if hack/regulatory dominates
+    narrative_heat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)      # NHS_t = Σ contrib_i
+    positive_heat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)       # contributions with sentiment > 0
+    negative_heat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)       # contributions with sentiment < 0
+    consensus: Mapped[Optional[float]] = mapped_column(Float, nullable=True)           # fraction matching plurality event
+    hype_velocity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)       # (NHS_t - NHS_{t-1}) / max(|NHS_{t-1}|, 1)
+    risk_polarity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)       # negative if hack/regulatory dominates
     
     # Event distribution
-    event_distribution = Column(JSON, nullable=True)  # {"listing": 0.6, "partnership": 0.4, ...}
-    top_event = Column(String(50), nullable=True)
+    event_distribution: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # {"listing": 0.6, "partnership": 0.4, ...}
+    top_event: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     # Optional on-chain features
-    liquidity_usd = Column(Float, nullable=True)
-    trades_count_change = Column(Integer, nullable=True)
-    spread_estimate = Column(Float, nullable=True)
+    liquidity_usd: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    trades_count_change: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    spread_estimate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
     # Additional metadata
-    article_count = Column(Integer, nullable=True)
-    avg_source_trust = Column(Float, nullable=True)
-    avg_novelty = Column(Float, nullable=True)
+    article_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    avg_source_trust: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_novelty: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
-    created_at = Column(DateTime, default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     __table_args__ = (
         UniqueConstraint('token', 'bucket_ts', name='_token_bucket_uc'),
+        # Covers the previous-bucket heat lookup (token, bucket_ts < X ORDER BY bucket_ts DESC)
+        Index('ix_bucket_token_ts_nh', 'token', desc('bucket_ts'), 'narrative_heat'),
     )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -110,12 +135,12 @@ class Bucket(Base):
 class Label(Base):
     __tablename__ = "labels"
     
-    id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(20), index=True, nullable=False)
-    bucket_ts = Column(DateTime, index=True, nullable=False)
-    forward_return_60m = Column(Float, nullable=True)  # actual price change
-    label_binary = Column(Integer, nullable=True)      # 1 if return > threshold, 0 else
-    created_at = Column(DateTime, default=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    token: Mapped[str] = mapped_column(String(20), index=True, nullable=False)
+    bucket_ts: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
+    forward_return_60m: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # actual price change
+    label_binary: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)      # 1 if return > threshold, 0 else
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     __table_args__ = (
         UniqueConstraint('token', 'bucket_ts', name='_token_bucket_label_uc'),
@@ -134,14 +159,14 @@ class Label(Base):
 class MLModel(Base):
     __tablename__ = "models"
     
-    id = Column(Integer, primary_key=True, index=True)
-    version = Column(String(20), unique=True, nullable=False)
-    model_type = Column(String(50), nullable=False)   # "logistic", "lightgbm"
-    parameters = Column(JSON, nullable=True)
-    feature_names = Column(JSON, nullable=True)
-    performance_metrics = Column(JSON, nullable=True)
-    is_active = Column(Boolean, default=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    version: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    model_type: Mapped[str] = mapped_column(String(50), nullable=False)   # "logistic", "lightgbm"
+    parameters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    feature_names: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    performance_metrics: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -158,20 +183,20 @@ class MLModel(Base):
 class TrackedToken(Base):
     __tablename__ = "tracked_tokens"
     
-    id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String(20), unique=True, nullable=False, index=True)
-    name = Column(String(100), nullable=True)
-    chain_id = Column(Integer, nullable=True)  # Ethereum=1, BSC=56, etc.
-    contract_address = Column(String(42), nullable=True)  # Token contract address
-    gecko_id = Column(String(100), nullable=True)  # GeckoTerminal ID for price data
-    is_active = Column(Boolean, default=True, index=True)
-    auto_analysis = Column(Boolean, default=False)  # Enable automatic periodic analysis
-    analysis_interval_hours = Column(Integer, default=6)  # How often to analyze
-    last_analysis_at = Column(DateTime, nullable=True)
-    added_by = Column(String(42), nullable=True)  # Admin wallet address who added it
-    token_metadata = Column(JSON, nullable=True)  # Additional token information
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    symbol: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
+    name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    chain_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # Ethereum=1, BSC=56, etc.
+    contract_address: Mapped[Optional[str]] = mapped_column(String(42), nullable=True)  # Token contract address
+    gecko_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # GeckoTerminal ID for price data
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, index=True)
+    auto_analysis: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)  # Enable automatic periodic analysis
+    analysis_interval_hours: Mapped[Optional[int]] = mapped_column(Integer, default=6)  # How often to analyze
+    last_analysis_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    added_by: Mapped[Optional[str]] = mapped_column(String(42), nullable=True)  # Admin wallet address who added it
+    token_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Additional token information
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -197,14 +222,14 @@ class UserWallet(Base):
     """
     __tablename__ = "user_wallets"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_wallet_address = Column(String(42), unique=True, nullable=False, index=True)  # User's connected wallet
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    is_active = Column(Boolean, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_wallet_address: Mapped[str] = mapped_column(String(42), unique=True, nullable=False, index=True)  # User's connected wallet
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Relationship to deposits
-    deposits = relationship("UserDeposit", back_populates="user_wallet")
+    deposits: Mapped[List["UserDeposit"]] = relationship("UserDeposit", back_populates="user_wallet")
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -221,16 +246,20 @@ class ManagedWallet(Base):
     """
     __tablename__ = "managed_wallets"
     
-    id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)  # AgentChain managed address
-    chain_id = Column(Integer, nullable=False, index=True)
-    wallet_type = Column(String(20), default="deposit")  # deposit, trading, treasury
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    wallet_address: Mapped[str] = mapped_column(String(42), nullable=False, index=True)  # AgentChain managed address
+    chain_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    wallet_type: Mapped[Optional[str]] = mapped_column(String(20), default="deposit")  # deposit, trading, treasury
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Unique constraint per chain
-    __table_args__ = (UniqueConstraint('wallet_address', 'chain_id', name='unique_wallet_per_chain'),)
+    __table_args__ = (
+        UniqueConstraint('wallet_address', 'chain_id', name='unique_wallet_per_chain'),
+        # Active wallet lookup per chain on every deposit address / record call
+        Index('ix_managed_wallet_chain_active', 'chain_id', 'is_active'),
+    )
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -249,40 +278,45 @@ class UserDeposit(Base):
     """
     __tablename__ = "user_deposits"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_wallet_id = Column(Integer, ForeignKey("user_wallets.id"), nullable=False, index=True)
-    managed_wallet_id = Column(Integer, ForeignKey("managed_wallets.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_wallet_id: Mapped[int] = mapped_column(Integer, ForeignKey("user_wallets.id"), nullable=False, index=True)
+    managed_wallet_id: Mapped[int] = mapped_column(Integer, ForeignKey("managed_wallets.id"), nullable=False, index=True)
     
     # Transaction details
-    chain_id = Column(Integer, nullable=False, index=True)
-    token_address = Column(String(42), nullable=True)  # NULL for native tokens (ETH, BNB, etc.)
-    token_symbol = Column(String(20), nullable=False, index=True)
-    amount = Column(String(78), nullable=False)  # Store as string to avoid precision issues
-    decimal_places = Column(Integer, default=18)
+    chain_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    token_address: Mapped[Optional[str]] = mapped_column(String(42), nullable=True)  # NULL for native tokens (ETH, BNB, etc.)
+    token_symbol: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    amount: Mapped[Decimal] = mapped_column(DecimalString, nullable=False)  # Exact decimal, stored as text
+    decimal_places: Mapped[Optional[int]] = mapped_column(Integer, default=18)
     
     # Blockchain tracking
-    transaction_hash = Column(String(66), unique=True, nullable=False, index=True)
-    block_number = Column(Integer, nullable=True)
-    from_address = Column(String(42), nullable=False)  # User's wallet address
-    to_address = Column(String(42), nullable=False)    # AgentChain managed address
+    transaction_hash: Mapped[str] = mapped_column(String(66), unique=True, nullable=False, index=True)
+    block_number: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    from_address: Mapped[str] = mapped_column(String(42), nullable=False)  # User's wallet address
+    to_address: Mapped[str] = mapped_column(String(42), nullable=False)    # AgentChain managed address
     
     # Status tracking
-    status = Column(String(20), default="pending")  # pending, confirmed, failed
-    confirmations = Column(Integer, default=0)
-    confirmed_at = Column(DateTime, nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(String(20), default="pending")  # pending, confirmed, failed
+    confirmations: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    confirmed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Metadata
-    gas_used = Column(String(20), nullable=True)
-    gas_price = Column(String(30), nullable=True)
-    usd_value_at_deposit = Column(String(20), nullable=True)  # USD value when deposited
-    deposit_metadata = Column(JSON, nullable=True)  # Additional deposit information
+    gas_used: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    gas_price: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    usd_value_at_deposit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # USD value when deposited
+    deposit_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Additional deposit information
     
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    user_wallet = relationship("UserWallet", back_populates="deposits")
-    managed_wallet = relationship("ManagedWallet")
+    user_wallet: Mapped["UserWallet"] = relationship("UserWallet", back_populates="deposits")
+    managed_wallet: Mapped["ManagedWallet"] = relationship("ManagedWallet")
+    
+    # Composite index for pending/confirmed deposit scans per chain
+    __table_args__ = (
+        Index('ix_deposit_status_chain', 'status', 'chain_id'),
+    )
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -292,7 +326,7 @@ class UserDeposit(Base):
             "chain_id": self.chain_id,
             "token_address": self.token_address,
             "token_symbol": self.token_symbol,
-            "amount": self.amount,
+            "amount": str(self.amount) if self.amount is not None else None,
             "decimal_places": self.decimal_places,
             "transaction_hash": self.transaction_hash,
             "block_number": self.block_number,
@@ -315,22 +349,22 @@ class UserBalance(Base):
     """
     __tablename__ = "user_balances"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_wallet_id = Column(Integer, ForeignKey("user_wallets.id"), nullable=False, index=True)
-    chain_id = Column(Integer, nullable=False, index=True)
-    token_address = Column(String(42), nullable=True)  # NULL for native tokens
-    token_symbol = Column(String(20), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_wallet_id: Mapped[int] = mapped_column(Integer, ForeignKey("user_wallets.id"), nullable=False, index=True)
+    chain_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    token_address: Mapped[Optional[str]] = mapped_column(String(42), nullable=True)  # NULL for native tokens
+    token_symbol: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     
     # Balance tracking
-    total_deposited = Column(String(78), default="0")  # Total amount deposited
-    total_withdrawn = Column(String(78), default="0")  # Total amount withdrawn
-    available_balance = Column(String(78), default="0")  # Available for trading
-    locked_balance = Column(String(78), default="0")    # Locked in trades/orders
+    total_deposited: Mapped[Optional[Decimal]] = mapped_column(DecimalString, default=Decimal("0"))  # Total amount deposited
+    total_withdrawn: Mapped[Optional[Decimal]] = mapped_column(DecimalString, default=Decimal("0"))  # Total amount withdrawn
+    available_balance: Mapped[Optional[Decimal]] = mapped_column(DecimalString, default=Decimal("0"))  # Available for trading
+    locked_balance: Mapped[Optional[Decimal]] = mapped_column(DecimalString, default=Decimal("0"))    # Locked in trades/orders
     
     # Metadata
-    decimal_places = Column(Integer, default=18)
-    last_updated = Column(DateTime, default=func.now())
-    created_at = Column(DateTime, default=func.now())
+    decimal_places: Mapped[Optional[int]] = mapped_column(Integer, default=18)
+    last_updated: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     # Unique constraint per user per token per chain
     __table_args__ = (
@@ -338,7 +372,7 @@ class UserBalance(Base):
     )
     
     # Relationships
-    user_wallet = relationship("UserWallet")
+    user_wallet: Mapped["UserWallet"] = relationship("UserWallet")
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -347,10 +381,10 @@ class UserBalance(Base):
             "chain_id": self.chain_id,
             "token_address": self.token_address,
             "token_symbol": self.token_symbol,
-            "total_deposited": self.total_deposited,
-            "total_withdrawn": self.total_withdrawn,
-            "available_balance": self.available_balance,
-            "locked_balance": self.locked_balance,
+            "total_deposited": str(self.total_deposited) if self.total_deposited is not None else None,
+            "total_withdrawn": str(self.total_withdrawn) if self.total_withdrawn is not None else None,
+            "available_balance": str(self.available_balance) if self.available_balance is not None else None,
+            "locked_balance": str(self.locked_balance) if self.locked_balance is not None else None,
             "decimal_places": self.decimal_places,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
             "created_at": self.created_at.isoformat() if self.created_at else None
@@ -362,25 +396,25 @@ class WaitlistUser(Base):
     """
     __tablename__ = "waitlist_users"
     
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    wallet_address = Column(String(42), nullable=True, index=True)
-    twitter_handle = Column(String(50), nullable=True)
-    discord_handle = Column(String(50), nullable=True)
-    registration_date = Column(DateTime, default=func.now(), nullable=False)
-    email_verified = Column(Boolean, default=False)
-    airdrop_eligible = Column(Boolean, default=True)
-    airdrop_amount = Column(DECIMAL(precision=18, scale=8), nullable=True)
-    early_access_granted = Column(Boolean, default=False)
-    referral_code = Column(String(20), nullable=True, unique=True, index=True)
-    referred_by = Column(Integer, ForeignKey("waitlist_users.id"), nullable=True)
-    notification_preferences = Column(JSON, default=lambda: {"email": True, "airdrop": True, "updates": True})
-    user_metadata = Column(JSON, default=dict)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
-    ip_address = Column(String(45), nullable=True)  # For analytics and fraud prevention
-    user_agent = Column(Text, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    wallet_address: Mapped[Optional[str]] = mapped_column(String(42), nullable=True, index=True)
+    twitter_handle: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    discord_handle: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    registration_date: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    email_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    airdrop_eligible: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    airdrop_amount: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(precision=18, scale=8), nullable=True)
+    early_access_granted: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    referral_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, unique=True, index=True)
+    referred_by: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("waitlist_users.id"), nullable=True)
+    notification_preferences: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), server_default='{"email":true,"airdrop":true,"updates":true}')
+    user_metadata: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), server_default='{}')  # Renamed from 'metadata' to avoid SQLAlchemy conflict
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)  # For analytics and fraud prevention
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Relationships
-    referrals = relationship("WaitlistUser", backref=backref("referrer", remote_side=[id]))
+    referrals: Mapped[List["WaitlistUser"]] = relationship("WaitlistUser", backref=backref("referrer", remote_side=[id]))
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,37 @@
+"""
+Shared service instances
+One instance per process, reused by the app lifespan and route dependencies
+"""
+
+from functools import lru_cache
+
+from .mcp_client import MCPClient
+from .feature_extractor import FeatureExtractor
+from .ml_engine import MLEngine
+from .thesis_composer import ThesisComposer
+from .aggregator import NarrativeAggregator
+from .gecko_client import GeckoTerminalClient
+
+@lru_cache(maxsize=1)
+def get_mcp_client() -> MCPClient:
+    return MCPClient()
+
+@lru_cache(maxsize=1)
+def get_feature_extractor() -> FeatureExtractor:
+    return FeatureExtractor()
+
+@lru_cache(maxsize=1)
+def get_ml_engine() -> MLEngine:
+    return MLEngine()
+
+@lru_cache(maxsize=1)
+def get_thesis_composer() -> ThesisComposer:
+    return ThesisComposer()
+
+@lru_cache(maxsize=1)
+def get_aggregator() -> NarrativeAggregator:
+    return NarrativeAggregator()
+
+@lru_cache(maxsize=1)
+def get_gecko_client() -> GeckoTerminalClient:
+    return GeckoTerminalClient()
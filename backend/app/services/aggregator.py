@@ -1,32 +1,144 @@
+import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from collections import defaultdict
-from sqlalchemy.orm import Session
-import statistics
+from functools import lru_cache
+from bisect import bisect_left, insort
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, make_transient_to_detached
+import numpy as np
 import math
+import time
 
 from ..models import Article, Bucket
 from ..database import SessionLocal
 
+# Numba is optional; without it the kernel falls back to NumPy reductions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Bucket boundaries are aligned to the Unix epoch (naive datetimes are UTC)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Article columns read by aggregation; rows are fetched as plain tuples
+ARTICLE_AGG_COLUMNS = (
+    Article.id, Article.bucket_ts, Article.created_at, Article.sentiment_score,
+    Article.final_weight, Article.event_probs, Article.source_trust, Article.novelty_score
+)
+
+# Bucket columns written from aggregated features
+BUCKET_FIELDS = frozenset([
+    'narrative_heat', 'positive_heat', 'negative_heat', 'consensus',
+    'hype_velocity', 'risk_polarity', 'event_distribution', 'top_event',
+    'liquidity_usd', 'trades_count_change', 'spread_estimate',
+    'article_count', 'avg_source_trust', 'avg_novelty'
+])
+
+def _aggregate_kernel_numpy(
+    sentiment: np.ndarray,
+    weights: np.ndarray,
+    event_matrix: np.ndarray
+) -> Tuple[float, float, float, np.ndarray]:
+    """Narrative heat, positive/negative heat and weighted event sums"""
+    contributions = sentiment * weights
+    # Branchless split: elementwise max/min instead of mask + compaction
+    positive = np.maximum(contributions, 0).sum()
+    negative = -np.minimum(contributions, 0).sum()
+    return contributions.sum(), positive, negative, weights @ event_matrix
+
+def _aggregate_kernel_loops(
+    sentiment: np.ndarray,
+    weights: np.ndarray,
+    event_matrix: np.ndarray
+) -> Tuple[float, float, float, np.ndarray]:
+    """Single fused pass of _aggregate_kernel_numpy, written for Numba"""
+    n_articles, n_events = event_matrix.shape
+    heat = np.float32(0.0)
+    positive = np.float32(0.0)
+    negative = np.float32(0.0)
+    weighted_events = np.zeros(n_events, dtype=np.float32)
+    for i in range(n_articles):
+        contribution = sentiment[i] * weights[i]
+        heat += contribution
+        # Branchless split, matching np.maximum/np.minimum in the NumPy kernel
+        positive += max(contribution, 0.0)
+        negative -= min(contribution, 0.0)
+        for j in range(n_events):
+            weighted_events[j] += weights[i] * event_matrix[i, j]
+    return heat, positive, negative, weighted_events
+
+if NUMBA_AVAILABLE:
+    _aggregate_kernel = njit(cache=True, fastmath=True)(_aggregate_kernel_loops)
+else:
+    _aggregate_kernel = _aggregate_kernel_numpy
+
 class NarrativeAggregator:
     """Aggregate article features into bucket-level narrative metrics"""
     
     def __init__(self, bucket_window_minutes: int = 10):
         self.bucket_window_minutes = bucket_window_minutes
+        self._window = timedelta(minutes=bucket_window_minutes)
         self.event_types = [
             "listing", "partnership", "hack", "depeg", "regulatory", 
             "funding", "tech", "market-note", "op-ed"
         ]
         self.risk_events = ["hack", "depeg", "regulatory"]
+        self.positive_events = ["listing", "partnership", "funding", "tech"]
+        
+        # Boolean masks over the event axis for risk polarity
+        self._risk_mask = np.array([e in self.risk_events for e in self.event_types], dtype=bool)
+        self._pos_mask = np.array([e in self.positive_events for e in self.event_types], dtype=bool)
         
-    async def aggregate_token_bucket(
+        # Memoized per-article event vectors; overlapping windows revisit the same articles
+        self._event_vector = lru_cache(maxsize=50_000)(self._compute_event_vector)
+        
+        # Short-lived read caches, invalidated per token on bucket writes
+        self.cache_ttl_seconds = 30
+        self._latest_bucket_cache: Dict[str, Tuple[float, Optional[Bucket]]] = {}
+        self._previous_heat_cache: Dict[Tuple[str, datetime], Tuple[float, Optional[float]]] = {}
+        # DB work runs in worker threads, so cache access is serialized
+        self._cache_lock = threading.Lock()
+    
+    def _cache_get(self, cache: Dict, key: Any) -> Tuple[bool, Any]:
+        """Return (hit, value) for an unexpired cache entry"""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return False, None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.cache_ttl_seconds:
+                del cache[key]
+                return False, None
+            return True, value
+    
+    def _cache_put(self, cache: Dict, key: Any, value: Any):
+        """Store a value with the current timestamp"""
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+    
+    def _invalidate_token_cache(self, token: str):
+        """Drop cached bucket reads for a token after its buckets change"""
+        with self._cache_lock:
+            self._latest_bucket_cache.pop(token, None)
+            for key in [k for k in self._previous_heat_cache if k[0] == token]:
+                del self._previous_heat_cache[key]
+        
+    def aggregate_token_bucket(
         self, 
         token: str, 
         bucket_ts: datetime, 
-        articles: List[Article]
+        articles: Sequence[Any],
+        prior_heats: Optional[List[Tuple[datetime, Optional[float]]]] = None,
+        db: Optional[Session] = None
     ) -> Dict[str, Any]:
         """
         Aggregate article features into bucket-level metrics
@@ -34,7 +146,9 @@ class NarrativeAggregator:
         Args:
             token: Token symbol
             bucket_ts: Bucket timestamp
-            articles: List of articles in this bucket
+            articles: Articles in this bucket (ORM objects or rows with the same attributes)
+            prior_heats: Optional prefetched (bucket_ts, narrative_heat) pairs sorted by timestamp
+            db: Optional session to reuse for lookups
             
         Returns:
             Dictionary with aggregated bucket features
@@ -43,179 +157,170 @@ class NarrativeAggregator:
             if not articles:
                 return self._get_empty_bucket_features()
             
-            # Calculate Narrative Heat (NHS)
-            narrative_heat = self._calculate_narrative_heat(articles)
-            
-            # Calculate positive and negative heat
-            positive_heat, negative_heat = self._calculate_sentiment_heat(articles)
-            
-            # Calculate event consensus and distribution
-            consensus, event_distribution, top_event = self._calculate_event_consensus(articles)
-            
-            # Calculate risk polarity
-            risk_polarity = self._calculate_risk_polarity(event_distribution, articles)
-            
-            # Calculate hype velocity (requires previous bucket)
-            hype_velocity = await self._calculate_hype_velocity(token, bucket_ts, narrative_heat)
-            
-            return {
-                'narrative_heat': narrative_heat,
-                'positive_heat': positive_heat,
-                'negative_heat': negative_heat,
-                'consensus': consensus,
-                'hype_velocity': hype_velocity,
-                'risk_polarity': risk_polarity,
-                'event_distribution': event_distribution,
-                'top_event': top_event,
-                'article_count': len(articles),
-                'avg_source_trust': statistics.mean([a.source_trust or 0.5 for a in articles]),
-                'avg_novelty': statistics.mean([a.novelty_score or 0.5 for a in articles]),
-            }
+            # Extract per-article features once; everything below is vectorized.
+            # float32 halves the bytes moved and is ample for 3-decimal outputs
+            n = len(articles)
+            sentiment = np.fromiter((a.sentiment_score or 0.0 for a in articles), dtype=np.float32, count=n)
+            weights = np.fromiter((a.final_weight or 0.0 for a in articles), dtype=np.float32, count=n)
+            trust = np.fromiter((a.source_trust or 0.5 for a in articles), dtype=np.float32, count=n)
+            novelty = np.fromiter((a.novelty_score or 0.5 for a in articles), dtype=np.float32, count=n)
+            event_matrix = self._build_event_matrix([a.event_probs for a in articles])
+            
+            # Narrative Heat NHS_t = Σ (sentiment_score * final_weight), its
+            # positive/negative split, and weighted event sums in one kernel call
+            heat, positive, negative, weighted_events = _aggregate_kernel(sentiment, weights, event_matrix)
+            
+            return self._finalize_bucket_features(
+                token, bucket_ts, n, heat, positive, negative, weighted_events,
+                float(weights.sum()), float(trust.mean()), float(novelty.mean()),
+                prior_heats, db
+            )
             
         except Exception as e:
             logger.error(f"Error aggregating bucket for {token}: {e}")
             return self._get_empty_bucket_features()
     
-    def _calculate_narrative_heat(self, articles: List[Article]) -> float:
-        """
-        Calculate Narrative Heat Score (NHS)
-        NHS_t = Σ (sentiment_score * final_weight)
-        """
-        try:
-            total_heat = 0.0
-            
-            for article in articles:
-                sentiment = article.sentiment_score or 0.0
-                weight = article.final_weight or 0.0
-                contribution = sentiment * weight
-                total_heat += contribution
-            
-            return round(total_heat, 3)
-            
-        except Exception as e:
-            logger.error(f"Error calculating narrative heat: {e}")
-            return 0.0
+    def _finalize_bucket_features(
+        self,
+        token: str,
+        bucket_ts: datetime,
+        article_count: int,
+        heat: float,
+        positive: float,
+        negative: float,
+        weighted_events: np.ndarray,
+        w_sum: float,
+        avg_source_trust: float,
+        avg_novelty: float,
+        prior_heats: Optional[List[Tuple[datetime, Optional[float]]]] = None,
+        db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """Build the bucket feature dict from per-bucket sums"""
+        narrative_heat = round(float(heat), 3)
+        
+        # Weight total and mean are shared by consensus and polarity
+        w_mean = w_sum / article_count
+        
+        # Calculate event consensus and distribution
+        consensus, distribution, top_event = self._calculate_event_consensus(weighted_events, w_sum)
+        event_distribution = dict(zip(self.event_types, distribution.tolist())) if distribution is not None else {}
+        
+        # Calculate risk polarity
+        risk_polarity = self._calculate_risk_polarity(distribution, w_mean)
+        
+        # Calculate hype velocity (requires previous bucket)
+        hype_velocity = self._calculate_hype_velocity(token, bucket_ts, narrative_heat, prior_heats, db)
+        
+        return {
+            'narrative_heat': narrative_heat,
+            'positive_heat': round(float(positive), 3),
+            'negative_heat': round(float(negative), 3),
+            'consensus': consensus,
+            'hype_velocity': hype_velocity,
+            'risk_polarity': risk_polarity,
+            'event_distribution': event_distribution,
+            'top_event': top_event,
+            'article_count': article_count,
+            'avg_source_trust': avg_source_trust,
+            'avg_novelty': avg_novelty,
+        }
     
-    def _calculate_sentiment_heat(self, articles: List[Article]) -> Tuple[float, float]:
-        """Calculate positive and negative heat separately"""
-        try:
-            positive_heat = 0.0
-            negative_heat = 0.0
-            
-            for article in articles:
-                sentiment = article.sentiment_score or 0.0
-                weight = article.final_weight or 0.0
-                contribution = sentiment * weight
-                
-                if contribution > 0:
-                    positive_heat += contribution
-                else:
-                    negative_heat += abs(contribution)
-            
-            return round(positive_heat, 3), round(negative_heat, 3)
-            
-        except Exception as e:
-            logger.error(f"Error calculating sentiment heat: {e}")
-            return 0.0, 0.0
+    def _compute_event_vector(self, probs: Tuple[float, ...]) -> np.ndarray:
+        """Event probability vector over self.event_types (read-only, cached)"""
+        vector = np.array(probs, dtype=np.float32)
+        vector.setflags(write=False)
+        return vector
+    
+    def _build_event_matrix(self, event_probs: Sequence[Optional[Dict[str, float]]]) -> np.ndarray:
+        """(articles x event types) probability matrix from per-article event_probs"""
+        event_types = self.event_types
+        event_matrix = np.zeros((len(event_probs), len(event_types)), dtype=np.float32)
+        for row, probs in enumerate(event_probs):
+            if probs:
+                # Keyed on the ordered probabilities, so dict insertion order doesn't split the cache
+                probs_get = probs.get
+                event_matrix[row] = self._event_vector(tuple(probs_get(e, 0.0) for e in event_types))
+        return event_matrix
     
-    def _calculate_event_consensus(self, articles: List[Article]) -> Tuple[float, Dict[str, float], str]:
+    def _calculate_event_consensus(self, weighted_events: np.ndarray, total_weight: float) -> Tuple[float, Optional[np.ndarray], str]:
         """
         Calculate event consensus and distribution
-        Returns: (consensus_score, event_distribution, top_event)
+        Returns: (consensus_score, distribution over self.event_types, top_event)
         """
-        try:
-            if not articles:
-                return 0.0, {}, "unknown"
-            
-            # Collect event probabilities weighted by article weight
-            weighted_event_scores = defaultdict(float)
-            total_weight = 0.0
-            
-            for article in articles:
-                weight = article.final_weight or 0.0
-                event_probs = article.event_probs or {}
-                
-                for event_type in self.event_types:
-                    prob = event_probs.get(event_type, 0.0)
-                    weighted_event_scores[event_type] += prob * weight
-                
-                total_weight += weight
-            
-            if total_weight == 0:
-                return 0.0, {}, "unknown"
-            
-            # Normalize by total weight to get distribution
-            event_distribution = {}
-            for event_type in self.event_types:
-                event_distribution[event_type] = weighted_event_scores[event_type] / total_weight
-            
-            # Find top event
-            top_event = max(event_distribution, key=event_distribution.get)
-            top_event_prob = event_distribution[top_event]
-            
-            # Calculate consensus as the fraction agreeing with top event
-            # This is the probability mass concentrated in the top event
-            consensus = top_event_prob
-            
-            return round(consensus, 3), event_distribution, top_event
-            
-        except Exception as e:
-            logger.error(f"Error calculating event consensus: {e}")
-            return 0.0, {}, "unknown"
+        if total_weight == 0:
+            return 0.0, None, "unknown"
+        
+        # Weight-averaged event distribution
+        distribution = weighted_events / total_weight
+        
+        # Consensus is the probability mass concentrated in the top event
+        top_idx = int(distribution.argmax())
+        top_event = self.event_types[top_idx]
+        consensus = float(distribution[top_idx])
+        
+        return round(consensus, 3), distribution, top_event
     
-    def _calculate_risk_polarity(self, event_distribution: Dict[str, float], articles: List[Article]) -> float:
+    def _calculate_risk_polarity(self, distribution: Optional[np.ndarray], avg_weight: float) -> float:
         """
         Calculate risk polarity
         Negative if risk events (hack/regulatory/depeg) dominate
         """
-        try:
-            # Sum probabilities of risk events
-            risk_prob = sum(event_distribution.get(event, 0.0) for event in self.risk_events)
-            
-            # Sum probabilities of positive events  
-            positive_events = ["listing", "partnership", "funding", "tech"]
-            positive_prob = sum(event_distribution.get(event, 0.0) for event in positive_events)
-            
-            # Calculate polarity: positive_prob - risk_prob
-            # Range: [-1, 1] where negative means risk dominates
-            polarity = positive_prob - risk_prob
-            
-            # Weight by overall narrative strength
-            avg_weight = statistics.mean([a.final_weight or 0.0 for a in articles]) if articles else 0.0
-            weighted_polarity = polarity * min(avg_weight, 1.0)
-            
-            return round(weighted_polarity, 3)
-            
-        except Exception as e:
-            logger.error(f"Error calculating risk polarity: {e}")
+        if distribution is None:
             return 0.0
+        
+        # Calculate polarity: positive_prob - risk_prob
+        # Range: [-1, 1] where negative means risk dominates
+        polarity = float(distribution[self._pos_mask].sum() - distribution[self._risk_mask].sum())
+        
+        # Weight by overall narrative strength
+        weighted_polarity = polarity * min(avg_weight, 1.0)
+        
+        return round(weighted_polarity, 3)
     
-    async def _calculate_hype_velocity(self, token: str, current_bucket_ts: datetime, current_heat: float) -> float:
+    def _calculate_hype_velocity(
+        self,
+        token: str,
+        current_bucket_ts: datetime,
+        current_heat: float,
+        prior_heats: Optional[List[Tuple[datetime, Optional[float]]]] = None,
+        db: Optional[Session] = None
+    ) -> float:
         """
         Calculate hype velocity: (NHS_t - NHS_{t-1}) / max(|NHS_{t-1}|, 1)
         """
         try:
-            db = SessionLocal()
-            try:
-                # Get previous bucket
-                previous_bucket = db.query(Bucket).filter(
-                    Bucket.token == token,
-                    Bucket.bucket_ts < current_bucket_ts
-                ).order_by(Bucket.bucket_ts.desc()).first()
-                
-                if not previous_bucket or previous_bucket.narrative_heat is None:
-                    return 0.0  # No previous data
-                
-                previous_heat = previous_bucket.narrative_heat
-                
-                # Calculate velocity
-                denominator = max(abs(previous_heat), 1.0)
-                velocity = (current_heat - previous_heat) / denominator
-                
-                return round(velocity, 3)
-                
-            finally:
-                db.close()
+            if prior_heats is not None:
+                # Previous bucket from the prefetched list, no DB round-trip
+                idx = bisect_left(prior_heats, (current_bucket_ts,))
+                previous_heat = prior_heats[idx - 1][1] if idx > 0 else None
+            else:
+                cache_key = (token, current_bucket_ts)
+                hit, previous_heat = self._cache_get(self._previous_heat_cache, cache_key)
+                if not hit:
+                    owns_session = db is None
+                    session = SessionLocal() if owns_session else db
+                    try:
+                        # Get previous bucket heat (index-only via ix_bucket_token_ts_nh)
+                        previous_row = session.query(Bucket.narrative_heat).filter(
+                            Bucket.token == token,
+                            Bucket.bucket_ts < current_bucket_ts
+                        ).order_by(Bucket.bucket_ts.desc()).first()
+                        
+                        previous_heat = previous_row[0] if previous_row else None
+                        
+                    finally:
+                        if owns_session:
+                            session.close()
+                    self._cache_put(self._previous_heat_cache, cache_key, previous_heat)
+            
+            if previous_heat is None:
+                return 0.0  # No previous data
+            
+            # Calculate velocity
+            denominator = max(abs(previous_heat), 1.0)
+            velocity = (current_heat - previous_heat) / denominator
+            
+            return round(velocity, 3)
                 
         except Exception as e:
             logger.error(f"Error calculating hype velocity: {e}")
@@ -240,8 +345,10 @@ class NarrativeAggregator:
     async def create_or_update_bucket(
         self, 
         token: str, 
-        articles: List[Article],
-        bucket_ts: Optional[datetime] = None
+        articles: Sequence[Any],
+        bucket_ts: Optional[datetime] = None,
+        prior_heats: Optional[List[Tuple[datetime, Optional[float]]]] = None,
+        db: Optional[Session] = None
     ) -> Bucket:
         """
         Create or update a bucket with aggregated features
@@ -250,66 +357,132 @@ class NarrativeAggregator:
             token: Token symbol
             articles: Articles to aggregate
             bucket_ts: Optional bucket timestamp (defaults to current time bucketed)
+            prior_heats: Optional prefetched (bucket_ts, narrative_heat) pairs sorted by timestamp
+            db: Optional session to reuse; one is opened and closed otherwise
             
         Returns:
             Created or updated Bucket object
         """
+        return await asyncio.to_thread(
+            self._create_or_update_bucket_sync, token, articles, bucket_ts, prior_heats, db
+        )
+    
+    def _create_or_update_bucket_sync(
+        self,
+        token: str,
+        articles: Sequence[Any],
+        bucket_ts: Optional[datetime],
+        prior_heats: Optional[List[Tuple[datetime, Optional[float]]]],
+        db: Optional[Session] = None
+    ) -> Bucket:
+        """Blocking implementation of create_or_update_bucket"""
         try:
             if bucket_ts is None:
                 bucket_ts = self._get_bucket_timestamp(datetime.utcnow())
             
-            # Calculate aggregated features
-            features = await self.aggregate_token_bucket(token, bucket_ts, articles)
-            
-            db = SessionLocal()
+            owns_session = db is None
+            session = SessionLocal() if owns_session else db
             try:
-                # Check if bucket already exists
-                existing_bucket = db.query(Bucket).filter(
-                    Bucket.token == token,
-                    Bucket.bucket_ts == bucket_ts
-                ).first()
+                # Calculate aggregated features
+                features = self.aggregate_token_bucket(token, bucket_ts, articles, prior_heats, session)
                 
-                if existing_bucket:
-                    # Update existing bucket
-                    for key, value in features.items():
-                        if hasattr(existing_bucket, key):
-                            setattr(existing_bucket, key, value)
-                    bucket = existing_bucket
-                else:
-                    # Filter features to only include valid Bucket fields
-                    bucket_features = {}
-                    bucket_fields = [
-                        'narrative_heat', 'positive_heat', 'negative_heat', 'consensus',
-                        'hype_velocity', 'risk_polarity', 'event_distribution', 'top_event',
-                        'liquidity_usd', 'trades_count_change', 'spread_estimate',
-                        'article_count', 'avg_source_trust', 'avg_novelty'
-                    ]
-                    
-                    for key, value in features.items():
-                        if key in bucket_fields:
-                            bucket_features[key] = value
-                    
-                    # Create new bucket
-                    bucket = Bucket(
-                        token=token,
-                        bucket_ts=bucket_ts,
-                        **bucket_features
-                    )
-                    db.add(bucket)
-                
-                db.commit()
-                db.refresh(bucket)
+                bucket = self._upsert_buckets(session, [(token, bucket_ts, features)])[0]
                 
                 logger.info(f"Updated bucket for {token} at {bucket_ts}: NHS={features['narrative_heat']:.2f}")
                 return bucket
                 
             finally:
-                db.close()
+                if owns_session:
+                    session.close()
                 
         except Exception as e:
             logger.error(f"Error creating/updating bucket: {e}")
             raise
     
+    def _upsert_buckets(
+        self,
+        db: Session,
+        bucket_features: List[Tuple[str, datetime, Dict[str, Any]]]
+    ) -> List[Bucket]:
+        """
+        Insert or update buckets in one INSERT ... ON CONFLICT statement
+        
+        Args:
+            db: Database session
+            bucket_features: (token, bucket_ts, features) triples
+            
+        Returns:
+            Upserted Bucket objects built from the written values, detached from the session
+        """
+        rows = [
+            {
+                'token': token,
+                'bucket_ts': bucket_ts,
+                **{key: value for key, value in features.items() if key in BUCKET_FIELDS}
+            }
+            for token, bucket_ts, features in bucket_features
+        ]
+        update_keys = [key for key in rows[0] if key in BUCKET_FIELDS]
+        
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(Bucket).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['token', 'bucket_ts'],
+            set_={key: stmt.excluded[key] for key in update_keys}
+        ).returning(Bucket.token, Bucket.bucket_ts, Bucket.id, Bucket.created_at)
+        
+        # Only DB-assigned columns come back; everything else was just written,
+        # so the objects are built in memory instead of re-read or refreshed
+        generated = {
+            (token, bucket_ts): (bucket_id, created_at)
+            for token, bucket_ts, bucket_id, created_at in db.execute(stmt)
+        }
+        db.commit()
+        
+        buckets = []
+        for row in rows:
+            bucket_id, created_at = generated[(row['token'], row['bucket_ts'])]
+            bucket = Bucket(id=bucket_id, created_at=created_at, **row)
+            make_transient_to_detached(bucket)
+            buckets.append(bucket)
+        for token in {row['token'] for row in rows}:
+            self._invalidate_token_cache(token)
+        
+        return buckets
+    
+    def _prefetch_prior_heats(
+        self,
+        db: Session,
+        token: str,
+        min_ts: datetime,
+        max_ts: datetime
+    ) -> List[Tuple[datetime, Optional[float]]]:
+        """
+        Load (bucket_ts, narrative_heat) pairs for a token in one query: everything
+        from its last bucket before min_ts up to max_ts
+        """
+        last_before = select(func.max(Bucket.bucket_ts)).where(
+            Bucket.token == token,
+            Bucket.bucket_ts < min_ts
+        ).scalar_subquery()
+        rows = db.execute(
+            select(Bucket.bucket_ts, Bucket.narrative_heat).where(
+                Bucket.token == token,
+                Bucket.bucket_ts >= func.coalesce(last_before, min_ts),
+                Bucket.bucket_ts < max_ts
+            ).order_by(Bucket.bucket_ts)
+        ).all()
+        return [(ts, heat) for ts, heat in rows]
+    
+    @staticmethod
+    def _record_heat(prior_heats: List[Tuple[datetime, Optional[float]]], bucket_ts: datetime, heat: float):
+        """Insert or replace a bucket heat in the sorted prior-heat list"""
+        idx = bisect_left(prior_heats, (bucket_ts,))
+        if idx < len(prior_heats) and prior_heats[idx][0] == bucket_ts:
+            prior_heats[idx] = (bucket_ts, heat)
+        else:
+            insort(prior_heats, (bucket_ts, heat))
+    
     def _get_bucket_timestamp(self, timestamp: datetime) -> datetime:
         """
         Round timestamp down to nearest bucket window
@@ -320,15 +493,9 @@ class NarrativeAggregator:
         Returns:
             Bucketed timestamp
         """
-        # Round down to nearest bucket_window_minutes
-        minutes = timestamp.minute
-        bucketed_minutes = (minutes // self.bucket_window_minutes) * self.bucket_window_minutes
-        
-        return timestamp.replace(
-            minute=bucketed_minutes,
-            second=0,
-            microsecond=0
-        )
+        # Round down to nearest bucket_window_minutes with one timedelta modulo
+        epoch = _EPOCH_UTC if timestamp.tzinfo is not None else _EPOCH
+        return timestamp - (timestamp - epoch) % self._window
     
     async def process_token_articles(self, token: str, hours_back: int = 2) -> List[Bucket]:
         """
@@ -341,16 +508,23 @@ class NarrativeAggregator:
         Returns:
             List of created/updated buckets
         """
+        return await asyncio.to_thread(self._process_token_articles_sync, token, hours_back)
+    
+    def _process_token_articles_sync(self, token: str, hours_back: int) -> List[Bucket]:
+        """Blocking implementation of process_token_articles"""
         try:
             db = SessionLocal()
             try:
                 # Get recent articles
                 since = datetime.utcnow() - timedelta(hours=hours_back)
-                articles = db.query(Article).filter(
-                    Article.token == token,
-                    Article.created_at >= since,
-                    Article.final_weight.isnot(None)
-                ).order_by(Article.created_at).all()
+                # Core select of only the columns aggregation reads, no ORM hydration
+                articles = db.execute(
+                    select(*ARTICLE_AGG_COLUMNS).where(
+                        Article.token == token,
+                        Article.created_at >= since,
+                        Article.final_weight.isnot(None)
+                    ).order_by(Article.created_at)
+                ).all()
                 
                 if not articles:
                     logger.info(f"No articles found for {token} in last {hours_back} hours")
@@ -358,28 +532,42 @@ class NarrativeAggregator:
                 
                 # Group articles by bucket
                 bucket_articles = defaultdict(list)
+                bucket_ts_updates = []
                 for article in articles:
                     if article.bucket_ts:
                         bucket_articles[article.bucket_ts].append(article)
                     else:
                         # Assign bucket timestamp if not set
                         bucket_ts = self._get_bucket_timestamp(article.created_at)
-                        article.bucket_ts = bucket_ts
+                        bucket_ts_updates.append({"id": article.id, "bucket_ts": bucket_ts})
                         bucket_articles[bucket_ts].append(article)
                 
-                # Update articles with bucket_ts
-                db.commit()
+                # Update articles with bucket_ts; committed together with the bucket upsert
+                if bucket_ts_updates:
+                    db.execute(update(Article), bucket_ts_updates)
+                
+                # Prefetch prior bucket heats in one query
+                prior_heats = self._prefetch_prior_heats(
+                    db, token, min(bucket_articles), max(bucket_articles)
+                )
                 
-                # Process each bucket
-                buckets = []
-                for bucket_ts, bucket_articles_list in bucket_articles.items():
-                    bucket = await self.create_or_update_bucket(
-                        token, bucket_articles_list, bucket_ts
+                # Aggregate buckets oldest first so each velocity sees the fresh previous heat
+                bucket_features = []
+                for bucket_ts, bucket_articles_list in sorted(bucket_articles.items()):
+                    features = self.aggregate_token_bucket(
+                        token, bucket_ts, bucket_articles_list, prior_heats, db
                     )
-                    buckets.append(bucket)
+                    bucket_features.append((token, bucket_ts, features))
+                    self._record_heat(prior_heats, bucket_ts, features['narrative_heat'])
+                
+                # Write all buckets in a single upsert
+                buckets = sorted(
+                    self._upsert_buckets(db, bucket_features),
+                    key=lambda x: x.bucket_ts
+                )
                 
                 logger.info(f"Processed {len(buckets)} buckets for {token}")
-                return sorted(buckets, key=lambda x: x.bucket_ts)
+                return buckets
                 
             finally:
                 db.close()
@@ -390,12 +578,20 @@ class NarrativeAggregator:
     
     async def get_latest_bucket(self, token: str) -> Optional[Bucket]:
         """Get the most recent bucket for a token"""
+        return await asyncio.to_thread(self._get_latest_bucket_sync, token)
+    
+    def _get_latest_bucket_sync(self, token: str) -> Optional[Bucket]:
+        hit, bucket = self._cache_get(self._latest_bucket_cache, token)
+        if hit:
+            return bucket
+        
         db = SessionLocal()
         try:
             bucket = db.query(Bucket).filter(
                 Bucket.token == token
             ).order_by(Bucket.bucket_ts.desc()).first()
             
+            self._cache_put(self._latest_bucket_cache, token, bucket)
             return bucket
             
         finally:
@@ -403,6 +599,9 @@ class NarrativeAggregator:
     
     async def get_token_buckets(self, token: str, hours_back: int = 24) -> List[Bucket]:
         """Get recent buckets for a token"""
+        return await asyncio.to_thread(self._get_token_buckets_sync, token, hours_back)
+    
+    def _get_token_buckets_sync(self, token: str, hours_back: int) -> List[Bucket]:
         db = SessionLocal()
         try:
             since = datetime.utcnow() - timedelta(hours=hours_back)
@@ -1,129 +1,192 @@
+import asyncio
 import httpx
+import orjson
 import logging
-from typing import Dict, List, Optional, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from ..models import UserWallet, ManagedWallet, UserDeposit, UserBalance
 
 logger = logging.getLogger(__name__)
 
+# Bold markdown addresses still contain a bare hex match, so no alternation is needed
+_ADDR_RE = re.compile(r'0x[a-fA-F0-9]{40}')
+# "EOA:" followed by an address, or an address in bold, whichever comes first
+_EOA_RE = re.compile(r'EOA:\s*(0x[a-fA-F0-9]{40})|\*\*(0x[a-fA-F0-9]{40})\*\*')
+
+# Both chains are offered for UI flexibility, but only the microservice chain will work
+_SUPPORTED_CHAINS: List[Dict[str, Any]] = [
+    {
+        "chainId": 43114,
+        "name": "Avalanche",
+        "nativeCurrency": "AVAX"
+    },
+    {
+        "chainId": 43113,
+        "name": "Avalanche Fuji Testnet",
+        "nativeCurrency": "AVAX"
+    }
+]
+_CHAIN_NAMES: Dict[int, str] = {chain["chainId"]: chain["name"] for chain in _SUPPORTED_CHAINS}
+
 class DepositService:
-    """Service for managing user deposits through 0xgasless managed wallets"""
+    """Service for managing user deposits through 0xgasless managed wallets
+    
+    Wallet addresses and tx hashes are expected lowercase; the API request
+    models normalize them at the boundary.
+    """
     
     def __init__(self, microservice_url: str = "http://localhost:3003"):
         self.microservice_url = microservice_url
         self.timeout = httpx.Timeout(30.0)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Microservice addresses and chain info practically never change
+        self.cache_ttl_seconds = 300
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # In-flight GETs by path, so concurrent identical requests share one call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # DB lookups that rarely change: active managed wallet address per chain and
+        # ids of user wallets known to exist (bounded LRU)
+        self._managed_wallet_cache: Dict[int, str] = {}
+        self._user_wallet_ids: "OrderedDict[str, int]" = OrderedDict()
+        self.user_wallet_cache_size = 10_000
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created lazily inside the running event loop"""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 (negotiated via ALPN on https) multiplexes the gathered calls on one connection
+            self._client = httpx.AsyncClient(
+                http2=True,  # h2 comes with the pinned httpx[http2]
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+                base_url=self.microservice_url
+            )
+        return self._client
+    
+    def _cache_get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for an unexpired cache entry"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self._cache[key]
+            return False, None
+        return True, value
+    
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a value with the current timestamp"""
+        self._cache[key] = (time.monotonic(), value)
+    
+    def invalidate(self) -> None:
+        """Drop cached microservice responses and managed wallets, e.g. around wallet re-init"""
+        self._cache.clear()
+        self._managed_wallet_cache.clear()
+    
+    def _remember_user_wallet(self, address: str, wallet_id: int) -> None:
+        """Record an existing user wallet id, evicting the least recently used entry"""
+        self._user_wallet_ids[address] = wallet_id
+        self._user_wallet_ids.move_to_end(address)
+        if len(self._user_wallet_ids) > self.user_wallet_cache_size:
+            self._user_wallet_ids.popitem(last=False)
+    
+    async def _fetch_json(self, path: str) -> Any:
+        """GET a microservice path and decode the JSON body"""
+        response = await self.client.get(path)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def _get_json(self, path: str) -> Any:
+        """GET a microservice path, coalescing concurrent requests for the same path"""
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.create_task(self._fetch_json(path))
+            self._inflight[path] = task
+            
+            def _done(finished: asyncio.Task, path: str = path) -> None:
+                self._inflight.pop(path, None)
+                # Mark the exception retrieved even if every waiter was cancelled
+                if not finished.cancelled():
+                    finished.exception()
+            
+            task.add_done_callback(_done)
+        # Shielded so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_supported_chains(self) -> List[Dict[str, Any]]:
-        """Get list of supported blockchain networks from microservice"""
+        """Get list of supported blockchain networks"""
+        # Static list; the microservice chain probe's result was never used, so
+        # this no longer costs an HTTP round-trip per call
+        return [dict(chain) for chain in _SUPPORTED_CHAINS]
+    
+    async def get_managed_wallet_addresses(self) -> List[Dict[str, Any]]:
+        """Get AgentChain managed wallet addresses for all supported chains"""
+        hit, cached = self._cache_get("wallet_addresses")
+        if hit:
+            return [dict(wallet) for wallet in cached]
+        
         try:
-            # Dynamically detect which chain the microservice is configured for
-            # by checking what addresses it returns
-            _ = await self._get_microservice_chain_info()
+            # Get addresses from the working endpoints: Smart Account address and
+            # balance info (which includes EOA address) are independent, fetch both at once
+            address_data, balance_data = await asyncio.gather(
+                self._get_json("/api/swap/address"),
+                self._get_json("/api/swap/balance")
+            )
             
-            # Return both chains for UI flexibility, but only the microservice chain will work
-            return [
+            if not address_data.get("success") or not balance_data.get("success"):
+                raise Exception("Microservice returned error")
+            
+            # Extract Smart Account address from the result text (first hex address,
+            # bold markdown or not)
+            address_text = address_data["data"].get("result", "")
+            address_match = _ADDR_RE.search(address_text)
+            smart_account = address_match.group(0) if address_match else ""
+            
+            # Extract EOA address from balance result text
+            balance_text = balance_data["data"].get("result", "")
+            eoa_match = _EOA_RE.search(balance_text)
+            eoa_address = (eoa_match.group(1) or eoa_match.group(2)) if eoa_match else ""
+            
+            logger.info(f"Extracted addresses - Smart Account: {smart_account}, EOA: {eoa_address}")
+            
+            # The microservice is currently configured for mainnet (43114)
+            # Return addresses for both chains, but only mainnet will work
+            wallet_addresses = [
                 {
                     "chainId": 43114,
-                    "name": "Avalanche",
-                    "nativeCurrency": "AVAX"
+                    "chainName": "Avalanche",
+                    "smartAccount": smart_account,
+                    "eoaAddress": eoa_address,
+                    "isActive": True
                 },
                 {
                     "chainId": 43113,
-                    "name": "Avalanche Fuji Testnet",
-                    "nativeCurrency": "AVAX"
+                    "chainName": "Avalanche Fuji Testnet",
+                    "smartAccount": smart_account,  # Same addresses but different network
+                    "eoaAddress": eoa_address,
+                    "isActive": False  # Mark as inactive since microservice is on mainnet
                 }
             ]
-        except Exception as e:
-            logger.error(f"Failed to get supported chains: {e}")
-            raise
-    
-    async def _get_microservice_chain_info(self) -> Dict[str, Any]:
-        """Get the actual chain info from the microservice"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Get health endpoint or check what chain the microservice is on
-                balance_response = await client.get(f"{self.microservice_url}/api/swap/balance")
-                balance_response.raise_for_status()
-                _ = balance_response.json()
-                
-                # The microservice is configured for a specific chain
-                # For now, assume it's mainnet unless we can detect otherwise
-                return {
-                    "chainId": 43114,  # Default to mainnet based on .env
-                    "chainName": "Avalanche"
-                }
-        except Exception as e:
-            logger.error(f"Failed to get microservice chain info: {e}")
-            return {"chainId": 43114, "chainName": "Avalanche"}
-        except Exception as e:
-            logger.error(f"Failed to get supported chains: {e}")
-            raise
-    
-    async def get_managed_wallet_addresses(self) -> List[Dict[str, Any]]:
-        """Get AgentChain managed wallet addresses for all supported chains"""
-        try:
-            # Get addresses from the working endpoints
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Get Smart Account address
-                address_response = await client.get(f"{self.microservice_url}/api/swap/address")
-                address_response.raise_for_status()
-                address_data = address_response.json()
-                
-                # Get balance info (which includes EOA address)
-                balance_response = await client.get(f"{self.microservice_url}/api/swap/balance")
-                balance_response.raise_for_status()
-                balance_data = balance_response.json()
-                
-                if not address_data.get("success") or not balance_data.get("success"):
-                    raise Exception("Microservice returned error")
+            self._cache_put("wallet_addresses", wallet_addresses)
+            return [dict(wallet) for wallet in wallet_addresses]
                 
-                # Extract Smart Account address from the result text
-                smart_account = ""
-                address_text = address_data["data"].get("result", "")
-                # Look for addresses in bold markdown format or just hex addresses
-                import re
-                address_matches = re.findall(r'\*\*0x[a-fA-F0-9]{40}\*\*|0x[a-fA-F0-9]{40}', address_text)
-                if address_matches:
-                    # Remove markdown formatting if present
-                    smart_account = address_matches[0].replace('**', '')
-                
-                # Extract EOA address from balance result text
-                balance_text = balance_data["data"].get("result", "")
-                eoa_address = ""
-                # Look for "EOA:" followed by an address or addresses in bold
-                eoa_matches = re.findall(r'EOA:\s*0x[a-fA-F0-9]{40}|\*\*0x[a-fA-F0-9]{40}\*\*', balance_text)
-                if eoa_matches:
-                    # Extract just the address part
-                    eoa_match = eoa_matches[0]
-                    if "EOA:" in eoa_match:
-                        eoa_address = eoa_match.split("EOA:")[-1].strip()
-                    else:
-                        eoa_address = eoa_match.replace('**', '')
-                
-                logger.info(f"Extracted addresses - Smart Account: {smart_account}, EOA: {eoa_address}")
-                
-                # The microservice is currently configured for mainnet (43114)
-                # Return addresses for both chains, but only mainnet will work
-                return [
-                    {
-                        "chainId": 43114,
-                        "chainName": "Avalanche",
-                        "smartAccount": smart_account,
-                        "eoaAddress": eoa_address,
-                        "isActive": True
-                    },
-                    {
-                        "chainId": 43113,
-                        "chainName": "Avalanche Fuji Testnet",
-                        "smartAccount": smart_account,  # Same addresses but different network
-                        "eoaAddress": eoa_address,
-                        "isActive": False  # Mark as inactive since microservice is on mainnet
-                    }
-                ]
-                    
         except Exception as e:
             logger.error(f"Failed to get managed wallet addresses: {e}")
             raise
@@ -131,144 +194,149 @@ class DepositService:
     async def get_managed_wallet_balances(self, chain_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get balances for managed wallets (all chains or specific chain)"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if chain_id:
-                    url = f"{self.microservice_url}/api/balance/{chain_id}"
-                else:
-                    url = f"{self.microservice_url}/api/balance"
+            if chain_id:
+                url = f"/api/balance/{chain_id}"
+            else:
+                url = "/api/balance"
+            
+            data = await self._get_json(url)
+            
+            if data.get("success"):
+                # Normalize single chain response to list format
+                balance_data = data.get("data", [])
+                if chain_id and isinstance(balance_data, dict):
+                    balance_data = [balance_data]
+                return balance_data
+            else:
+                raise Exception(f"Microservice error: {data}")
                 
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("success"):
-                    # Normalize single chain response to list format
-                    balance_data = data.get("data", [])
-                    if chain_id and isinstance(balance_data, dict):
-                        balance_data = [balance_data]
-                    return balance_data
-                else:
-                    raise Exception(f"Microservice error: {data}")
-                    
         except Exception as e:
             logger.error(f"Failed to get managed wallet balances for chain {chain_id}: {e}")
             raise
     
-    async def initialize_managed_wallets_async(self, db: Session) -> None:
+    async def initialize_managed_wallets_async(self, db: AsyncSession) -> None:
         """Initialize managed wallet records in database for all supported chains (async version)"""
         try:
-            # Get supported chains and addresses
-            chains_data = await self.get_supported_chains()
-            addresses_data = await self.get_managed_wallet_addresses()
+            # Re-read addresses from the microservice rather than the cache
+            self.invalidate()
+            
+            # Get supported chains and addresses concurrently
+            chains_data, addresses_data = await asyncio.gather(
+                self.get_supported_chains(),
+                self.get_managed_wallet_addresses()
+            )
             
             # Create a mapping of chain_id to addresses
             chain_addresses = {addr["chainId"]: addr for addr in addresses_data}
             
+            # Chains that already have a managed wallet, fetched once up front
+            result = await db.execute(select(ManagedWallet.chain_id).distinct())
+            existing_chain_ids = set(result.scalars().all())
+            
+            # One deposit wallet per missing chain, keyed by the Smart Account address
+            rows = []
             for chain in chains_data:
-                chain_id = chain["chainId"]
-                
-                # Check if managed wallet already exists
-                existing_wallet = db.query(ManagedWallet).filter(
-                    ManagedWallet.chain_id == chain_id
-                ).first()
+                if chain["chainId"] in existing_chain_ids:
+                    continue
+                addr_data = chain_addresses.get(chain["chainId"])
+                if addr_data and addr_data.get("smartAccount"):
+                    rows.append({
+                        "wallet_address": addr_data["smartAccount"],
+                        "chain_id": chain["chainId"],
+                        "wallet_type": "deposit",
+                        "is_active": True
+                    })
+            
+            if rows:
+                # Single multi-row insert; chains with a wallet were filtered out above,
+                # so no conflict target (and no unique index) is needed
+                db.add_all([ManagedWallet(**row) for row in rows])
                 
-                if not existing_wallet and chain_id in chain_addresses:
-                    addr_data = chain_addresses[chain_id]
-                    
-                    # Create new managed wallet record using Smart Account address
-                    smart_account = addr_data.get("smartAccount", "")
-                    if smart_account:
-                        managed_wallet = ManagedWallet(
-                            wallet_address=smart_account,
-                            chain_id=chain_id,
-                            wallet_type="deposit",
-                            is_active=True,
-                            created_at=datetime.utcnow()
-                        )
-                        
-                        db.add(managed_wallet)
-                        logger.info(f"Initialized managed wallet {smart_account} for {chain['name']} (chain {chain_id})")
+                chain_names = {chain["chainId"]: chain["name"] for chain in chains_data}
+                for row in rows:
+                    logger.info(f"Initialized managed wallet {row['wallet_address']} for {chain_names[row['chain_id']]} (chain {row['chain_id']})")
             
-            db.commit()
+            await db.commit()
+            self.invalidate()
             logger.info("Managed wallet initialization complete")
             
         except Exception as e:
-            db.rollback()
-            logger.error(f"Failed to initialize managed wallets: {e}")
-            raise
-    
-    def initialize_managed_wallets(self, db: Session) -> None:
-        """Initialize managed wallet records in database for all supported chains (sync wrapper)"""
-        try:
-            # Use a new event loop for this operation
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.initialize_managed_wallets_async(db))
-            finally:
-                loop.close()
-                
-        except Exception as e:
+            await db.rollback()
             logger.error(f"Failed to initialize managed wallets: {e}")
             raise
     
-    def get_user_deposit_address(self, db: Session, user_wallet_address: str, chain_id: int) -> Optional[str]:
+    async def get_user_deposit_address(self, db: AsyncSession, user_wallet_address: str, chain_id: int) -> Optional[str]:
         """Get the deposit address for a user on a specific chain"""
         try:
-            # Get or create user wallet record
-            user_wallet = db.query(UserWallet).filter(
-                UserWallet.user_wallet_address == user_wallet_address.lower()
-            ).first()
-            
-            if not user_wallet:
-                user_wallet = UserWallet(
-                    user_wallet_address=user_wallet_address.lower(),
-                    is_active=True,
-                    created_at=datetime.utcnow()
+            # Get or create user wallet record (skipped for wallets already seen)
+            if user_wallet_address in self._user_wallet_ids:
+                self._user_wallet_ids.move_to_end(user_wallet_address)
+            else:
+                result = await db.execute(
+                    select(UserWallet).where(UserWallet.user_wallet_address == user_wallet_address)
                 )
-                db.add(user_wallet)
-                db.commit()
+                user_wallet = result.scalars().first()
+                
+                if not user_wallet:
+                    user_wallet = UserWallet(
+                        user_wallet_address=user_wallet_address,
+                        is_active=True
+                    )
+                    db.add(user_wallet)
+                    await db.commit()
+                
+                self._remember_user_wallet(user_wallet_address, user_wallet.id)
             
             # Get managed wallet for the chain
-            managed_wallet = db.query(ManagedWallet).filter(
-                and_(
-                    ManagedWallet.chain_id == chain_id,
-                    ManagedWallet.is_active
+            managed_address = self._managed_wallet_cache.get(chain_id)
+            if managed_address is None:
+                result = await db.execute(
+                    select(ManagedWallet).where(
+                        and_(
+                            ManagedWallet.chain_id == chain_id,
+                            ManagedWallet.is_active
+                        )
+                    )
                 )
-            ).first()
-            
-            if not managed_wallet:
-                raise Exception(f"No managed wallet available for chain {chain_id}")
+                managed_wallet = result.scalars().first()
+                
+                if not managed_wallet:
+                    raise Exception(f"No managed wallet available for chain {chain_id}")
+                
+                managed_address = managed_wallet.wallet_address
+                self._managed_wallet_cache[chain_id] = managed_address
             
             # For now, all users deposit to the same managed wallet
             # In a production system, you might want user-specific deposit addresses
-            return managed_wallet.wallet_address
+            return managed_address
             
         except Exception as e:
             logger.error(f"Failed to get deposit address for user {user_wallet_address} on chain {chain_id}: {e}")
             raise
     
-    def record_deposit(self, db: Session, user_wallet_address: str, chain_id: int, 
-                      token_symbol: str, amount: str, tx_hash: str) -> UserDeposit:
+    async def record_deposit(self, db: AsyncSession, user_wallet_address: str, chain_id: int, 
+                             token_symbol: str, amount: str, tx_hash: str) -> UserDeposit:
         """Record a user deposit transaction"""
         try:
-            # Get user wallet
-            user_wallet = db.query(UserWallet).filter(
-                UserWallet.user_wallet_address == user_wallet_address.lower()
-            ).first()
+            # Get user wallet and the chain's managed wallet in one round-trip; the
+            # outer join keeps the user row when no managed wallet is available
+            result = await db.execute(
+                select(UserWallet, ManagedWallet).outerjoin(
+                    ManagedWallet,
+                    and_(
+                        ManagedWallet.chain_id == chain_id,
+                        ManagedWallet.is_active
+                    )
+                ).where(
+                    UserWallet.user_wallet_address == user_wallet_address
+                ).limit(1)
+            )
+            row = result.first()
             
-            if not user_wallet:
+            if not row:
                 raise Exception(f"User wallet {user_wallet_address} not found")
             
-            # Get managed wallet
-            managed_wallet = db.query(ManagedWallet).filter(
-                and_(
-                    ManagedWallet.chain_id == chain_id,
-                    ManagedWallet.is_active
-                )
-            ).first()
-            
+            user_wallet, managed_wallet = row
             if not managed_wallet:
                 raise Exception(f"No managed wallet available for chain {chain_id}")
             
@@ -279,122 +347,125 @@ class DepositService:
                 chain_id=chain_id,
                 token_symbol=token_symbol.upper(),
                 amount=amount,
-                transaction_hash=tx_hash.lower(),
-                from_address=user_wallet_address.lower(),
+                transaction_hash=tx_hash,
+                from_address=user_wallet_address,
                 to_address=managed_wallet.wallet_address.lower(),
-                status="pending",
-                created_at=datetime.utcnow()
+                status="pending"
             )
             
             db.add(deposit)
-            db.commit()
+            await db.commit()
             
             logger.info(f"Recorded deposit: {amount} {token_symbol} from {user_wallet_address} on chain {chain_id}")
             return deposit
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to record deposit: {e}")
             raise
     
-    def update_deposit_status(self, db: Session, tx_hash: str, status: str, 
-                             confirmed_at: Optional[datetime] = None) -> Optional[UserDeposit]:
+    async def update_deposit_status(self, db: AsyncSession, tx_hash: str, status: str, 
+                                    confirmed_at: Optional[datetime] = None) -> Optional[UserDeposit]:
         """Update the status of a deposit transaction"""
         try:
-            deposit = db.query(UserDeposit).filter(
-                UserDeposit.transaction_hash == tx_hash.lower()
-            ).first()
+            values = {"status": status}
+            if confirmed_at:
+                values["confirmed_at"] = confirmed_at
+            
+            # Apply the change and read the row back in one statement
+            result = await db.execute(
+                update(UserDeposit)
+                .where(UserDeposit.transaction_hash == tx_hash)
+                .values(**values)
+                .returning(UserDeposit)
+            )
+            deposit = result.scalar_one_or_none()
             
             if not deposit:
                 logger.warning(f"Deposit with tx_hash {tx_hash} not found")
                 return None
             
-            deposit.status = status
-            if confirmed_at:
-                deposit.confirmed_at = confirmed_at
-            
-            db.commit()
-            
-            # Update user balance if confirmed
+            # Update user balance if confirmed (its commit covers the status change too)
             if status == "confirmed":
-                self._update_user_balance(db, deposit)
+                await self._update_user_balance(db, deposit)
+            else:
+                await db.commit()
             
             logger.info(f"Updated deposit {tx_hash} status to {status}")
             return deposit
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to update deposit status for {tx_hash}: {e}")
             raise
     
-    def _update_user_balance(self, db: Session, deposit: UserDeposit) -> None:
+    async def _update_user_balance(self, db: AsyncSession, deposit: UserDeposit) -> None:
         """Update user balance after confirmed deposit"""
         try:
-            # Get or create user balance record
-            user_balance = db.query(UserBalance).filter(
-                and_(
-                    UserBalance.user_wallet_id == deposit.user_wallet_id,
-                    UserBalance.chain_id == deposit.chain_id,
-                    UserBalance.token_symbol == deposit.token_symbol
-                )
-            ).first()
-            
-            if not user_balance:
-                user_balance = UserBalance(
+            # Make sure the balance row exists (unique_user_token_balance makes this
+            # race-free), then lock it and add in Decimal so no float math is involved
+            amount = Decimal(str(deposit.amount))
+            dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+            await db.execute(
+                dialect.insert(UserBalance).values(
                     user_wallet_id=deposit.user_wallet_id,
                     chain_id=deposit.chain_id,
                     token_symbol=deposit.token_symbol,
-                    balance="0",
-                    updated_at=datetime.utcnow()
+                    total_deposited=Decimal("0"),
+                    total_withdrawn=Decimal("0"),
+                    available_balance=Decimal("0"),
+                    locked_balance=Decimal("0")
+                ).on_conflict_do_nothing(
+                    index_elements=['user_wallet_id', 'chain_id', 'token_symbol']
                 )
-                db.add(user_balance)
-            
-            # Add deposit amount to balance
-            current_balance = float(user_balance.balance)
-            deposit_amount = float(deposit.amount)
-            new_balance = current_balance + deposit_amount
+            )
             
-            user_balance.balance = str(new_balance)
-            user_balance.updated_at = datetime.utcnow()
+            balance = await db.scalar(
+                select(UserBalance).where(
+                    and_(
+                        UserBalance.user_wallet_id == deposit.user_wallet_id,
+                        UserBalance.chain_id == deposit.chain_id,
+                        UserBalance.token_symbol == deposit.token_symbol
+                    )
+                ).with_for_update()
+            )
+            balance.total_deposited = (balance.total_deposited or Decimal("0")) + amount
+            balance.available_balance = (balance.available_balance or Decimal("0")) + amount
+            balance.last_updated = datetime.utcnow()
+            new_balance = balance.available_balance
             
-            db.commit()
+            await db.commit()
             
             logger.info(f"Updated user balance: {deposit.token_symbol} balance now {new_balance}")
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Failed to update user balance: {e}")
             raise
     
-    def get_user_balances(self, db: Session, user_wallet_address: str) -> List[Dict[str, Any]]:
+    async def get_user_balances(self, db: AsyncSession, user_wallet_address: str) -> List[Dict[str, Any]]:
         """Get all balances for a user across all chains"""
         try:
-            user_wallet = db.query(UserWallet).filter(
-                UserWallet.user_wallet_address == user_wallet_address.lower()
-            ).first()
-            
-            if not user_wallet:
-                return []
-            
-            balances = db.query(UserBalance).filter(
-                UserBalance.user_wallet_id == user_wallet.id
-            ).all()
-            
-            result = []
-            for balance in balances:
-                managed_wallet = db.query(ManagedWallet).filter(
-                    ManagedWallet.id == balance.managed_wallet_id
-                ).first()
-                
-                result.append({
+            # One joined query instead of a wallet lookup plus one query per balance
+            result = await db.execute(
+                select(UserBalance).join(
+                    UserWallet, UserWallet.id == UserBalance.user_wallet_id
+                ).where(
+                    UserWallet.user_wallet_address == user_wallet_address
+                )
+            )
+            balances = result.scalars().all()
+            
+            return [
+                {
                     "chain_id": balance.chain_id,
-                    "chain_name": managed_wallet.chain_name if managed_wallet else "Unknown",
+                    "chain_name": _CHAIN_NAMES.get(balance.chain_id, "Unknown"),
                     "token_symbol": balance.token_symbol,
-                    "balance": balance.balance,
-                    "updated_at": balance.updated_at.isoformat()
-                })
-            
-            return result
+                    "balance": str(balance.available_balance or 0),
+                    "updated_at": balance.last_updated.isoformat() if balance.last_updated else ""
+                }
+                for balance in balances
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get user balances for {user_wallet_address}: {e}")
@@ -1,13 +1,22 @@
 import os
 import re
-import math
-import hashlib
+import asyncio
+import time
 import logging
+import threading
+import numpy as np
 from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import urlparse
 from typing import Dict, List, Any, Optional, Tuple
-from groq import Groq
-from textblob import TextBlob
+from groq import AsyncGroq
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from datasketch import MinHash, MinHashLSH
+import ahocorasick
+import xxhash
+import tldextract
 import json
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 
 from ..utils.resilience import (
@@ -15,12 +24,44 @@ from ..utils.resilience import (
     RetryConfig,
     CircuitBreakerConfig,
     get_circuit_breaker,
-    with_rate_limit,
+    RateLimiter,
     fallback_cache
 )
 
 logger = logging.getLogger(__name__)
 
+# MinHash parameters for near-duplicate novelty
+MINHASH_PERMUTATIONS = 64
+MINHASH_LSH_THRESHOLD = 0.8
+
+# Bundled public suffix snapshot only; never fetch the list over the network
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+
+def _numeric_features_kernel(
+    age_seconds: np.ndarray,
+    decay_override: np.ndarray,
+    trusts: np.ndarray,
+    novelty: np.ndarray,
+    proof: np.ndarray,
+    tau_seconds: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Recency decay exp(-Δt / τ) and final weight; negative overrides mean 'compute'"""
+    decay = np.clip(np.exp(-age_seconds / tau_seconds), 0.01, 1.0)
+    decay = np.where(decay_override < 0, decay, decay_override)
+    return decay, trusts * decay * novelty * proof
+
+
+def _content_fingerprint(text: str) -> int:
+    """128-bit content fingerprint for duplicate detection"""
+    return xxhash.xxh3_128_intdigest(text.encode())
+
+
+def _classification_cache_key(title: str, content: str) -> str:
+    """Fallback-cache key for an article's event classification"""
+    content_to_hash = f"{title[:100]} {content[:500]}"
+    return f"event_classification:{xxhash.xxh3_64_hexdigest(content_to_hash.encode())}"
+
 @dataclass
 class ArticleFeatures:
     """Container for extracted article features"""
@@ -41,6 +82,33 @@ class FeatureExtractor:
         "funding", "tech", "market-note", "op-ed"
     ]
     
+    # Keyword rules for the rule-based fallback classification
+    CLASSIFICATION_RULES = {
+        "listing": ["listing", "listed", "trading pair", "exchange", "available on"],
+        "partnership": ["partnership", "partner", "collaboration", "integrate", "alliance"],
+        "hack": ["hack", "exploit", "breach", "attack", "stolen", "drained"],
+        "depeg": ["depeg", "peg", "stable", "unstable", "depegged"],
+        "regulatory": ["regulation", "regulatory", "sec", "government", "legal", "compliance"],
+        "funding": ["funding", "investment", "raised", "round", "capital", "investor"],
+        "tech": ["update", "upgrade", "launch", "release", "technical", "development"],
+        "market-note": ["price", "trading", "market", "analysis", "chart", "technical analysis"],
+        "op-ed": ["opinion", "editorial", "commentary", "think", "believe", "analysis"]
+    }
+    
+    # Articles the keyword rules classify without the LLM: short bodies, or a
+    # top event with enough hits that clearly outscores the runner-up
+    RULES_SHORT_CONTENT_CHARS = 300
+    RULES_MIN_HITS = 3
+    RULES_CONFIDENCE_RATIO = 2.0
+    
+    # Heuristic defaults, checked in priority order when all classification fails
+    DEFAULT_RULES = [
+        ("market-note", ["price", "trading", "chart", "analysis", "market"]),
+        ("hack", ["hack", "exploit", "breach", "stolen"]),
+        ("partnership", ["partnership", "partner", "collaboration"]),
+        ("listing", ["listing", "exchange", "trading pair"]),
+    ]
+    
     # Source trust mapping
     SOURCE_TRUST_MAP = {
         # High trust - Official sources, major exchanges
@@ -75,9 +143,23 @@ class FeatureExtractor:
         if not api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
         
-        self.groq_client = Groq(api_key=api_key)
+        # Async client so concurrent classifications overlap instead of blocking the loop
+        self.groq_client = AsyncGroq(api_key=api_key)
         self.model_name = os.getenv("MODEL_DRAFT", "llama-3.1-8b-instant")
         
+        # In-flight Groq requests per batch (8 keeps a 500 RPM tier under its limit)
+        self.max_concurrency = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+        
+        # Proactive pacing to stay under Groq's request/token limits rather than
+        # reacting to 429s; the TPM bucket is only used when GROQ_TPM is set
+        groq_rpm = float(os.getenv("GROQ_RPM", "120"))
+        self._groq_bucket = RateLimiter(rate=groq_rpm / 60, burst=5)
+        groq_tpm = os.getenv("GROQ_TPM")
+        self._groq_tpm_bucket = (
+            RateLimiter(rate=int(groq_tpm) / 60, burst=int(groq_tpm))
+            if groq_tpm else None
+        )
+        
         # Initialize circuit breaker for Groq API with adjusted parameters
         self.circuit_breaker = get_circuit_breaker(
             "groq_api",
@@ -97,8 +179,23 @@ class FeatureExtractor:
             jitter=True
         )
         
-        # Cache for content hashes to detect duplicates
-        self.content_hashes = set()
+        # Recency decay time constant (12h), precomputed in seconds
+        self._recency_tau_seconds = 12.0 * 3600
+        
+        # Memoized site name / hostname -> trust; feeds repeat the same few sources
+        # (full article URLs are unique, so they are never part of the key)
+        self._trust_for = lru_cache(maxsize=4096)(self._compute_source_trust)
+        
+        # Lexicon-based sentiment analyzer, built once
+        self._vader = SentimentIntensityAnalyzer()
+        
+        # Bounded LRU of content fingerprints (128-bit ints) to detect duplicates,
+        # mapped to each article's MinHash for near-duplicate detection
+        self.content_hashes: "OrderedDict[int, MinHash]" = OrderedDict()
+        self._novelty_capacity = int(os.getenv("NOVELTY_LRU", "100000"))
+        self._novelty_lsh = self._new_novelty_lsh()
+        # Novelty runs in worker threads, so index access is serialized
+        self._novelty_lock = threading.Lock()
         
         # Regex patterns for proof signals
         self.contract_patterns = [
@@ -115,11 +212,60 @@ class FeatureExtractor:
             r'ftmscan\.com'
         ]
         
+        # All proof patterns fused into one case-insensitive scan
+        self._proof_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.contract_patterns + self.scanner_patterns),
+            re.IGNORECASE
+        )
+        
+        # Keyword -> event types it scores for ("analysis" counts for two), and
+        # the default heuristics as frozensets for disjointness checks
+        self._keyword_events: Dict[str, Tuple[str, ...]] = {}
+        for event_type, rules in self.CLASSIFICATION_RULES.items():
+            for kw in rules:
+                self._keyword_events[kw] = self._keyword_events.get(kw, ()) + (event_type,)
+        self._default_rule_sets = [
+            (event_type, frozenset(rules)) for event_type, rules in self.DEFAULT_RULES
+        ]
+        
+        # Single-pass keyword scanner shared by the fallback classifiers
+        keywords = sorted(
+            {kw for rules in self.CLASSIFICATION_RULES.values() for kw in rules}
+            | {kw for _, rules in self.DEFAULT_RULES for kw in rules}
+        )
+        self._keyword_automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            self._keyword_automaton.add_word(kw, kw)
+        self._keyword_automaton.make_automaton()
+        
+    def _scan_keywords(self, text_lower: str) -> Counter:
+        """Count occurrences of every rule keyword in one pass over the text"""
+        return Counter(kw for _, kw in self._keyword_automaton.iter(text_lower))
+    
+    def _rule_scores(self, title: str, content: str) -> Dict[str, int]:
+        """Keyword hit counts per event type"""
+        scores = dict.fromkeys(self.CLASSIFICATION_RULES, 0)
+        # Only keywords actually present are visited, not every rule keyword
+        for keyword, count in self._scan_keywords(f"{title} {content}".lower()).items():
+            for event_type in self._keyword_events.get(keyword, ()):
+                scores[event_type] += count
+        return scores
+    
+    def _normalize_rule_scores(self, scores: Dict[str, int]) -> Dict[str, float]:
+        """Keyword hit counts as a probability distribution"""
+        total_score = sum(scores.values())
+        if total_score > 0:
+            return {k: v / total_score for k, v in scores.items()}
+        
+        # Default to market-note if no keywords match
+        result = {event: 0.0 for event in self.EVENT_TYPES}
+        result["market-note"] = 1.0
+        return result
+    
     def _get_fallback_event_classification(self, title: str, content: str) -> Dict[str, float]:
         """Get cached or rule-based event classification as fallback"""
         # Create cache key from content hash
-        content_to_hash = f"{title[:100]} {content[:500]}"
-        cache_key = f"event_classification:{hashlib.md5(content_to_hash.encode()).hexdigest()}"
+        cache_key = _classification_cache_key(title, content)
         
         # Check cache first
         cached_result = fallback_cache.get(cache_key)
@@ -128,37 +274,10 @@ class FeatureExtractor:
             return cached_result
         
         # Rule-based fallback classification
-        text_lower = f"{title} {content}".lower()
-        
-        # Simple keyword-based classification
-        classification_rules = {
-            "listing": ["listing", "listed", "trading pair", "exchange", "available on"],
-            "partnership": ["partnership", "partner", "collaboration", "integrate", "alliance"],
-            "hack": ["hack", "exploit", "breach", "attack", "stolen", "drained"],
-            "depeg": ["depeg", "peg", "stable", "unstable", "depegged"],
-            "regulatory": ["regulation", "regulatory", "sec", "government", "legal", "compliance"],
-            "funding": ["funding", "investment", "raised", "round", "capital", "investor"],
-            "tech": ["update", "upgrade", "launch", "release", "technical", "development"],
-            "market-note": ["price", "trading", "market", "analysis", "chart", "technical analysis"],
-            "op-ed": ["opinion", "editorial", "commentary", "think", "believe", "analysis"]
-        }
-        
-        scores = {}
-        for event_type, keywords in classification_rules.items():
-            score = sum(text_lower.count(keyword) for keyword in keywords)
-            scores[event_type] = score
-        
-        # Normalize scores
-        total_score = sum(scores.values())
-        if total_score > 0:
-            result = {k: v / total_score for k, v in scores.items()}
-        else:
-            # Default to market-note if no keywords match
-            result = {event: 0.0 for event in self.EVENT_TYPES}
-            result["market-note"] = 1.0
-        
-        # Cache the result
-        fallback_cache.set(cache_key, result, ttl=3600)  # 1 hour
+        result = self._normalize_rule_scores(self._rule_scores(title, content))
+        
+        # Not cached: the cache holds LLM results, which _classify_event serves
+        # ahead of Groq, and the single keyword scan is cheap to repeat
         logger.info("Using rule-based event classification fallback")
         
         return result
@@ -174,57 +293,142 @@ class FeatureExtractor:
         Returns:
             ArticleFeatures object with all extracted features
         """
-        try:
-            # Extract basic information
-            title = article_data.get("title", "")
-            content = article_data.get("clean_content", article_data.get("content", ""))
-            site_name = article_data.get("site_name", "")
-            published_at = article_data.get("published_at")
-            url = article_data.get("url", "")
-            
-            # 1. Event Classification
-            event_probs = await self._classify_event(title, content)
-            
-            # 2. Token-aware Sentiment Analysis
-            sentiment_score = self._analyze_sentiment(title, content, token)
-            
-            # 3. Source Trust Score
-            source_trust = self._get_source_trust(site_name, url)
-            
-            # 4. Recency Decay
-            recency_decay = self._calculate_recency_decay(published_at)
-            
-            # 5. Novelty Score (duplicate detection)
-            novelty_score = self._calculate_novelty(content)
-            
-            # 6. Proof Bonus (contract/scanner links)
-            proof_bonus = self._detect_proof_signals(content, url)
-            
-            # 7. Final Weight Calculation
-            final_weight = source_trust * recency_decay * novelty_score * proof_bonus
+        return (await self.extract_features_batch([article_data], token))[0]
+    
+    def _default_features(self) -> ArticleFeatures:
+        """Default features used when extraction fails"""
+        return ArticleFeatures(
+            event_probs={event: 0.0 for event in self.EVENT_TYPES},
+            sentiment_score=0.0,
+            source_trust=0.5,
+            recency_decay=0.1,
+            novelty_score=1.0,
+            proof_bonus=1.0,
+            final_weight=0.05
+        )
+    
+    async def _extract_base_features(
+        self, 
+        article_data: Dict[str, Any], 
+        token: str
+    ) -> Tuple[ArticleFeatures, float, float]:
+        """
+        Extract per-article features; recency decay and final weight are left
+        for the numeric batch pass
+        
+        Returns:
+            (features, published timestamp, recency decay override)
+        """
+        # Extract basic information
+        title = article_data.get("title", "")
+        content = article_data.get("clean_content", article_data.get("content", ""))
+        site_name = article_data.get("site_name", "")
+        published_at = article_data.get("published_at")
+        url = article_data.get("url", "")
+        
+        # 1. Event Classification, overlapped with the CPU-bound features in
+        # worker threads: 2. Token-aware Sentiment Analysis, 5. Novelty Score
+        # (duplicate detection) and 6. Proof Bonus (contract/scanner links)
+        event_probs, sentiment_score, novelty_score, proof_bonus = await asyncio.gather(
+            self._classify_event(title, content),
+            asyncio.to_thread(self._analyze_sentiment, title, content, token),
+            asyncio.to_thread(self._calculate_novelty, content),
+            asyncio.to_thread(self._detect_proof_signals, content, url)
+        )
+        
+        # 3. Source Trust Score
+        source_trust = self._get_source_trust(site_name, url)
+        
+        # 4. Recency Decay inputs
+        published_ts, decay_override = self._recency_inputs(published_at)
+        
+        features = ArticleFeatures(
+            event_probs=event_probs,
+            sentiment_score=sentiment_score,
+            source_trust=source_trust,
+            recency_decay=0.0,
+            novelty_score=novelty_score,
+            proof_bonus=proof_bonus,
+            final_weight=0.0
+        )
+        return features, published_ts, decay_override
+    
+    async def extract_features_batch(
+        self, 
+        articles: List[Dict[str, Any]], 
+        token: str
+    ) -> List[ArticleFeatures]:
+        """
+        Extract features for many articles concurrently
+        
+        Args:
+            articles: Raw article data dicts from MCP scraping
+            token: Token symbol being analyzed
             
-            return ArticleFeatures(
-                event_probs=event_probs,
-                sentiment_score=sentiment_score,
-                source_trust=source_trust,
-                recency_decay=recency_decay,
-                novelty_score=novelty_score,
-                proof_bonus=proof_bonus,
-                final_weight=final_weight
+        Returns:
+            ArticleFeatures for each article, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _bounded(article_data: Dict[str, Any]) -> Tuple[ArticleFeatures, float, float]:
+            async with semaphore:
+                return await self._extract_base_features(article_data, token)
+        
+        results = await asyncio.gather(
+            *[_bounded(article) for article in articles], return_exceptions=True
+        )
+        
+        features_list: List[ArticleFeatures] = []
+        extracted = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error extracting features: {result}")
+                # Return default features on error
+                features_list.append(self._default_features())
+            else:
+                features_list.append(result[0])
+                extracted.append(result)
+        
+        # 7. Recency decay and final weight for the whole batch in one kernel call
+        if extracted:
+            decay, final = self.extract_numeric_features_batch(
+                np.array([published_ts for _, published_ts, _ in extracted], dtype=np.float64),
+                np.array([f.source_trust for f, _, _ in extracted], dtype=np.float64),
+                np.array([f.novelty_score for f, _, _ in extracted], dtype=np.float64),
+                np.array([f.proof_bonus for f, _, _ in extracted], dtype=np.float64),
+                np.array([override for _, _, override in extracted], dtype=np.float64)
             )
+            for (features, _, _), recency_decay, final_weight in zip(extracted, decay, final):
+                features.recency_decay = float(recency_decay)
+                features.final_weight = float(final_weight)
+        
+        return features_list
+    
+    def extract_numeric_features_batch(
+        self,
+        timestamps: np.ndarray,
+        trusts: np.ndarray,
+        novelty: np.ndarray,
+        proof: np.ndarray,
+        decay_override: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized recency decay and final weight
+        
+        Args:
+            timestamps: Publish times as Unix seconds
+            trusts, novelty, proof: Per-article feature arrays
+            decay_override: Fixed decay per article; negative entries are computed
             
-        except Exception as e:
-            logger.error(f"Error extracting features: {e}")
-            # Return default features on error
-            return ArticleFeatures(
-                event_probs={event: 0.0 for event in self.EVENT_TYPES},
-                sentiment_score=0.0,
-                source_trust=0.5,
-                recency_decay=0.1,
-                novelty_score=1.0,
-                proof_bonus=1.0,
-                final_weight=0.05
-            )
+        Returns:
+            (recency_decay, final_weight) arrays
+        """
+        if decay_override is None:
+            decay_override = np.full(timestamps.shape[0], -1.0)
+        age_seconds = time.time() - timestamps
+        return _numeric_features_kernel(
+            age_seconds, decay_override, trusts, novelty, proof, self._recency_tau_seconds
+        )
     
     @retry_with_fallback(
         config=RetryConfig(max_attempts=2, base_delay=2.0, max_delay=8.0),
@@ -237,7 +441,7 @@ class FeatureExtractor:
         text_to_classify = f"Title: {title}\n\nContent: {content[:1000]}..."
         
         # Create a cleaner, more focused prompt
-        prompt = f"""Classify this crypto article into event types. Return ONLY valid JSON.
+        prompt = f"""Classify this crypto article into event types.
 
 Article Title: {title[:200]}
 Content: {content[:800]}
@@ -253,68 +457,35 @@ Event Types:
 - market-note: Market analysis, price movements
 - op-ed: Opinion pieces, editorials
 
-Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
-{{"listing": 0.0, "partnership": 0.0, "hack": 0.0, "depeg": 0.0, "regulatory": 0.0, "funding": 0.0, "tech": 0.0, "market-note": 0.0, "op-ed": 0.0}}"""
+Return a JSON object mapping every event type to a probability (0.0-1.0, summing to 1.0)."""
+        
+        # Nine short floats fit comfortably in 120 completion tokens
+        max_tokens = 120
         
         try:
-            response = self.groq_client.chat.completions.create(
+            # Pace every attempt (including retries) before it reaches the API
+            await self._groq_bucket.wait_for_token(1)
+            if self._groq_tpm_bucket is not None:
+                # ~4 characters per token for the prompt, plus the completion budget
+                await self._groq_tpm_bucket.wait_for_token(len(prompt) // 4 + max_tokens)
+            
+            response = await self.groq_client.chat.completions.create(
                 model=self.model_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=300,  # Increase token limit slightly
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},  # Server-side guaranteed JSON
                 timeout=30  # Add timeout
             )
             
-            # Parse the JSON response with better error handling
-            result_text = response.choices[0].message.content
+            result_text = (response.choices[0].message.content or "").strip()
             if not result_text:
                 raise ValueError("Empty response from Groq API")
-                
-            result_text = result_text.strip()
             logger.debug(f"Raw Groq response: {result_text[:200]}...")
             
-            # Extract JSON from response with improved regex
-            json_patterns = [
-                r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}',  # Better nested JSON matching
-                r'\{.*?"op-ed":\s*[\d.]+.*?\}',      # Look for the last key as anchor
-                r'\{(?:[^{}]++|\{(?:[^{}]++|\{[^{}]*+\})*+\})*+\}'  # Recursive pattern
-            ]
-            
-            parsed_json = None
-            for pattern in json_patterns:
-                json_matches = re.findall(pattern, result_text, re.DOTALL)
-                if json_matches:
-                    # Try each match until we find valid JSON
-                    for match in json_matches:
-                        try:
-                            parsed_json = json.loads(match)
-                            break
-                        except json.JSONDecodeError:
-                            continue
-                    if parsed_json:
-                        break
-            
-            if not parsed_json:
-                # Try to parse the entire response as JSON
-                try:
-                    parsed_json = json.loads(result_text)
-                except json.JSONDecodeError:
-                    raise ValueError(f"No valid JSON found in response: {result_text}")
-            
-            # Validate response structure
-            if not isinstance(parsed_json, dict):
-                raise ValueError("Response is not a JSON object")
-            
-            # Check if all required event types are present
-            missing_events = set(self.EVENT_TYPES) - set(parsed_json.keys())
-            if missing_events:
-                logger.warning(f"Missing event types in response: {missing_events}")
-                # Add missing events with 0.0 probability
-                for event in missing_events:
-                    parsed_json[event] = 0.0
-            
-            # Remove any extra keys not in EVENT_TYPES
-            event_probs = {k: v for k, v in parsed_json.items() if k in self.EVENT_TYPES}
+            # JSON mode guarantees a JSON object; keep only known event types
+            parsed_json = json.loads(result_text)
+            event_probs = {event: parsed_json.get(event, 0.0) for event in self.EVENT_TYPES}
             
             # Validate probability values
             for event, prob in event_probs.items():
@@ -337,8 +508,7 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
             raise api_error
         
         # Cache successful result
-        content_to_hash = f"{title[:100]} {content[:500]}"
-        cache_key = f"event_classification:{hashlib.md5(content_to_hash.encode()).hexdigest()}"
+        cache_key = _classification_cache_key(title, content)
         fallback_cache.set(cache_key, event_probs, ttl=3600)  # 1 hour
         
         return event_probs
@@ -351,12 +521,23 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
                 logger.warning("Empty title and content, using fallback classification")
                 return self._get_fallback_event_classification("", "")
             
-            if len(title + content) < 50:
-                logger.warning("Very short content, using fallback classification")
-                return self._get_fallback_event_classification(title, content)
+            # Repeat content (syndicated reprints, re-crawls) skips the LLM entirely
+            cached_result = fallback_cache.get(_classification_cache_key(title, content))
+            if cached_result:
+                logger.debug("Using cached event classification")
+                return cached_result
+            
+            # Short blurbs and unambiguous articles are classified by the keyword rules
+            rule_scores = self._rule_scores(title, content)
+            top, runner_up = sorted(rule_scores.values(), reverse=True)[:2]
+            if len(content) < self.RULES_SHORT_CONTENT_CHARS or (
+                top >= self.RULES_MIN_HITS and top > self.RULES_CONFIDENCE_RATIO * runner_up
+            ):
+                logger.debug("Rule-based classification is sufficient, skipping Groq")
+                return self._normalize_rule_scores(rule_scores)
             
-            # Apply rate limiting and circuit breaker
-            return await with_rate_limit("groq", self._classify_event_with_retry, title, content)
+            # Rate limiting happens inside the retried call; circuit breaker via decorator
+            return await self._classify_event_with_retry(title, content)
             
         except Exception as e:
             logger.error(f"Event classification failed: {e}")
@@ -376,53 +557,45 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
     
     def _get_intelligent_default_classification(self, title: str, content: str) -> Dict[str, float]:
         """Get an intelligent default classification based on simple heuristics"""
-        text = f"{title} {content}".lower()
+        keyword_counts = self._scan_keywords(f"{title} {content}".lower())
         
         # Simple heuristics for better defaults than uniform distribution
-        if any(word in text for word in ["price", "trading", "chart", "analysis", "market"]):
-            return {event: 0.0 if event != "market-note" else 1.0 for event in self.EVENT_TYPES}
-        elif any(word in text for word in ["hack", "exploit", "breach", "stolen"]):
-            return {event: 0.0 if event != "hack" else 1.0 for event in self.EVENT_TYPES}
-        elif any(word in text for word in ["partnership", "partner", "collaboration"]):
-            return {event: 0.0 if event != "partnership" else 1.0 for event in self.EVENT_TYPES}
-        elif any(word in text for word in ["listing", "exchange", "trading pair"]):
-            return {event: 0.0 if event != "listing" else 1.0 for event in self.EVENT_TYPES}
-        else:
-            # Default to market-note for unknown content
-            return {event: 0.0 if event != "market-note" else 1.0 for event in self.EVENT_TYPES}
+        default_event = "market-note"  # Default for unknown content
+        for event_type, keywords in self._default_rule_sets:
+            if not keywords.isdisjoint(keyword_counts):
+                default_event = event_type
+                break
+        return {event: 0.0 if event != default_event else 1.0 for event in self.EVENT_TYPES}
     
     def _analyze_sentiment(self, title: str, content: str, token: str) -> float:
         """Analyze token-aware sentiment"""
         try:
-            # Focus on paragraphs mentioning the token
-            token_mentions = []
+            # VADER compound score in [-1, 1], averaged over token mentions
+            polarity_scores = self._vader.polarity_scores
+            token_lc = token.lower()
+            total, weight = 0.0, 0.0
             
             # Check title (weight 2x)
-            if token.lower() in title.lower():
-                token_mentions.append(title)
-                token_mentions.append(title)  # Add twice for 2x weight
+            if token_lc in title.lower() and title.strip():
+                total += 2 * polarity_scores(title)["compound"]
+                weight += 2
             
-            # Find paragraphs with token mentions
-            paragraphs = content.split('\n')
-            for para in paragraphs:
-                if token.lower() in para.lower() and len(para.strip()) > 50:
-                    token_mentions.append(para.strip())
+            # Focus on paragraphs mentioning the token
+            for para in content.splitlines():
+                if token_lc in para.lower():
+                    para = para.strip()
+                    if len(para) > 50:
+                        total += polarity_scores(para)["compound"]
+                        weight += 1
             
             # If no specific mentions, use first 500 chars
-            if not token_mentions:
-                token_mentions = [content[:500]]
-            
-            # Analyze sentiment of relevant text
-            sentiment_scores = []
-            for text in token_mentions:
-                if text.strip():
-                    blob = TextBlob(text)
-                    sentiment_scores.append(blob.sentiment.polarity)
-            
-            if sentiment_scores:
-                return sum(sentiment_scores) / len(sentiment_scores)
-            else:
+            if not weight:
+                fallback_text = content[:500]
+                if fallback_text.strip():
+                    return polarity_scores(fallback_text)["compound"]
                 return 0.0
+            
+            return total / weight
                 
         except Exception as e:
             logger.error(f"Error in sentiment analysis: {e}")
@@ -431,76 +604,121 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
     def _get_source_trust(self, site_name: str, url: str) -> float:
         """Get source trust score based on domain"""
         try:
-            # Extract domain from site_name or URL
-            domain = site_name.lower() if site_name else ""
-            
-            if not domain and url:
-                # Extract domain from URL
-                import urllib.parse
-                parsed = urllib.parse.urlparse(url)
-                domain = parsed.netloc.lower()
-            
-            # Remove www. prefix
-            domain = domain.replace("www.", "")
-            
-            # Look up trust score
-            return self.SOURCE_TRUST_MAP.get(domain, self.SOURCE_TRUST_MAP["default"])
-            
+            trust = self._trust_for((site_name or "").lower())
+            if trust is None and url:
+                # Site names such as "CoinDesk" are not domains; use the URL's hostname
+                trust = self._trust_for(urlparse(url).hostname or "")
+            return self.SOURCE_TRUST_MAP["default"] if trust is None else trust
         except Exception as e:
             logger.error(f"Error getting source trust: {e}")
             return self.SOURCE_TRUST_MAP["default"]
     
-    def _calculate_recency_decay(self, published_at: Optional[str], tau_hours: float = 12.0) -> float:
-        """Calculate recency decay: exp(-Δt_hours / τ)"""
+    def _compute_source_trust(self, name: str) -> Optional[float]:
+        """Trust score for the registrable domain of a site name or hostname; None if it is not a domain"""
+        # Registrable domain (markets.reuters.com -> reuters.com)
+        ext = _TLD_EXTRACT(name)
+        if not (ext.domain and ext.suffix):
+            return None
+        return self.SOURCE_TRUST_MAP.get(
+            f"{ext.domain}.{ext.suffix}", self.SOURCE_TRUST_MAP["default"]
+        )
+    
+    def _recency_inputs(self, published_at: Optional[str]) -> Tuple[float, float]:
+        """
+        Publish timestamp for recency decay exp(-Δt / τ)
+        
+        Returns:
+            (Unix seconds, decay override); the override is negative unless the
+            date is missing or unparseable and a fixed decay applies
+        """
         try:
             if not published_at:
                 # If no publish date, assume very recent
-                return 1.0
+                return 0.0, 1.0
             
             # Parse the published date
             if isinstance(published_at, str):
-                # Try different date formats
-                for fmt in ["%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
-                    try:
-                        pub_dt = datetime.strptime(published_at.replace('Z', '+00:00'), fmt)
-                        if pub_dt.tzinfo is None:
-                            pub_dt = pub_dt.replace(tzinfo=timezone.utc)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # If parsing fails, assume recent
-                    return 0.8
+                # Fast path: C-implemented ISO 8601 parser (accepts 'Z' on 3.11+)
+                try:
+                    pub_dt = datetime.fromisoformat(published_at)
+                except ValueError:
+                    # Try different date formats
+                    for fmt in ["%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
+                        try:
+                            pub_dt = datetime.strptime(published_at.replace('Z', '+00:00'), fmt)
+                            break
+                        except ValueError:
+                            continue
+                    else:
+                        # If parsing fails, assume recent
+                        return 0.0, 0.8
             else:
                 pub_dt = published_at
             
-            # Calculate hours since publication
-            now = datetime.now(timezone.utc)
-            delta_hours = (now - pub_dt).total_seconds() / 3600
-            
-            # Apply exponential decay
-            decay = math.exp(-delta_hours / tau_hours)
-            return max(0.01, min(1.0, decay))  # Clamp between 0.01 and 1.0
+            if pub_dt.tzinfo is None:
+                pub_dt = pub_dt.replace(tzinfo=timezone.utc)
+            return pub_dt.timestamp(), -1.0
             
         except Exception as e:
             logger.error(f"Error calculating recency decay: {e}")
-            return 0.5  # Default moderate decay
+            return 0.0, 0.5  # Default moderate decay
+    
+    @staticmethod
+    def _new_novelty_lsh() -> MinHashLSH:
+        """Create an empty LSH index of recent article MinHashes"""
+        return MinHashLSH(threshold=MINHASH_LSH_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+    
+    @staticmethod
+    def _content_minhash(content: str) -> MinHash:
+        """MinHash over the lowercase word tokens of an article"""
+        minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+        minhash.update_batch([token.encode() for token in content.lower().split()])
+        return minhash
+    
+    def _near_duplicate_similarity(self, content_hash: int, minhash: MinHash) -> float:
+        """Max Jaccard similarity to recently indexed articles; indexes this one"""
+        max_similarity = 0.0
+        for candidate in self._novelty_lsh.query(minhash):
+            max_similarity = max(max_similarity, minhash.jaccard(self.content_hashes[candidate]))
+        
+        self._novelty_lsh.insert(content_hash, minhash)
+        return max_similarity
     
     def _calculate_novelty(self, content: str) -> float:
-        """Calculate novelty score using content hashing"""
+        """Calculate novelty score using content hashing (near-duplicates via MinHash)"""
         try:
             if not content or len(content) < 100:
                 return 0.5  # Short content gets moderate novelty
             
             # Create a hash of the content
-            content_hash = hashlib.md5(content.encode()).hexdigest()
+            content_hash = _content_fingerprint(content)
             
             # Check if we've seen this content before
-            if content_hash in self.content_hashes:
-                return 0.0  # Duplicate content
-            else:
-                self.content_hashes.add(content_hash)
-                return 1.0  # Novel content
+            with self._novelty_lock:
+                if content_hash in self.content_hashes:
+                    self.content_hashes.move_to_end(content_hash)
+                    return 0.0  # Duplicate content
+            
+            # Build the MinHash outside the lock; it is the expensive part
+            minhash = self._content_minhash(content)
+            
+            with self._novelty_lock:
+                # Another thread may have indexed the same content meanwhile
+                if content_hash in self.content_hashes:
+                    self.content_hashes.move_to_end(content_hash)
+                    return 0.0  # Duplicate content
+                
+                # Novel content scores 1.0; near-duplicates by how much they differ
+                # from the closest match
+                max_similarity = self._near_duplicate_similarity(content_hash, minhash)
+                novelty = min(1.0, max(0.0, 1.0 - max_similarity))
+                
+                self.content_hashes[content_hash] = minhash
+                if len(self.content_hashes) > self._novelty_capacity:
+                    # Evict least recently seen
+                    evicted_hash, _ = self.content_hashes.popitem(last=False)
+                    self._novelty_lsh.remove(evicted_hash)
+                return novelty
                 
         except Exception as e:
             logger.error(f"Error calculating novelty: {e}")
@@ -509,17 +727,10 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
     def _detect_proof_signals(self, content: str, url: str) -> float:
         """Detect proof signals (contract addresses, scanner links)"""
         try:
-            text_to_check = f"{content} {url}".lower()
-            
-            # Check for contract addresses
-            for pattern in self.contract_patterns:
-                if re.search(pattern, text_to_check, re.IGNORECASE):
-                    return 1.1  # 10% bonus
-            
-            # Check for blockchain scanner links
-            for pattern in self.scanner_patterns:
-                if re.search(pattern, text_to_check, re.IGNORECASE):
-                    return 1.1  # 10% bonus
+            # Contract addresses or blockchain scanner links earn a 10% bonus;
+            # content and URL are scanned in place rather than concatenated
+            if self._proof_re.search(content) or (url and self._proof_re.search(url)):
+                return 1.1
             
             return 1.0  # No bonus
             
@@ -529,5 +740,7 @@ Return probabilities (0.0-1.0, must sum to 1.0) in this exact format:
     
     def clear_novelty_cache(self):
         """Clear the novelty detection cache"""
-        self.content_hashes.clear()
+        with self._novelty_lock:
+            self.content_hashes.clear()
+            self._novelty_lsh = self._new_novelty_lsh()
         logger.info("Novelty cache cleared")
\ No newline at end of file
@@ -1,6 +1,17 @@
+import asyncio
+import heapq
 import httpx
+import orjson
 import logging
-from typing import List, Dict, Any, Optional
+import sys
+import numpy as np
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Hashable, Callable, Awaitable, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
@@ -13,10 +24,14 @@ from ..utils.resilience import (
     health_checker,
     fallback_cache
 )
+from ..utils.timefmt import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
-class OHLCVData(BaseModel):
+# Hot-path records are plain slotted dataclasses: built up to 1000 at a time and
+# never revalidated (FastAPI still serializes dataclasses at the boundary)
+@dataclass(slots=True, frozen=True)
+class OHLCVData:
     timestamp: int
     open: float
     high: float
@@ -24,12 +39,67 @@ class OHLCVData(BaseModel):
     close: float
     volume: float
 
+@dataclass(slots=True, frozen=True)
+class OHLCVFrame:
+    """OHLCV columns as NumPy arrays (newest first), for vectorized analytics"""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_rows(cls, rows: List[List[Any]]) -> "OHLCVFrame":
+        """Build from raw [timestamp, open, high, low, close, volume] rows in one conversion"""
+        valid = [row[:6] for row in rows if len(row) >= 6]
+        table = np.array(valid, dtype=np.float64) if valid else np.empty((0, 6), dtype=np.float64)
+        return cls(
+            timestamp=table[:, 0].astype(np.int64),
+            open=table[:, 1],
+            high=table[:, 2],
+            low=table[:, 3],
+            close=table[:, 4],
+            volume=np.nan_to_num(table[:, 5]),  # Missing volume counts as 0
+        )
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    def pct_change(self, lag: int) -> float:
+        """Percent change of the latest close versus `lag` periods earlier (0.0 if unavailable)"""
+        if len(self.close) <= lag or self.close[lag] == 0:
+            return 0.0
+        return float((self.close[0] - self.close[lag]) / self.close[lag] * 100)
+    
+    def to_columns(self, limit: Optional[int] = None) -> Dict[str, list]:
+        """Newest `limit` points as parallel JSON-ready lists, one per field"""
+        return {
+            "timestamp": self.timestamp[:limit].tolist(),
+            "open": self.open[:limit].tolist(),
+            "high": self.high[:limit].tolist(),
+            "low": self.low[:limit].tolist(),
+            "close": self.close[:limit].tolist(),
+            "volume": self.volume[:limit].tolist(),
+        }
+    
+    def to_points(self) -> List[OHLCVData]:
+        """Row-wise view for API responses"""
+        return [
+            OHLCVData(*values)
+            for values in zip(
+                self.timestamp.tolist(), self.open.tolist(), self.high.tolist(),
+                self.low.tolist(), self.close.tolist(), self.volume.tolist()
+            )
+        ]
+
 class NetworkInfo(BaseModel):
     id: str
     name: str
     coingecko_asset_platform_id: str
 
-class PoolInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PoolInfo:
     id: str
     name: str
     address: str
@@ -38,12 +108,84 @@ class PoolInfo(BaseModel):
     volume_usd: Optional[float] = None
     liquidity_usd: Optional[float] = None
 
+def _optional_float(value: Any) -> Optional[float]:
+    """API numbers arrive as strings; None stays None"""
+    return None if value is None else float(value)
+
+def _response_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body (large OHLCV arrays)"""
+    return _json_loads(response.content)
+
+# Shared read-only default for missing JSON objects, instead of a fresh {} per miss
+_EMPTY = MappingProxyType({})
+
+def _volume_h24(attrs: Any) -> Any:
+    """attributes.volume_usd.h24, or None"""
+    volume = attrs.get("volume_usd")
+    return volume.get("h24") if volume else None
+
+def _json_loads(content: bytes) -> Any:
+    """Decode raw JSON bytes with orjson"""
+    return orjson.loads(content)
+
+def _parse_ohlcv_body(content: bytes) -> Tuple[List[List[Any]], "OHLCVFrame"]:
+    """Decode an OHLCV response into its raw rows and the parsed frame"""
+    data = _json_loads(content)
+    raw_rows = (data.get("data") or _EMPTY).get("attributes", _EMPTY).get("ohlcv_list", ())
+    return raw_rows, OHLCVFrame.from_rows(raw_rows)
+
+async def _parse_off_loop(parse: Callable[[bytes], Any], content: bytes) -> Any:
+    """Run parse(content) in a worker thread when the body is big enough to stall the event loop"""
+    if len(content) >= OFFLOAD_PARSE_MIN_BYTES:
+        return await asyncio.to_thread(parse, content)
+    return parse(content)
+
+@lru_cache(maxsize=1024)
+def _multi_pool_path(network: str, token_addresses: Tuple[str, ...]) -> str:
+    """Relative multi-pool path; callers pass sorted addresses so permutations share one entry"""
+    return f"/networks/{network}/pools/multi/{','.join(token_addresses)}"
+
+# Per-request timeout, also the total budget for OHLCV retries
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+# Response bodies at least this large are decoded in a worker thread
+# (a 1000-candle OHLCV page is ~60 KB; small pages are cheaper inline)
+OFFLOAD_PARSE_MIN_BYTES = 32 * 1024
+
+# Popular networks, in display and search order
+_NETWORK_PRIORITY: Dict[str, int] = {
+    "eth": 1,
+    "bsc": 2,
+    "polygon": 3,
+    "arbitrum": 4,
+    "solana": 5,
+    "avalanche": 6,
+    "base": 7,
+}
+
 class GeckoTerminalClient:
     """Client for GeckoTerminal API with resilience features"""
     
     def __init__(self, base_url: str = "https://api.geckoterminal.com/api/v2"):
         self.base_url = base_url.rstrip('/')
-        self.timeout = 30.0
+        self.timeout = REQUEST_TIMEOUT_SECONDS
+        self._client: Optional[httpx.AsyncClient] = None
+        # Networks searched at once during token discovery
+        self.search_concurrency = 8
+        # Pools returned by a token search (highest liquidity first)
+        self.search_result_limit = 10
+        # Requests on the wire at once across all callers (guards FDs and the API's concurrency cap)
+        self.max_concurrent_requests = 32
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        # In-flight requests keyed by their arguments, shared by concurrent callers
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        
+        # Small in-process LRU of parsed results in front of fallback_cache, so
+        # repeat lookups skip the dict round trip (bounded, short TTL)
+        self._mem_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.mem_cache_size = 512
+        self.mem_cache_ttl_seconds = 60
         
         # Initialize circuit breaker
         self.circuit_breaker = get_circuit_breaker(
@@ -64,70 +206,134 @@ class GeckoTerminalClient:
             jitter=True
         )
         
-        # Token mapping for common tokens to known pools
-        self.token_pools = {
-            "BTC": {
-                "network": "eth",
-                "pools": ["0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640"]  # WBTC/USDC
-            },
-            "ETH": {
-                "network": "eth",
-                "pools": ["0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640"]  # ETH/USDC
-            },
-            "USDC": {
-                "network": "eth",
-                "pools": ["0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640"]  # ETH/USDC
-            },
-            "SOL": {
-                "network": "solana",
-                "pools": ["FAqh648xeeaTqL7du49sztp9nfj5PjRQrfvaMccyd9cz"]  # SOL pool example
-            }
+        # Token mapping for common tokens to known pools: token -> (network, pools).
+        # Read lock-free; writers replace the whole dict under _map_lock (copy-on-write)
+        self.token_pools: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+            "BTC": ("eth", ("0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640",)),  # WBTC/USDC
+            "ETH": ("eth", ("0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640",)),  # ETH/USDC
+            "USDC": ("eth", ("0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640",)),  # ETH/USDC
+            "SOL": ("solana", ("FAqh648xeeaTqL7du49sztp9nfj5PjRQrfvaMccyd9cz",)),  # SOL pool example
         }
+        self._map_lock = asyncio.Lock()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created lazily inside the running event loop"""
+        if self._client is None or self._client.is_closed:
+            # Every call targets one host, so HTTP/2 multiplexes concurrent requests on one socket
+            self._client = httpx.AsyncClient(
+                http2=True,  # h2 comes with the pinned httpx[http2]
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        return self._client
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client, bounded by the request semaphore"""
+        async with self._request_semaphore:
+            return await self.client.request(method, url, **kwargs)
+    
+    async def _set_token_mapping(self, token: str, network: str, pools: List[str]) -> None:
+        """Publish a token mapping without mutating the dict concurrent readers hold"""
+        async with self._map_lock:
+            token_pools = dict(self.token_pools)
+            token_pools[sys.intern(token.upper())] = (network, tuple(pools))
+            self.token_pools = token_pools
+    
+    async def _single_flight(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() once for concurrent callers with the same key"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            
+            def _done(finished: asyncio.Task, key: Hashable = key) -> None:
+                self._inflight.pop(key, None)
+                # Mark the exception retrieved even if every waiter was cancelled
+                if not finished.cancelled():
+                    finished.exception()
+            
+            task.add_done_callback(_done)
+        # Shielded so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _mem_get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for an unexpired in-process cache entry"""
+        entry = self._mem_cache.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.mem_cache_ttl_seconds:
+            del self._mem_cache[key]
+            return False, None
+        self._mem_cache.move_to_end(key)
+        return True, value
+    
+    def _mem_put(self, key: str, value: Any) -> None:
+        """Store a parsed value, evicting the least recently used entry"""
+        self._mem_cache[key] = (time.monotonic(), value)
+        self._mem_cache.move_to_end(key)
+        if len(self._mem_cache) > self.mem_cache_size:
+            self._mem_cache.popitem(last=False)
     
     def _get_fallback_price_data(self, token: str) -> Dict[str, Any]:
         """Get cached price data as fallback"""
         cache_key = f"price_data:{token.upper()}"
+        hit, cached_data = self._mem_get(cache_key)
+        if hit:
+            logger.info(f"Using cached price data for token: {token}")
+            return cached_data
         cached_data = fallback_cache.get(cache_key)
         if cached_data:
             logger.info(f"Using cached price data for token: {token}")
             return cached_data
         return {}
     
-    def _get_fallback_ohlcv_data(self, network: str, pool_address: str, timeframe: str) -> List[OHLCVData]:
+    def _get_fallback_ohlcv_frame(self, network: str, pool_address: str, timeframe: str) -> Optional[OHLCVFrame]:
         """Get cached OHLCV data as fallback"""
         cache_key = f"ohlcv:{network}:{pool_address}:{timeframe}"
+        hit, cached_frame = self._mem_get(cache_key)
+        if hit:
+            logger.info(f"Using cached OHLCV data for {network}/{pool_address}")
+            return cached_frame
         cached_data = fallback_cache.get(cache_key)
         if cached_data:
             logger.info(f"Using cached OHLCV data for {network}/{pool_address}")
-            return [OHLCVData(**item) for item in cached_data]
-        return []
+            return OHLCVFrame.from_rows(cached_data)
+        return None
         
     async def get_networks(self) -> List[NetworkInfo]:
         """Get list of available networks"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/networks")
-                response.raise_for_status()
-                
-                data = response.json()
-                networks = []
-                
-                for item in data.get("data", []):
-                    attrs = item.get("attributes", {})
-                    networks.append(NetworkInfo(
-                        id=item.get("id"),
-                        name=attrs.get("name"),
-                        coingecko_asset_platform_id=attrs.get("coingecko_asset_platform_id")
-                    ))
-                
-                return networks
+            response = await self._request("GET", "/networks")
+            response.raise_for_status()
+            
+            data = _response_json(response)
+            networks = []
+            
+            for item in data.get("data", ()):
+                attrs = item.get("attributes", _EMPTY)
+                networks.append(NetworkInfo(
+                    id=item.get("id"),
+                    name=attrs.get("name"),
+                    coingecko_asset_platform_id=attrs.get("coingecko_asset_platform_id")
+                ))
+            
+            return networks
                 
         except Exception as e:
             logger.error(f"Error getting networks: {e}")
             return []
     
     @retry_with_fallback(
-        config=RetryConfig(max_attempts=3, base_delay=0.5, max_delay=3.0),
+        config=RetryConfig(max_attempts=3, base_delay=0.5, max_delay=3.0, deadline=REQUEST_TIMEOUT_SECONDS),
         circuit_breaker_name="gecko_terminal",
         expected_exceptions=(httpx.HTTPError, httpx.ConnectError, httpx.TimeoutException)
     )
@@ -138,46 +344,26 @@ class GeckoTerminalClient:
         timeframe: str = "day",
         limit: int = 100,
         before_timestamp: Optional[int] = None
-    ) -> List[OHLCVData]:
+    ) -> OHLCVFrame:
         """Internal OHLCV method with retry logic"""
-        url = f"{self.base_url}/networks/{network}/pools/{pool_address}/ohlcv/{timeframe}"
+        path = f"/networks/{network}/pools/{pool_address}/ohlcv/{timeframe}"
         
         params = {"limit": min(limit, 1000)}
         if before_timestamp:
             params["before_timestamp"] = before_timestamp
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            ohlcv_list = []
-            
-            for item in data.get("data", {}).get("attributes", {}).get("ohlcv_list", []):
-                if len(item) >= 6:  # [timestamp, open, high, low, close, volume]
-                    ohlcv_list.append(OHLCVData(
-                        timestamp=int(item[0]),
-                        open=float(item[1]),
-                        high=float(item[2]),
-                        low=float(item[3]),
-                        close=float(item[4]),
-                        volume=float(item[5]) if item[5] else 0.0
-                    ))
-            
-            # Cache successful results
-            cache_key = f"ohlcv:{network}:{pool_address}:{timeframe}"
-            fallback_cache.set(cache_key, [
-                {
-                    "timestamp": item.timestamp,
-                    "open": item.open,
-                    "high": item.high,
-                    "low": item.low,
-                    "close": item.close,
-                    "volume": item.volume
-                } for item in ohlcv_list
-            ], ttl=300)  # 5 minutes
-            
-            return ohlcv_list
+        response = await self._request("GET", path, params=params)
+        response.raise_for_status()
+        
+        raw_rows, frame = await _parse_off_loop(_parse_ohlcv_body, response.content)
+        
+        # Cache successful results: the parsed frame in memory, and the raw rows
+        # as-is for the longer-lived fallback (parsed again only if it is used)
+        cache_key = f"ohlcv:{network}:{pool_address}:{timeframe}"
+        self._mem_put(cache_key, frame)
+        fallback_cache.set(cache_key, raw_rows, ttl=300)  # 5 minutes
+        
+        return frame
 
     async def get_ohlcv_data(
         self,
@@ -200,51 +386,77 @@ class GeckoTerminalClient:
         Returns:
             List of OHLCV data points
         """
+        frame = await self.get_ohlcv_frame(network, pool_address, timeframe, limit, before_timestamp)
+        return frame.to_points()
+    
+    async def get_ohlcv_frame(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str = "day",
+        limit: int = 100,
+        before_timestamp: Optional[int] = None
+    ) -> OHLCVFrame:
+        """Columnar OHLCV for a pool; same resilience as get_ohlcv_data"""
+        # Circuit open: skip the rate limiter and retry wrapper, serve the cache directly
+        if self.circuit_breaker.is_open:
+            return self._get_fallback_ohlcv_frame(network, pool_address, timeframe) or OHLCVFrame.from_rows([])
+        
         try:
-            # Apply rate limiting
-            return await with_rate_limit(
-                "gecko",
-                self._get_ohlcv_with_retry,
-                network, pool_address, timeframe, limit, before_timestamp
+            # Apply rate limiting; identical concurrent requests share one call
+            return await self._single_flight(
+                ("ohlcv", network, pool_address, timeframe, limit, before_timestamp),
+                lambda: with_rate_limit(
+                    "gecko",
+                    self._get_ohlcv_with_retry,
+                    network, pool_address, timeframe, limit, before_timestamp
+                )
             )
             
         except Exception as e:
             logger.error(f"OHLCV request failed for {network}/{pool_address}: {e}")
             
             # Try fallback from cache
-            fallback_data = self._get_fallback_ohlcv_data(network, pool_address, timeframe)
-            if fallback_data:
-                return fallback_data
+            fallback_frame = self._get_fallback_ohlcv_frame(network, pool_address, timeframe)
+            if fallback_frame is not None:
+                return fallback_frame
             
-            # Return empty list if all else fails
+            # Return an empty frame if all else fails
             logger.warning(f"No fallback available for OHLCV: {network}/{pool_address}")
-            return []
+            return OHLCVFrame.from_rows([])
     
     async def get_token_pools(self, network: str, token_addresses: List[str]) -> List[PoolInfo]:
         """Get pool information for specific tokens"""
+        if self.circuit_breaker.is_open:
+            return []
+        
+        # Sorted addresses give one canonical URL, so concurrent callers share a request
+        path = _multi_pool_path(network, tuple(sorted(token_addresses)))
+        return await self._single_flight(("pools", path), lambda: self._fetch_token_pools(path))
+    
+    async def _fetch_token_pools(self, path: str) -> List[PoolInfo]:
+        """Fetch and parse a multi-pool response"""
         try:
-            url = f"{self.base_url}/networks/{network}/pools/multi/{','.join(token_addresses)}"
+            response = await self._request("GET", path)
+            response.raise_for_status()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                data = response.json()
-                pools = []
-                
-                for item in data.get("data", []):
-                    attrs = item.get("attributes", {})
-                    pools.append(PoolInfo(
-                        id=item.get("id"),
-                        name=attrs.get("name", ""),
-                        address=attrs.get("address", ""),
-                        base_token_price_usd=attrs.get("base_token_price_usd"),
-                        quote_token_price_usd=attrs.get("quote_token_price_usd"),
-                        volume_usd=attrs.get("volume_usd", {}).get("h24"),
-                        liquidity_usd=attrs.get("reserve_in_usd")
-                    ))
-                
-                return pools
+            data = _response_json(response)
+            pools = []
+            
+            for item in data.get("data", ()):
+                attrs = item.get("attributes", _EMPTY)
+                attrs_get = attrs.get
+                pools.append(PoolInfo(
+                    id=item.get("id"),
+                    name=attrs_get("name", ""),
+                    address=attrs_get("address", ""),
+                    base_token_price_usd=_optional_float(attrs_get("base_token_price_usd")),
+                    quote_token_price_usd=_optional_float(attrs_get("quote_token_price_usd")),
+                    volume_usd=_optional_float(_volume_h24(attrs)),
+                    liquidity_usd=_optional_float(attrs_get("reserve_in_usd"))
+                ))
+            
+            return pools
                 
         except Exception as e:
             logger.error(f"Error getting token pools: {e}")
@@ -260,11 +472,19 @@ class GeckoTerminalClient:
         Returns:
             Dictionary with price, volume, liquidity data
         """
+        # Concurrent lookups of the same token (e.g. a dashboard load) share one fetch
+        return await self._single_flight(
+            ("price", token.upper()), lambda: self._fetch_token_price_data(token)
+        )
+    
+    async def _fetch_token_price_data(self, token: str) -> Dict[str, Any]:
+        """Uncoalesced body of get_token_price_data"""
         try:
             token_upper = token.upper()
+            mapping = self.token_pools.get(token_upper)
             
             # Try auto-discovery if not in predefined mappings
-            if token_upper not in self.token_pools:
+            if mapping is None:
                 logger.info(f"Token {token_upper} not in predefined mappings, attempting auto-discovery")
                 
                 # Check fallback cache first
@@ -280,9 +500,7 @@ class GeckoTerminalClient:
                     logger.warning(f"Failed to auto-discover token: {token}")
                     return {}
             
-            pool_config = self.token_pools[token_upper]
-            network = pool_config["network"]
-            pool_addresses = pool_config["pools"]
+            network, pool_addresses = mapping
             
             # Get current price data from pools
             pools = await self.get_token_pools(network, pool_addresses)
@@ -298,49 +516,9 @@ class GeckoTerminalClient:
             pool = pools[0]
             
             # Get recent OHLCV data (last 7 days) with resilience
-            ohlcv_data = await self.get_ohlcv_data(network, pool.address, "day", 7)
-            
-            # Calculate price changes
-            price_change_24h = 0.0
-            price_change_7d = 0.0
-            
-            if len(ohlcv_data) >= 2:
-                current_price = ohlcv_data[0].close
-                yesterday_price = ohlcv_data[1].close
-                price_change_24h = ((current_price - yesterday_price) / yesterday_price) * 100
-                
-                if len(ohlcv_data) >= 7:
-                    week_ago_price = ohlcv_data[6].close
-                    price_change_7d = ((current_price - week_ago_price) / week_ago_price) * 100
-            
-            result = {
-                "token": token,
-                "network": network,
-                "pool_address": pool.address,
-                "pool_name": pool.name,
-                "price_usd": pool.base_token_price_usd or pool.quote_token_price_usd,
-                "volume_24h_usd": pool.volume_usd,
-                "liquidity_usd": pool.liquidity_usd,
-                "price_change_24h": price_change_24h,
-                "price_change_7d": price_change_7d,
-                "ohlcv_data": [
-                    {
-                        "timestamp": item.timestamp,
-                        "open": item.open,
-                        "high": item.high,
-                        "low": item.low,
-                        "close": item.close,
-                        "volume": item.volume
-                    } for item in ohlcv_data[:7]  # Last 7 days
-                ],
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            
-            # Cache successful result
-            cache_key = f"price_data:{token_upper}"
-            fallback_cache.set(cache_key, result, ttl=300)  # 5 minutes
+            ohlcv = await self.get_ohlcv_frame(network, pool.address, "day", 7)
             
-            return result
+            return self._build_price_data(token, network, pool, ohlcv)
             
         except Exception as e:
             logger.error(f"Error getting token price data for {token}: {e}")
@@ -354,6 +532,34 @@ class GeckoTerminalClient:
             logger.warning(f"No fallback available for token price data: {token}")
             return {}
     
+    def _build_price_data(self, token: str, network: str, pool: PoolInfo, ohlcv: OHLCVFrame) -> Dict[str, Any]:
+        """Assemble and cache the price payload for a token's pool"""
+        # Calculate price changes on the close column (newest first)
+        price_change_24h = ohlcv.pct_change(1)
+        price_change_7d = ohlcv.pct_change(6)
+        
+        result = {
+            "token": token,
+            "network": network,
+            "pool_address": pool.address,
+            "pool_name": pool.name,
+            "price_usd": pool.base_token_price_usd or pool.quote_token_price_usd,
+            "volume_24h_usd": pool.volume_usd,
+            "liquidity_usd": pool.liquidity_usd,
+            "price_change_24h": price_change_24h,
+            "price_change_7d": price_change_7d,
+            # Last 7 days, columnar (newest first)
+            "ohlcv": ohlcv.to_columns(7),
+            "last_updated": utc_now_iso()
+        }
+        
+        # Cache successful result
+        cache_key = f"price_data:{token.upper()}"
+        self._mem_put(cache_key, result)
+        fallback_cache.set(cache_key, result, ttl=300)  # 5 minutes
+        
+        return result
+    
     async def calculate_token_return(self, token: str, hours_back: int = 1) -> Optional[float]:
         """
         Calculate token return over specified time period
@@ -368,15 +574,15 @@ class GeckoTerminalClient:
         try:
             price_data = await self.get_token_price_data(token)
             
-            if not price_data or not price_data.get("ohlcv_data"):
+            if not price_data or not price_data.get("ohlcv"):
                 return None
             
-            ohlcv = price_data["ohlcv_data"]
+            closes = price_data["ohlcv"]["close"]
             
-            if hours_back <= 24 and len(ohlcv) >= 2:
+            if hours_back <= 24 and len(closes) >= 2:
                 # Use daily data for 24h return
-                current_price = ohlcv[0]["close"]
-                past_price = ohlcv[1]["close"]
+                current_price = closes[0]
+                past_price = closes[1]
                 return ((current_price - past_price) / past_price) * 100
             
             return None
@@ -387,10 +593,7 @@ class GeckoTerminalClient:
 
     async def add_token_mapping(self, token: str, network: str, pools: List[str]):
         """Add new token pool mapping"""
-        self.token_pools[token.upper()] = {
-            "network": network,
-            "pools": pools
-        }
+        await self._set_token_mapping(token, network, pools)
         logger.info(f"Added token mapping for {token}: {network} - {pools}")
     
     async def search_token_pools(self, token: str, networks: List[str] = None) -> List[Dict[str, Any]]:
@@ -405,66 +608,51 @@ class GeckoTerminalClient:
             List of discovered pool information
         """
         if not networks:
-            networks = ["eth", "bsc", "polygon", "arbitrum", "solana", "avalanche", "base"]
+            networks = list(_NETWORK_PRIORITY)
+        
+        # Circuit open: every network would fail, so skip the fan-out entirely
+        if self.circuit_breaker.is_open:
+            logger.debug(f"Gecko circuit open, skipping pool search for {token}")
+            return []
         
         all_pools = []
         token_lower = token.lower()
+        semaphore = asyncio.Semaphore(min(len(networks), self.search_concurrency))
         
-        for network in networks:
-            try:
-                # Search for pools containing the token
-                pools = await self._search_network_pools(network, token_lower)
-                for pool in pools:
-                    pool["network"] = network
-                all_pools.extend(pools)
-                
-            except Exception as e:
-                logger.warning(f"Error searching {network} for token {token}: {e}")
+        async def _bounded(network: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._search_network_pools(network, token_lower)
+        
+        # Search for pools containing the token on all networks concurrently
+        results = await asyncio.gather(
+            *(_bounded(network) for network in networks), return_exceptions=True
+        )
+        
+        for network, pools in zip(networks, results):
+            if isinstance(pools, Exception):
+                logger.warning(f"Error searching {network} for token {token}: {pools}")
                 continue
+            for pool in pools:
+                pool["network"] = network
+            all_pools.extend(pools)
         
         # Sort by liquidity (highest first) and return top results
         all_pools.sort(key=lambda x: x.get("liquidity_usd", 0) or 0, reverse=True)
-        return all_pools[:10]  # Return top 10 pools
+        return all_pools[:self.search_result_limit]
     
     async def _search_network_pools(self, network: str, token: str) -> List[Dict[str, Any]]:
         """Search for pools in a specific network"""
         try:
-            # Try different endpoints to find token pools
+            # Try different endpoints to find token pools, in order of preference
             search_endpoints = [
-                f"{self.base_url}/networks/{network}/trending_pools",
-                f"{self.base_url}/networks/{network}/pools",
+                f"/networks/{network}/trending_pools",
+                f"/networks/{network}/pools",
             ]
             
             for endpoint in search_endpoints:
-                try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.get(endpoint, params={"page": 1})
-                        if response.status_code == 200:
-                            data = response.json()
-                            pools = []
-                            
-                            for item in data.get("data", []):
-                                attrs = item.get("attributes", {})
-                                pool_name = (attrs.get("name", "").lower())
-                                
-                                # Check if token appears in pool name
-                                if token in pool_name:
-                                    pools.append({
-                                        "id": item.get("id"),
-                                        "name": attrs.get("name", ""),
-                                        "address": attrs.get("address", ""),
-                                        "base_token_price_usd": attrs.get("base_token_price_usd"),
-                                        "quote_token_price_usd": attrs.get("quote_token_price_usd"),
-                                        "volume_usd": attrs.get("volume_usd", {}).get("h24", 0),
-                                        "liquidity_usd": attrs.get("reserve_in_usd", 0)
-                                    })
-                            
-                            if pools:
-                                return pools
-                                
-                except Exception as endpoint_error:
-                    logger.debug(f"Search endpoint {endpoint} failed: {endpoint_error}")
-                    continue
+                pools = await self._search_endpoint_pools(endpoint, token)
+                if pools:
+                    return pools
             
             return []
             
@@ -472,6 +660,43 @@ class GeckoTerminalClient:
             logger.error(f"Error searching network {network}: {e}")
             return []
     
+    async def _search_endpoint_pools(self, endpoint: str, token: str) -> List[Dict[str, Any]]:
+        """Pools from one listing endpoint whose name contains the token"""
+        try:
+            response = await self._request("GET", endpoint, params={"page": 1})
+            if response.status_code != 200:
+                return []
+            
+            data = await _parse_off_loop(_json_loads, response.content)
+            
+            # Check if token appears in pool name, keeping each match's liquidity
+            matches = []
+            for item in data.get("data", ()):
+                attrs = item.get("attributes", _EMPTY)
+                if token in attrs.get("name", "").lower():
+                    matches.append((_optional_float(attrs.get("reserve_in_usd")) or 0.0, attrs, item))
+            
+            # Only the most liquid matches can make the final cut, so only those become results
+            pools = []
+            for liquidity, attrs, item in heapq.nlargest(self.search_result_limit, matches, key=itemgetter(0)):
+                attrs_get = attrs.get
+                pools.append({
+                    "id": item.get("id"),
+                    "name": attrs_get("name", ""),
+                    "address": attrs_get("address", ""),
+                    "base_token_price_usd": attrs_get("base_token_price_usd"),
+                    "quote_token_price_usd": attrs_get("quote_token_price_usd"),
+                    # Numeric strings from the API; floats so liquidity sorts and formats correctly
+                    "volume_usd": _optional_float(_volume_h24(attrs)) or 0.0,
+                    "liquidity_usd": liquidity
+                })
+            
+            return pools
+            
+        except Exception as endpoint_error:
+            logger.debug(f"Search endpoint {endpoint} failed: {endpoint_error}")
+            return []
+    
     async def discover_token_automatically(self, token: str) -> Dict[str, Any]:
         """
         Automatically discover token information and add to mappings
@@ -500,20 +725,32 @@ class GeckoTerminalClient:
             
             # Add to token mappings
             if pool_address:
-                self.token_pools[token_upper] = {
-                    "network": network,
-                    "pools": [pool_address]
-                }
+                await self._set_token_mapping(token_upper, network, [pool_address])
                 
                 logger.info(f"Auto-discovered {token_upper}: {network}/{pool_address} (liquidity: ${best_pool.get('liquidity_usd', 0):,.0f})")
                 
-                # Get comprehensive token data
-                token_data = await self.get_token_price_data(token_upper)
+                # Build price data from the discovered pool rather than re-fetching
+                # it; only OHLCV is still needed
+                pool = PoolInfo(
+                    id=best_pool.get("id"),
+                    name=best_pool.get("name", ""),
+                    address=pool_address,
+                    base_token_price_usd=_optional_float(best_pool.get("base_token_price_usd")),
+                    quote_token_price_usd=_optional_float(best_pool.get("quote_token_price_usd")),
+                    volume_usd=best_pool.get("volume_usd"),
+                    liquidity_usd=best_pool.get("liquidity_usd")
+                )
+                ohlcv = await self.get_ohlcv_frame(network, pool_address, "day", 7)
+                if len(ohlcv):
+                    token_data = self._build_price_data(token_upper, network, pool, ohlcv)
+                else:
+                    # Uncoalesced: this may run inside the in-flight price lookup for the same token
+                    token_data = await self._fetch_token_price_data(token_upper)
                 
                 # Add discovery metadata
                 token_data.update({
                     "auto_discovered": True,
-                    "discovery_timestamp": datetime.utcnow().isoformat(),
+                    "discovery_timestamp": utc_now_iso(),
                     "alternative_pools": discovered_pools[1:5],  # Store alternative pools
                     "total_pools_found": len(discovered_pools)
                 })
@@ -541,13 +778,15 @@ class GeckoTerminalClient:
             token_upper = token.upper()
             
             # Check if already mapped
-            if token_upper in self.token_pools:
+            mapping = self.token_pools.get(token_upper)
+            if mapping is not None:
+                network, pools = mapping
                 return {
                     "valid": True,
                     "token": token_upper,
                     "source": "predefined_mapping",
-                    "networks": [self.token_pools[token_upper]["network"]],
-                    "pool_count": len(self.token_pools[token_upper]["pools"])
+                    "networks": [network],
+                    "pool_count": len(pools)
                 }
             
             # Try to discover automatically
@@ -586,31 +825,19 @@ class GeckoTerminalClient:
         try:
             networks_info = await self.get_networks()
             
-            # Add popular network priorities
-            popular_networks = {
-                "eth": {"priority": 1, "name": "Ethereum", "popular": True},
-                "bsc": {"priority": 2, "name": "Binance Smart Chain", "popular": True},
-                "polygon": {"priority": 3, "name": "Polygon", "popular": True},
-                "arbitrum": {"priority": 4, "name": "Arbitrum", "popular": True},
-                "solana": {"priority": 5, "name": "Solana", "popular": True},
-                "avalanche": {"priority": 6, "name": "Avalanche", "popular": True},
-                "base": {"priority": 7, "name": "Base", "popular": True}
-            }
-            
             result = []
             for network in networks_info:
-                network_id = network.id
-                network_info = {
-                    "id": network_id,
+                priority = _NETWORK_PRIORITY.get(network.id)
+                result.append({
+                    "id": network.id,
                     "name": network.name,
                     "coingecko_id": network.coingecko_asset_platform_id,
-                    "popular": network_id in popular_networks,
-                    "priority": popular_networks.get(network_id, {}).get("priority", 999)
-                }
-                result.append(network_info)
+                    "popular": priority is not None,
+                    "priority": priority or 999
+                })
             
             # Sort by priority (popular networks first)
-            result.sort(key=lambda x: x["priority"])
+            result.sort(key=itemgetter("priority"))
             return result
             
         except Exception as e:
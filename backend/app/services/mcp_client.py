@@ -5,6 +5,7 @@ from datetime import datetime
 import asyncio
 from pydantic import BaseModel
 import json
+import orjson
 
 from ..utils.resilience import (
     retry_with_fallback,
@@ -19,6 +20,12 @@ from ..utils.resilience import (
 
 logger = logging.getLogger(__name__)
 
+def _response_json(response: httpx.Response) -> Any:
+    """Decode a JSON body with orjson (large scrape payloads)"""
+    return orjson.loads(response.content)
+
+# Network payloads are validated on receipt; the fallback cache holds the
+# validated dumps, so cached results are rebuilt with model_construct
 class SearchResult(BaseModel):
     content: str
     engine: str
@@ -62,6 +69,7 @@ class MCPClient:
         self.base_url = base_url.rstrip('/')
         self.search_timeout = 30.0  # Fast operations
         self.scrape_timeout = 90.0  # Slow operations that return large data
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Initialize separate circuit breakers for different operations
         self.search_circuit_breaker = get_circuit_breaker(
@@ -99,6 +107,26 @@ class MCPClient:
             jitter=True
         )
         
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created lazily inside the running event loop"""
+        if self._client is None or self._client.is_closed:
+            # Calls pass their own timeout; this is the slow-path default
+            self._client = httpx.AsyncClient(
+                http2=True,  # h2 comes with the pinned httpx[http2]
+                base_url=self.base_url,
+                headers={"accept": "application/json"},
+                timeout=httpx.Timeout(self.scrape_timeout, connect=5.0, pool=10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def health_check(self) -> bool:
         """Check if the MCP server is healthy with circuit breaker protection"""
         try:
@@ -113,7 +141,7 @@ class MCPClient:
         cached_results = fallback_cache.get(cache_key)
         if cached_results:
             logger.info(f"Using cached search results for query: {query}")
-            return [SearchResult(**result) for result in cached_results]
+            return [SearchResult.model_construct(**result) for result in cached_results]
         return []
     
     def _get_fallback_scrape_result(self, url: str) -> Optional[ScrapeResult]:
@@ -122,27 +150,22 @@ class MCPClient:
         cached_result = fallback_cache.get(cache_key)
         if cached_result:
             logger.info(f"Using cached scrape result for URL: {url}")
-            return ScrapeResult(**cached_result)
+            return ScrapeResult.model_construct(**cached_result)
         return None
     
     async def _search_with_retry(self, query: str) -> List[SearchResult]:
         """Internal search method with retry logic"""
-        async with httpx.AsyncClient(timeout=self.search_timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/search",
-                json={"query": query},
-                headers={"accept": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            results = data.get("results", [])
-            
-            # Cache successful results
-            cache_key = f"search_results:{query}"
-            fallback_cache.set(cache_key, results, ttl=1800)  # 30 minutes
-            
-            return [SearchResult(**result) for result in results]
+        response = await self.client.post("/search", json={"query": query}, timeout=self.search_timeout)
+        response.raise_for_status()
+        
+        data = _response_json(response)
+        results = [SearchResult(**result) for result in data.get("results", [])]
+        
+        # Cache successful results
+        cache_key = f"search_results:{query}"
+        fallback_cache.set(cache_key, [result.model_dump() for result in results], ttl=1800)  # 30 minutes
+        
+        return results
     
     async def search(self, query: str) -> List[SearchResult]:
         """
@@ -187,23 +210,18 @@ class MCPClient:
         """Internal scrape method with retry logic"""
         logger.info(f"Starting scrape for URL: {url}")
         
-        async with httpx.AsyncClient(timeout=self.scrape_timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/scrape",
-                json={"url": url},
-                headers={"accept": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            result = ScrapeResult(**data)
-            
-            # Cache successful results
-            cache_key = f"scrape_result:{url}"
-            fallback_cache.set(cache_key, data, ttl=3600)  # 1 hour
-            
-            logger.info(f"Scrape successful for URL: {url} (content length: {len(data.get('content', ''))}, response size: {len(str(data))} chars)")
-            return result
+        response = await self.client.post("/scrape", json={"url": url}, timeout=self.scrape_timeout)
+        response.raise_for_status()
+        
+        data = _response_json(response)
+        result = ScrapeResult(**data)
+        
+        # Cache successful results
+        cache_key = f"scrape_result:{url}"
+        fallback_cache.set(cache_key, result.model_dump(), ttl=3600)  # 1 hour
+        
+        logger.info(f"Scrape successful for URL: {url} (content length: {len(data.get('content', ''))}, response size: {len(response.content)} bytes)")
+        return result
     
     async def scrape(self, url: str) -> Optional[ScrapeResult]:
         """
@@ -245,37 +263,33 @@ class MCPClient:
     
     async def _chat_with_retry(self, query: str) -> ChatResult:
         """Internal chat method with retry logic"""
-        async with httpx.AsyncClient(timeout=self.scrape_timeout) as client:  # Chat may involve scraping, so use scrape timeout
-            response = await client.post(
-                f"{self.base_url}/chat",
-                json={"query": query},
-                headers={"accept": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Parse scraped content
-            scraped_content = [
-                ScrapeResult(**item) for item in data.get("scraped_content", [])
-            ]
-            
-            # Parse search results
-            search_results = [
-                SearchResult(**item) for item in data.get("search_results", [])
-            ]
-            
-            result = ChatResult(
-                response=data.get("response", ""),
-                scraped_content=scraped_content,
-                search_results=search_results
-            )
-            
-            # Cache successful results
-            cache_key = f"chat_result:{query}"
-            fallback_cache.set(cache_key, data, ttl=1800)  # 30 minutes
-            
-            return result
+        # Chat may involve scraping, so use scrape timeout
+        response = await self.client.post("/chat", json={"query": query}, timeout=self.scrape_timeout)
+        response.raise_for_status()
+        
+        data = _response_json(response)
+        
+        # Parse scraped content
+        scraped_content = [
+            ScrapeResult(**item) for item in data.get("scraped_content", [])
+        ]
+        
+        # Parse search results
+        search_results = [
+            SearchResult(**item) for item in data.get("search_results", [])
+        ]
+        
+        result = ChatResult(
+            response=data.get("response", ""),
+            scraped_content=scraped_content,
+            search_results=search_results
+        )
+        
+        # Cache successful results
+        cache_key = f"chat_result:{query}"
+        fallback_cache.set(cache_key, result.model_dump(), ttl=1800)  # 30 minutes
+        
+        return result
     
     def _get_fallback_chat_result(self, query: str) -> Optional[ChatResult]:
         """Get cached chat result as fallback"""
@@ -286,13 +300,13 @@ class MCPClient:
             
             # Parse cached data
             scraped_content = [
-                ScrapeResult(**item) for item in cached_result.get("scraped_content", [])
+                ScrapeResult.model_construct(**item) for item in cached_result.get("scraped_content", [])
             ]
             search_results = [
-                SearchResult(**item) for item in cached_result.get("search_results", [])
+                SearchResult.model_construct(**item) for item in cached_result.get("search_results", [])
             ]
             
-            return ChatResult(
+            return ChatResult.model_construct(
                 response=cached_result.get("response", ""),
                 scraped_content=scraped_content,
                 search_results=search_results
@@ -394,14 +408,18 @@ class MCPClient:
         ]
         
         all_articles = []
+        per_query = max_articles // len(queries)
         
-        # Search with different queries to get diverse results
-        for query in queries:
-            try:
-                articles = await self.search_and_scrape(query, max_articles // len(queries))
+        # Search with different queries concurrently to get diverse results
+        results = await asyncio.gather(
+            *(self.search_and_scrape(query, per_query) for query in queries),
+            return_exceptions=True
+        )
+        for query, articles in zip(queries, results):
+            if isinstance(articles, Exception):
+                logger.error(f"Error searching for '{query}': {articles}")
+            else:
                 all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Error searching for '{query}': {e}")
         
         # Remove duplicates based on URL
         seen_urls = set()
@@ -9,12 +9,12 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, func
+from sqlalchemy import desc, and_, func, cast, Numeric
 
 from ..database import SessionLocal
-from ..models import UserBalance, ManagedWallet, Bucket, Article, UserDeposit
+from ..models import UserBalance, ManagedWallet, Bucket, Article, UserDeposit, UserWallet
 from ..services.ml_engine import MLEngine
-from ..services.gecko_client import GeckoTerminalClient
+from ..services import get_gecko_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,8 @@ class PortfolioService:
     
     def __init__(self):
         self.ml_engine = MLEngine()
-        self.gecko_client = GeckoTerminalClient()
+        # Shared instance, so portfolio lookups reuse the same connection pool
+        self.gecko_client = get_gecko_client()
         self.rebalance_interval = 300  # 5 minutes in seconds
         self.min_prediction_confidence = 0.6  # Minimum confidence for trades
         self.max_single_token_weight = 0.3  # Maximum 30% allocation to single token
@@ -33,12 +34,14 @@ class PortfolioService:
         """Get current portfolio for a user on a specific chain"""
         db = SessionLocal()
         try:
-            # Get user balances
-            balances = db.query(UserBalance).filter(
+            # Get user balances (amounts are stored as decimal text; compare them numerically)
+            balances = db.query(UserBalance).join(
+                UserWallet, UserWallet.id == UserBalance.user_wallet_id
+            ).filter(
                 and_(
-                    UserBalance.user_wallet_address == user_wallet_address,
+                    UserWallet.user_wallet_address == user_wallet_address,
                     UserBalance.chain_id == chain_id,
-                    UserBalance.balance > 0
+                    cast(UserBalance.available_balance, Numeric(78, 18)) > 0
                 )
             ).all()
             
@@ -55,9 +58,9 @@ class PortfolioService:
                 price_data = await self._get_token_price(balance.token_symbol)
                 current_price = Decimal(str(price_data.get('price', 0.0)))
                 
-                token_value = balance.balance * current_price
+                token_value = balance.available_balance * current_price
                 portfolio['balances'][balance.token_symbol] = {
-                    'balance': float(balance.balance),
+                    'balance': float(balance.available_balance),
                     'price_usd': float(current_price),
                     'value_usd': float(token_value),
                     'percentage': 0.0  # Will be calculated after total
@@ -166,8 +169,10 @@ class PortfolioService:
         """Generate list of trades needed to rebalance portfolio"""
         try:
             # Get user's chain - use first chain with deposits
-            user_deposits = db.query(UserDeposit.chain_id).filter(
-                UserDeposit.user_wallet_address == user_address
+            user_deposits = db.query(UserDeposit.chain_id).join(
+                UserWallet, UserWallet.id == UserDeposit.user_wallet_id
+            ).filter(
+                UserWallet.user_wallet_address == user_address
             ).distinct().first()
             
             if not user_deposits:
@@ -269,17 +274,20 @@ class PortfolioService:
             # Get historical deposits for baseline
             since = datetime.utcnow() - timedelta(days=days)
             
-            deposits = db.query(UserDeposit).filter(
+            # Sum in the database; amounts are stored as decimal text, so cast them to numeric
+            total_deposited = db.query(
+                func.sum(cast(UserDeposit.amount, Numeric(78, 18)))
+            ).join(
+                UserWallet, UserWallet.id == UserDeposit.user_wallet_id
+            ).filter(
                 and_(
-                    UserDeposit.user_wallet_address == user_wallet_address,
+                    UserWallet.user_wallet_address == user_wallet_address,
                     UserDeposit.chain_id == chain_id,
                     UserDeposit.created_at >= since,
                     UserDeposit.status == 'confirmed'
                 )
-            ).all()
-            
-            # Calculate total deposits
-            total_deposited = sum(float(deposit.amount) for deposit in deposits)
+            ).scalar()
+            total_deposited = float(total_deposited or 0)
             
             # Get current portfolio value
             portfolio = await self.get_user_portfolio(user_wallet_address, chain_id)
@@ -314,8 +322,10 @@ class PortfolioService:
         """Get portfolio overview for API endpoint"""
         try:
             # Get all chains the user has deposits on
-            user_deposits = db.query(UserDeposit.chain_id).filter(
-                UserDeposit.user_wallet_address == user_address
+            user_deposits = db.query(UserDeposit.chain_id).join(
+                UserWallet, UserWallet.id == UserDeposit.user_wallet_id
+            ).filter(
+                UserWallet.user_wallet_address == user_address
             ).distinct().all()
             
             if not user_deposits:
@@ -461,7 +471,7 @@ class PortfolioService:
         """Get system-wide portfolio analytics"""
         try:
             # Count total users with portfolios
-            total_users = db.query(UserDeposit.user_wallet_address).distinct().count()
+            total_users = db.query(UserDeposit.user_wallet_id).distinct().count()
             
             # Calculate total system value
             total_balances = db.query(
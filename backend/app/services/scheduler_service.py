@@ -25,25 +25,45 @@ class TradingScheduler:
         self.is_running = False
         self.rebalance_interval = 300  # 5 minutes in seconds
         self.last_rebalance_check = None
+        self._stop_event = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._stopped.set()  # Not running yet
         
     async def start_scheduler(self):
         """Start the automated trading scheduler"""
         logger.info("Starting automated trading scheduler...")
         self.is_running = True
+        self._stop_event.clear()
+        self._stopped.clear()
         
-        while self.is_running:
-            try:
-                await self._run_rebalancing_cycle()
-                await asyncio.sleep(self.rebalance_interval)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    await self._run_rebalancing_cycle()
+                    delay = self.rebalance_interval
+                    
+                except Exception as e:
+                    logger.error(f"Error in trading scheduler: {e}")
+                    delay = 60  # Wait 1 minute before retrying
                 
-            except Exception as e:
-                logger.error(f"Error in trading scheduler: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying
+                # Sleep until the next cycle, waking early if a stop is requested
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.is_running = False
+            self._stopped.set()
+            logger.info("Automated trading scheduler stopped")
                 
-    async def stop_scheduler(self):
-        """Stop the automated trading scheduler"""
+    async def stop_scheduler(self, timeout: float = 10.0):
+        """Stop the automated trading scheduler and wait for the loop to exit"""
         logger.info("Stopping automated trading scheduler...")
-        self.is_running = False
+        self._stop_event.set()
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Trading scheduler did not stop within %.1fs", timeout)
         
     async def _run_rebalancing_cycle(self):
         """Run a complete rebalancing cycle for all active portfolios"""
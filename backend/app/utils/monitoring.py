@@ -287,9 +287,8 @@ class PerformanceMonitor:
         self.metrics = metrics_collector
         self.active_requests = {}
         
-    @asynccontextmanager
-    async def track_request(self, method: str, endpoint: str):
-        """Context manager for tracking request performance"""
+    def start_request(self, method: str, endpoint: str) -> str:
+        """Register an in-flight request; returns its id for finish_request"""
         start_time = time.time()
         request_id = f"{method}:{endpoint}:{start_time}"
         
@@ -298,6 +297,18 @@ class PerformanceMonitor:
             "endpoint": endpoint,
             "start_time": start_time
         }
+        return request_id
+    
+    def finish_request(self, request_id: str, method: str, endpoint: str, status_code: int, duration: float):
+        """Record a completed request and drop it from the active set"""
+        self.metrics.record_request(method, endpoint, status_code, duration)
+        self.active_requests.pop(request_id, None)
+    
+    @asynccontextmanager
+    async def track_request(self, method: str, endpoint: str):
+        """Context manager for tracking request performance"""
+        start_time = time.time()
+        request_id = self.start_request(method, endpoint)
         
         try:
             yield
@@ -307,9 +318,7 @@ class PerformanceMonitor:
             logger.error(f"Request failed: {method} {endpoint}", error=e)
             raise
         finally:
-            duration = time.time() - start_time
-            self.metrics.record_request(method, endpoint, status_code, duration)
-            self.active_requests.pop(request_id, None)
+            self.finish_request(request_id, method, endpoint, status_code, time.time() - start_time)
     
     def track_api_call(self, service: str):
         """Decorator for tracking external API calls"""
@@ -460,16 +469,37 @@ alert_manager.add_rule("high_error_rate", high_error_rate_condition, "critical",
 alert_manager.add_rule("circuit_breaker_open", circuit_breaker_open_condition, "warning", cooldown=300)
 alert_manager.add_rule("high_response_time", high_response_time_condition, "warning", cooldown=300)
 
+class MonitoringMiddleware:
+    """Pure ASGI middleware recording request metrics without BaseHTTPMiddleware overhead"""
+    
+    def __init__(self, app):
+        self.app = app
+        
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        method = scope["method"]
+        endpoint = scope["path"]
+        status = {"code": 500}
+        start = time.perf_counter()
+        request_id = performance_monitor.start_request(method, endpoint)
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            performance_monitor.finish_request(
+                request_id, method, endpoint, status["code"], time.perf_counter() - start
+            )
+
 def setup_monitoring(app):
     """Setup monitoring for FastAPI application"""
-    @app.middleware("http")
-    async def monitoring_middleware(request, call_next):
-        method = request.method
-        endpoint = str(request.url.path)
-        
-        async with performance_monitor.track_request(method, endpoint):
-            response = await call_next(request)
-            return response
+    app.add_middleware(MonitoringMiddleware)
     
     # Start background tasks
     @app.on_event("startup")
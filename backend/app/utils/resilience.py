@@ -4,6 +4,7 @@ Includes retry logic, circuit breakers, and fallback mechanisms
 """
 
 import asyncio
+import random
 import time
 import logging
 from typing import Any, Callable, Dict, List, Optional, Union, TypeVar
@@ -32,6 +33,7 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
     backoff_strategy: str = "exponential"  # "exponential", "linear", "fixed"
+    deadline: Optional[float] = None  # Total seconds across attempts and backoff; None = unbounded
     
 @dataclass
 class CircuitBreakerConfig:
@@ -57,24 +59,37 @@ class RateLimiter:
         self.rate = rate  # tokens per second
         self.burst = burst  # maximum tokens
         self.tokens = burst
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
         
-    async def acquire(self, tokens: int = 1) -> bool:
-        """Acquire tokens, returns True if successful"""
-        now = time.time()
-        # Add tokens based on time elapsed
+    def _refill(self):
+        """Add tokens based on time elapsed"""
+        now = time.monotonic()
         self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
         self.last_refill = now
         
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+    async def acquire(self, tokens: int = 1) -> bool:
+        """Acquire tokens, returns True if successful"""
+        async with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
         
-    async def wait_for_token(self, tokens: int = 1):
+    async def wait_for_token(self, tokens: float = 1):
         """Wait until tokens are available"""
-        while not await self.acquire(tokens):
-            await asyncio.sleep(0.1)
+        # Requests larger than the bucket could never be satisfied; cap them
+        tokens = min(tokens, self.burst)
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            # Sleep outside the lock so concurrent callers can take tokens as they refill
+            await asyncio.sleep(wait)
 
 class CircuitBreaker:
     """Circuit breaker implementation"""
@@ -83,6 +98,15 @@ class CircuitBreaker:
         self.config = config
         self.state = CircuitBreakerState()
         self._lock = asyncio.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """True while OPEN and still inside the cool-down (calls would fail fast)"""
+        return (
+            self.state.state == CircuitState.OPEN
+            and self.state.next_attempt_time is not None
+            and datetime.now() < self.state.next_attempt_time
+        )
         
     async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute function with circuit breaker protection"""
@@ -136,8 +160,16 @@ def get_circuit_breaker(service_name: str, config: Optional[CircuitBreakerConfig
         _circuit_breakers[service_name] = CircuitBreaker(config)
     return _circuit_breakers[service_name]
 
-def calculate_delay(attempt: int, config: RetryConfig) -> float:
-    """Calculate retry delay based on strategy"""
+def calculate_delay(attempt: int, config: RetryConfig, prev_delay: Optional[float] = None) -> float:
+    """Calculate retry delay based on strategy
+    
+    With exponential jitter and the previous delay known, uses decorrelated
+    jitter so concurrent retriers drift apart instead of re-aligning.
+    """
+    if config.backoff_strategy == "exponential" and config.jitter and prev_delay is not None:
+        upper = min(config.max_delay, prev_delay * config.exponential_base)
+        return random.uniform(config.base_delay, max(config.base_delay, upper))
+    
     if config.backoff_strategy == "exponential":
         delay = min(config.base_delay * (config.exponential_base ** (attempt - 1)), config.max_delay)
     elif config.backoff_strategy == "linear":
@@ -147,7 +179,6 @@ def calculate_delay(attempt: int, config: RetryConfig) -> float:
     
     # Add jitter to prevent thundering herd
     if config.jitter:
-        import random
         delay *= (0.5 + random.random() * 0.5)
     
     return delay
@@ -168,6 +199,8 @@ def retry_with_fallback(
             circuit_breaker = get_circuit_breaker(circuit_breaker_name) if circuit_breaker_name else None
             
             last_exception = None
+            start = time.monotonic()
+            delay = retry_config.base_delay
             
             for attempt in range(1, retry_config.max_attempts + 1):
                 try:
@@ -188,7 +221,10 @@ def retry_with_fallback(
                     if attempt == retry_config.max_attempts:
                         break
                     
-                    delay = calculate_delay(attempt, retry_config)
+                    delay = calculate_delay(attempt, retry_config, prev_delay=delay)
+                    if retry_config.deadline is not None and time.monotonic() - start + delay > retry_config.deadline:
+                        logger.warning(f"Retry deadline of {retry_config.deadline}s reached for {func.__name__}")
+                        break
                     logger.debug(f"Retrying {func.__name__} in {delay:.2f} seconds")
                     await asyncio.sleep(delay)
             
@@ -207,6 +243,8 @@ def retry_with_fallback(
         def sync_wrapper(*args, **kwargs) -> T:
             retry_config = config or RetryConfig()
             last_exception = None
+            start = time.monotonic()
+            delay = retry_config.base_delay
             
             for attempt in range(1, retry_config.max_attempts + 1):
                 try:
@@ -222,7 +260,10 @@ def retry_with_fallback(
                     if attempt == retry_config.max_attempts:
                         break
                     
-                    delay = calculate_delay(attempt, retry_config)
+                    delay = calculate_delay(attempt, retry_config, prev_delay=delay)
+                    if retry_config.deadline is not None and time.monotonic() - start + delay > retry_config.deadline:
+                        logger.warning(f"Retry deadline of {retry_config.deadline}s reached for {func.__name__}")
+                        break
                     logger.debug(f"Retrying {func.__name__} in {delay:.2f} seconds")
                     time.sleep(delay)
             
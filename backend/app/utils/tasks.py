@@ -0,0 +1,16 @@
+"""
+Background task helpers shared by the app lifespan and API routes
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+def on_bg_task_done(tasks: set):
+    """Build a done-callback that drops a finished task and logs its failure"""
+    def callback(task: asyncio.Task):
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task {task.get_name()} failed: {task.exception()}")
+    return callback
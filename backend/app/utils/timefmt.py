@@ -0,0 +1,16 @@
+"""
+Timestamp formatting helpers for response payloads
+"""
+
+import time
+from datetime import datetime
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _iso_second(epoch_second: int) -> str:
+    """UTC ISO timestamp at one-second resolution; formatted once per second"""
+    return datetime.utcfromtimestamp(epoch_second).isoformat()
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO string, cached at one-second resolution"""
+    return _iso_second(int(time.time()))
@@ -0,0 +1,26 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base
+
+@pytest.fixture
+def db_session(tmp_path):
+    """Sync session on a fresh SQLite file with the full schema"""
+    engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+@pytest_asyncio.fixture
+async def async_session_factory(tmp_path):
+    """Async session factory on a fresh SQLite file (aiosqlite), one connection per session"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/test_async.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
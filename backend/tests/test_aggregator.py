@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Bucket
+from app.services.aggregator import (
+    NarrativeAggregator,
+    _aggregate_kernel_loops,
+    _aggregate_kernel_numpy,
+)
+
+def _kernel_inputs(n_articles: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    sentiment = rng.uniform(-1, 1, n_articles).astype(np.float32)
+    weights = rng.random(n_articles).astype(np.float32)
+    event_matrix = rng.random((n_articles, 9)).astype(np.float32)
+    return sentiment, weights, event_matrix
+
+def _assert_same_aggregates(actual, expected):
+    heat, positive, negative, weighted_events = actual
+    exp_heat, exp_positive, exp_negative, exp_weighted_events = expected
+    assert heat == pytest.approx(exp_heat, abs=1e-4)
+    assert positive == pytest.approx(exp_positive, abs=1e-4)
+    assert negative == pytest.approx(exp_negative, abs=1e-4)
+    np.testing.assert_allclose(weighted_events, exp_weighted_events, rtol=1e-5, atol=1e-5)
+
+@pytest.mark.parametrize("n_articles", [0, 1, 7, 250])
+def test_loop_kernel_matches_numpy_kernel(n_articles):
+    inputs = _kernel_inputs(n_articles)
+    _assert_same_aggregates(_aggregate_kernel_loops(*inputs), _aggregate_kernel_numpy(*inputs))
+
+@pytest.mark.parametrize("n_articles", [0, 1, 7, 250])
+def test_numba_kernel_matches_numpy_kernel(n_articles):
+    numba = pytest.importorskip("numba")
+    kernel = numba.njit(fastmath=True)(_aggregate_kernel_loops)
+    inputs = _kernel_inputs(n_articles, seed=1)
+    _assert_same_aggregates(kernel(*inputs), _aggregate_kernel_numpy(*inputs))
+
+def test_positive_and_negative_heat_split_contributions():
+    sentiment = np.array([0.5, -0.25, 0.0], dtype=np.float32)
+    weights = np.array([2.0, 4.0, 1.0], dtype=np.float32)
+    event_matrix = np.zeros((3, 9), dtype=np.float32)
+    for kernel in (_aggregate_kernel_numpy, _aggregate_kernel_loops):
+        heat, positive, negative, _ = kernel(sentiment, weights, event_matrix)
+        assert (heat, positive, negative) == pytest.approx((0.0, 1.0, 1.0))
+
+def test_event_matrix_ignores_key_order_and_unknown_events():
+    aggregator = NarrativeAggregator()
+    matrix = aggregator._build_event_matrix([
+        {"hack": 0.75, "listing": 0.25},
+        {"listing": 0.25, "hack": 0.75, "not-an-event": 1.0},
+        None,
+    ])
+    hack = aggregator.event_types.index("hack")
+    listing = aggregator.event_types.index("listing")
+    np.testing.assert_array_equal(matrix[0], matrix[1])
+    assert (matrix[0, hack], matrix[0, listing]) == (0.75, 0.25)
+    assert not matrix[2].any()
+    # Both orderings share one cache entry
+    assert aggregator._event_vector.cache_info().currsize == 1
+
+def _features(heat: float) -> dict:
+    return {
+        'narrative_heat': heat,
+        'positive_heat': max(heat, 0.0),
+        'negative_heat': max(-heat, 0.0),
+        'consensus': 0.5,
+        'hype_velocity': 0.0,
+        'risk_polarity': 0.0,
+        'event_distribution': {"listing": 1.0},
+        'top_event': "listing",
+        'article_count': 3,
+        'avg_source_trust': 1.0,
+        'avg_novelty': 0.8,
+        'not_a_bucket_column': "ignored",
+    }
+
+def test_upsert_buckets_inserts_then_updates_in_place(db_session):
+    aggregator = NarrativeAggregator()
+    first_ts = datetime(2026, 1, 1, 12, 0)
+    second_ts = first_ts + timedelta(minutes=10)
+
+    inserted = aggregator._upsert_buckets(db_session, [
+        ("PEPE", first_ts, _features(1.5)),
+        ("PEPE", second_ts, _features(-0.5)),
+    ])
+    assert [b.bucket_ts for b in inserted] == [first_ts, second_ts]
+    assert all(b.id is not None and b.created_at is not None for b in inserted)
+
+    updated = aggregator._upsert_buckets(db_session, [("PEPE", first_ts, _features(2.5))])
+    assert updated[0].id == inserted[0].id
+    assert updated[0].created_at == inserted[0].created_at
+    assert updated[0].narrative_heat == 2.5
+
+    db_session.expire_all()
+    assert db_session.scalar(select(func.count()).select_from(Bucket)) == 2
+    stored = db_session.scalar(select(Bucket).where(Bucket.bucket_ts == first_ts))
+    assert stored.narrative_heat == 2.5
+    assert stored.event_distribution == {"listing": 1.0}
@@ -0,0 +1,48 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import UserBalance, UserDeposit, UserWallet
+from app.services.deposit_service import DepositService
+
+def _confirmed_deposit(user_wallet_id: int, amount: str, tx_hash: str) -> UserDeposit:
+    return UserDeposit(
+        user_wallet_id=user_wallet_id,
+        managed_wallet_id=1,
+        chain_id=43114,
+        token_symbol="AVAX",
+        amount=Decimal(amount),
+        transaction_hash=tx_hash,
+        from_address="0xuser",
+        to_address="0xmanaged",
+        status="confirmed"
+    )
+
+@pytest.mark.asyncio
+async def test_update_user_balance_concurrent_deposits(async_session_factory):
+    async with async_session_factory() as db:
+        wallet = UserWallet(user_wallet_address="0xuser")
+        db.add(wallet)
+        await db.commit()
+        wallet_id = wallet.id
+
+    service = DepositService()
+    amounts = ["0.1", "0.2", "0.000000000000000001", "1.5", "3", "0.3", "2.25", "0.05"]
+
+    async def _credit(index: int, amount: str):
+        # Separate sessions, as concurrent confirmations would use
+        async with async_session_factory() as db:
+            await service._update_user_balance(db, _confirmed_deposit(wallet_id, amount, f"0xtx{index}"))
+
+    await asyncio.gather(*(_credit(i, amount) for i, amount in enumerate(amounts)))
+    await service.aclose()
+
+    expected = sum((Decimal(amount) for amount in amounts), Decimal("0"))
+    async with async_session_factory() as db:
+        assert await db.scalar(select(func.count()).select_from(UserBalance)) == 1
+        balance = await db.scalar(select(UserBalance))
+        assert balance.total_deposited == expected
+        assert balance.available_balance == expected
+        assert balance.total_withdrawn == Decimal("0")
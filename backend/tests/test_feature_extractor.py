@@ -0,0 +1,61 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from app.services.feature_extractor import FeatureExtractor, _numeric_features_kernel
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    return FeatureExtractor()
+
+def _all_keywords():
+    return {kw for rules in FeatureExtractor.CLASSIFICATION_RULES.values() for kw in rules} | {
+        kw for _, rules in FeatureExtractor.DEFAULT_RULES for kw in rules
+    }
+
+@pytest.mark.parametrize("text", [
+    "",
+    "nothing relevant here",
+    "hack! the exploit drained the pool after a second hack; partnership talks paused",
+    "sec regulation news: the exchange listing adds a new trading pair on the exchange",
+    "technical analysis of the price chart: market analysis, then the upgrade launch",
+])
+def test_scan_keywords_matches_substring_counts(extractor, text):
+    expected = {kw: text.count(kw) for kw in _all_keywords() if kw in text}
+    assert dict(extractor._scan_keywords(text)) == expected
+
+def test_rule_scores_count_shared_keywords_for_each_event(extractor):
+    scores = extractor._rule_scores("Weekly analysis", "")
+    assert scores["market-note"] == 1
+    assert scores["op-ed"] == 1
+    assert sum(scores.values()) == 2
+
+def test_numeric_kernel_matches_scalar_formula():
+    tau = 12.0 * 3600
+    age = np.array([0.0, 3600.0, 6 * 3600.0, 10 * 86400.0, 1800.0])
+    override = np.array([-1.0, -1.0, 0.5, -1.0, 0.1])
+    trusts = np.array([1.2, 0.6, 1.0, 1.1, 0.8])
+    novelty = np.array([1.0, 0.5, 0.9, 1.0, 0.1])
+    proof = np.array([1.0, 1.2, 1.0, 1.2, 1.0])
+
+    decay, final = _numeric_features_kernel(age, override, trusts, novelty, proof, tau)
+
+    for i in range(len(age)):
+        expected_decay = override[i] if override[i] >= 0 else min(max(math.exp(-age[i] / tau), 0.01), 1.0)
+        assert decay[i] == pytest.approx(expected_decay)
+        assert final[i] == pytest.approx(trusts[i] * expected_decay * novelty[i] * proof[i])
+
+def test_numeric_batch_defaults_to_computed_decay(extractor):
+    now = time.time()
+    decay, final = extractor.extract_numeric_features_batch(
+        np.array([now, now - 12 * 3600]),
+        np.array([1.0, 1.0]),
+        np.array([1.0, 0.5]),
+        np.array([1.0, 1.0]),
+    )
+    assert decay[0] == pytest.approx(1.0, abs=1e-3)
+    assert decay[1] == pytest.approx(math.exp(-1), abs=1e-3)
+    assert final[1] == pytest.approx(0.5 * math.exp(-1), abs=1e-3)
@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, text
+
+from app.models import UserBalance, UserDeposit
+
+@pytest.mark.parametrize("value, expected", [
+    (Decimal("123456789012345678901234567890.123456789012345678"),
+     Decimal("123456789012345678901234567890.123456789012345678")),
+    (Decimal("1E-18"), Decimal("0.000000000000000001")),
+    ("0.1", Decimal("0.1")),
+    (0.1, Decimal("0.1")),
+    (7, Decimal("7")),
+])
+def test_decimal_string_round_trip(db_session, value, expected):
+    db_session.add(UserDeposit(
+        user_wallet_id=1,
+        managed_wallet_id=1,
+        chain_id=43114,
+        token_symbol="AVAX",
+        amount=value,
+        transaction_hash="0xtx",
+        from_address="0xuser",
+        to_address="0xmanaged"
+    ))
+    db_session.commit()
+    db_session.expire_all()
+
+    amount = db_session.scalar(select(UserDeposit.amount))
+    assert isinstance(amount, Decimal)
+    assert amount == expected
+
+    # Stored as plain decimal text, never in exponent notation
+    stored = db_session.execute(text("SELECT amount FROM user_deposits")).scalar()
+    assert stored == format(expected, "f")
+
+def test_decimal_string_keeps_none_and_defaults(db_session):
+    balance = UserBalance(user_wallet_id=1, chain_id=43114, token_symbol="AVAX")
+    db_session.add(balance)
+    db_session.commit()
+    balance.locked_balance = None
+    db_session.commit()
+    db_session.expire_all()
+
+    balance = db_session.scalar(select(UserBalance))
+    assert balance.available_balance == Decimal("0")
+    assert balance.locked_balance is None
@@ -26,7 +26,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # Migration version tracking
-CURRENT_MIGRATION_VERSION = "1.2.0"
+CURRENT_MIGRATION_VERSION = "1.4.0"
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 MIGRATIONS_DIR.mkdir(exist_ok=True)
 
@@ -133,6 +133,121 @@ def get_table_columns(engine, table_name):
         return [col['name'] for col in inspector.get_columns(table_name)]
     return []
 
+# Token amount columns stored as exact decimal strings (see models.DecimalString)
+AMOUNT_COLUMNS = {
+    'user_deposits': ['amount'],
+    'user_balances': ['total_deposited', 'total_withdrawn', 'available_balance', 'locked_balance'],
+}
+
+def rebuild_numeric_amount_columns() -> List[str]:
+    """Convert amount columns created as NUMERIC back to text
+    
+    SQLite stores NUMERIC as a float, so amounts in such columns drift
+    (0.1 + 0.2 -> 0.300000000000000044). Tables are rebuilt from the current
+    model, copying amounts through CAST(... AS TEXT).
+    """
+    steps = []
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+    
+    for table_name, amount_columns in AMOUNT_COLUMNS.items():
+        if table_name not in existing_tables:
+            continue
+        column_types = {col['name']: str(col['type']).upper() for col in inspector.get_columns(table_name)}
+        numeric_columns = [c for c in amount_columns if column_types.get(c, '').startswith(('NUMERIC', 'DECIMAL'))]
+        if not numeric_columns:
+            continue
+        
+        logger.info(f"Converting {table_name} amount columns to exact text storage: {numeric_columns}")
+        with engine.begin() as conn:
+            if engine.dialect.name == 'postgresql':
+                for column in numeric_columns:
+                    conn.execute(text(
+                        f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE VARCHAR(78) USING {column}::text"
+                    ))
+            else:
+                rebuild_sqlite_table(conn, table_name, list(column_types), {
+                    column: f"CAST({column} AS TEXT)" for column in numeric_columns
+                })
+        steps.append(f"Converted {table_name} amount columns to text")
+    
+    return steps
+
+def rebuild_sqlite_table(conn, table_name: str, existing_columns: List[str], select_exprs: Dict[str, str]):
+    """Recreate a SQLite table from the current model and copy its rows across
+    
+    SQLite cannot alter a column's type or default in place. select_exprs maps
+    column names to the SQL used to copy them (plain column name otherwise).
+    """
+    old_table = f"{table_name}_rebuild_old"
+    conn.execute(text(f"ALTER TABLE {table_name} RENAME TO {old_table}"))
+    # Indexes keep their names across the rename; drop them so the new table can reuse them
+    index_names = conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t AND sql IS NOT NULL"
+    ), {"t": old_table}).scalars().all()
+    for index_name in index_names:
+        conn.execute(text(f'DROP INDEX "{index_name}"'))
+    Base.metadata.tables[table_name].create(conn)
+    
+    columns = [c for c in existing_columns if c in Base.metadata.tables[table_name].columns]
+    select_list = ", ".join(select_exprs.get(c, c) for c in columns)
+    # Driver-level execution: JSON defaults contain ':' that text() would read as binds
+    conn.exec_driver_sql(
+        f"INSERT INTO {table_name} ({', '.join(columns)}) SELECT {select_list} FROM {old_table}"
+    )
+    conn.execute(text(f"DROP TABLE {old_table}"))
+
+def _server_default_sql(column) -> str:
+    """DDL text of a model column's server default"""
+    default = column.server_default.arg
+    if isinstance(default, str):
+        return "'" + default.replace("'", "''") + "'"
+    return str(default.compile(dialect=engine.dialect))
+
+def apply_server_defaults() -> List[str]:
+    """Add the model's server defaults (timestamps, JSON preferences) to existing tables
+    
+    create_all leaves existing tables alone, and inserts no longer send these
+    values, so without the DDL default the columns would be NULL. Rows already
+    missing a value are backfilled with the default.
+    """
+    steps = []
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+    
+    for table_name, table in Base.metadata.tables.items():
+        if table_name not in existing_tables:
+            continue
+        existing = {col['name']: col for col in inspector.get_columns(table_name)}
+        missing = [
+            column for column in table.columns
+            if column.server_default is not None
+            and column.name in existing
+            and existing[column.name].get('default') is None
+        ]
+        if not missing:
+            continue
+        
+        logger.info(f"Adding server defaults to {table_name}: {[c.name for c in missing]}")
+        with engine.begin() as conn:
+            if engine.dialect.name == 'postgresql':
+                for column in missing:
+                    default_sql = _server_default_sql(column)
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table_name} ALTER COLUMN {column.name} SET DEFAULT {default_sql}"
+                    )
+                    conn.exec_driver_sql(
+                        f"UPDATE {table_name} SET {column.name} = {default_sql} WHERE {column.name} IS NULL"
+                    )
+            else:
+                rebuild_sqlite_table(conn, table_name, list(existing), {
+                    column.name: f"COALESCE({column.name}, {_server_default_sql(column)})"
+                    for column in missing
+                })
+        steps.append(f"Added server defaults to {table_name}")
+    
+    return steps
+
 def migrate_database():
     """Migrate database to latest schema with full versioning support"""
     try:
@@ -190,27 +305,38 @@ def migrate_database():
             Base.metadata.create_all(bind=engine)
             migration_steps.append("Created/updated all tables")
             
-            # Migration Step 3: Add indexes for performance
-            with engine.connect() as conn:
+            # Migration Step 2b: Exact text storage for token amounts
+            migration_steps.extend(rebuild_numeric_amount_columns())
+            
+            # Migration Step 2c: Database-side defaults for timestamps and JSON preferences
+            migration_steps.extend(apply_server_defaults())
+            
+            # Migration Step 3: Add indexes for performance and upsert targets
+            # (each on its own, so one failing index does not skip the rest)
+            indexes = [
+                "CREATE INDEX IF NOT EXISTS idx_articles_token_created ON articles(token, created_at)",
+                "CREATE INDEX IF NOT EXISTS ix_article_token_bucket ON articles(token, bucket_ts)",
+                "CREATE INDEX IF NOT EXISTS idx_buckets_token_ts ON buckets(token, bucket_ts)",
+                "CREATE INDEX IF NOT EXISTS ix_bucket_token_ts_nh ON buckets(token, bucket_ts DESC, narrative_heat)",
+                "CREATE INDEX IF NOT EXISTS idx_labels_token_ts ON labels(token, bucket_ts)",
+                "CREATE INDEX IF NOT EXISTS idx_models_token_created ON models(token, created_at)",
+                "CREATE INDEX IF NOT EXISTS ix_deposit_status_chain ON user_deposits(status, chain_id)",
+                "CREATE INDEX IF NOT EXISTS ix_managed_wallet_chain_active ON managed_wallets(chain_id, is_active)",
+                "CREATE UNIQUE INDEX IF NOT EXISTS unique_user_token_balance_idx ON user_balances(user_wallet_id, chain_id, token_symbol)"
+            ]
+            
+            created = 0
+            for index_sql in indexes:
                 try:
-                    # Create indexes if they don't exist
-                    indexes = [
-                        "CREATE INDEX IF NOT EXISTS idx_articles_token_created ON articles(token, created_at)",
-                        "CREATE INDEX IF NOT EXISTS idx_buckets_token_ts ON buckets(token, bucket_ts)",
-                        "CREATE INDEX IF NOT EXISTS idx_labels_token_ts ON labels(token, bucket_ts)",
-                        "CREATE INDEX IF NOT EXISTS idx_models_token_created ON models(token, created_at)"
-                    ]
-                    
-                    for index_sql in indexes:
+                    with engine.begin() as conn:
                         conn.execute(text(index_sql))
-                    
-                    conn.commit()
-                    migration_steps.append("Created performance indexes")
-                    logger.info("Performance indexes created")
-                    
+                    created += 1
                 except Exception as e:
                     logger.warning(f"Index creation failed (may already exist): {e}")
             
+            migration_steps.append(f"Created performance indexes ({created}/{len(indexes)})")
+            logger.info("Performance indexes created")
+            
             # Validate final schema
             if not validate_schema_integrity():
                 raise Exception("Schema integrity validation failed")